@@ -1,10 +1,25 @@
-"""LZW and Huffman compression algorithms.
+"""LZW, Huffman, rANS, LZSS and Burrows-Wheeler compression algorithms, run-length encoding and pipelines of them.
 
-This module contains the classes of LZW and Huffman compression and the helper classes BinaryTree and Node.
+This module contains the classes of LZW, Huffman, rANS, LZSS and Burrows-Wheeler compression, run-length encoding,
+storage without compression, the class of pipelines chaining them, the selection of an algorithm from samples of
+the data and the helper classes LZWEncoder, LZWDecoder, HuffmanEncoder, HuffmanDecoder, AdaptiveHuffmanTree,
+AdaptiveHuffmanEncoder, AdaptiveHuffmanDecoder, BinaryTree and Node.
 """
 
 import heapq
+import math
+import os
+import re
 from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# NumPy is optional. It makes the counting of the bytes faster.
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class CompressionABC(ABC):
@@ -28,27 +43,101 @@ class CompressionABC(ABC):
 class LZWCompression(CompressionABC):
     """LZW compression algorithm.
 
-    This class performs encoding and decoding using LZW algorithm. It is a simplified version without dynamic
-    adaptation of the codebook and without its restarting.
+    This class performs encoding and decoding using LZW algorithm. Once the codebook is full it stays unchanged,
+    unless the codebook reset is activated. Then the encoder checks the compression ratio in regular intervals
+    and starts with a new codebook when the ratio drops, announcing it to the decoder with a clear code.
     Input and output for the encoding and decoding are bytes.
 
+    The codes are stored in one of two layouts. The fixed width layout stores every code in the number of whole
+    bytes needed for the largest code. The variable width layout packs the codes bit by bit, starting with 9 bits
+    and growing by one bit each time the codebook outgrows the current width. Only the variable width layout
+    supports the codebook reset and a maximum code width other than 12 bits. It stores the maximum code width
+    in its header. The fixed width layout stores the bit size of the codes in its header and relies on the maximum
+    code width of the decoding instance. Data of the fixed width layout without header, as stored by older versions
+    together with a separate bit size, is decoded when the bit size is passed to self.decode().
+
+    The settings are fixed at the creation of the instance and every call keeps its state in its own encoder or
+    decoder, so one instance can serve several threads at once.
+
+    With unix_compress the variable width layout follows the .Z format of the Unix tool compress(1), so the
+    output can be decompressed with uncompress, zcat or gzip -d. It starts with the magic bytes of the format and
+    fills the current group of eight codes with zero bits each time the code width changes or the codebook is reset.
+    The decoder recognizes .Z data by the magic bytes.
+
+    The work is done by the classes LZWEncoder and LZWDecoder. For data which doesn't fit in memory at once
+    they are available from self.create_encoder() and self.create_decoder() and accept the data in chunks.
+
     Attributes:
         INITIAL_CODEBOOK_SIZE (int): The initial codebook covers all 8-bit possibilities.
-        MAXIMUM_CODEBOOK_SIZE (int): The codebook grows until it exhausts all 12-bit possibilities.
-        codebook_size (None/int): Tracks the current codebook size.
-        codebook (None/dict): Contains the codebook used by the algorithm.
-        bit_size (None/int): Contains the maximum needed bits amount for bit-packing of the code array.
+        MAXIMUM_CODEBOOK_SIZE (int): By default the codebook grows until it exhausts all 12-bit possibilities.
+        INITIAL_CODE_WIDTH (int): Bits per code at the start of the variable width layout.
+        LARGEST_CODE_WIDTH (int): Upper limit for the maximum code width. It keeps the codebook size bounded.
+        CLEAR_CODE (int): Code reserved for the codebook reset. The first new entry gets the next code.
+        RESET_FLAG (int): Marks a codebook reset in the header of the variable width layout. It has the same value as
+            the block mode flag of the .Z format.
+        FIXED_WIDTH_FLAG (int): Marks the header of the fixed width layout. The rest of the header is the bit size.
+        FIXED_WIDTH_CODE_WIDTH (int): Maximum code width of the fixed width layout.
+        UNIX_COMPRESS_MAGIC (bytes): The first two bytes of the .Z format.
+        UNIX_COMPRESS_SMALLEST_CODE_WIDTH (int): Lower limit for the maximum code width of the .Z format.
+            The decoders of compress(1) and gzip don't stop at a maximum code width of 9 bits.
+        UNIX_COMPRESS_LARGEST_CODE_WIDTH (int): Upper limit for the maximum code width of the .Z format.
+        RESET_CHECK_INTERVAL (int): Amount of input bytes between two checks of the compression ratio.
+        variable_width (bool): Selects the variable width layout for the encoding.
+        reset_codebook (bool): Allows the encoder to reset a full codebook.
+        maximum_code_width (int): The codebook grows until it exhausts all possibilities of this width.
+        unix_compress (bool): Selects the .Z format for the variable width layout.
     """
 
     INITIAL_CODEBOOK_SIZE = 256
     MAXIMUM_CODEBOOK_SIZE = 4096
+    INITIAL_CODE_WIDTH = 9
+    LARGEST_CODE_WIDTH = 20
+    CLEAR_CODE = 256
+    RESET_FLAG = 0x80
+    FIXED_WIDTH_FLAG = 0x40
+    FIXED_WIDTH_CODE_WIDTH = 12
+    RESET_CHECK_INTERVAL = 10000
+    UNIX_COMPRESS_MAGIC = b'\x1f\x9d'
+    UNIX_COMPRESS_SMALLEST_CODE_WIDTH = 10
+    UNIX_COMPRESS_LARGEST_CODE_WIDTH = 16
+
+    def __init__(self, variable_width=False, reset_codebook=False, maximum_code_width=12, unix_compress=False):
+        """Initiates an instance of the LZW algorithm.
 
-    def __init__(self):
-        """Initiates an instance of the LZW algorithm."""
+        Args:
+            variable_width (bool): If True, the codes are bit-packed with growing width.
+                Otherwise, every code takes the same number of whole bytes.
+            reset_codebook (bool): If True, a full codebook is reset when the compression ratio drops.
+            maximum_code_width (int): Bits of the largest code, from INITIAL_CODE_WIDTH to LARGEST_CODE_WIDTH.
+                Larger codebooks find longer sequences in repetitive data.
+            unix_compress (bool): If True, the variable width layout is written in the .Z format.
+
+        Raises:
+            ValueError: If the codebook reset, the .Z format or a maximum code width other than 12 bits is requested
+                for the fixed width layout or the maximum code width is out of range.
+        """
 
-        self.codebook_size = None
-        self.codebook = None
-        self.bit_size = None
+        if reset_codebook and not variable_width:
+            raise ValueError('The codebook reset requires the variable width layout.')
+
+        # The header of the fixed width layout has no room for the maximum code width.
+        if maximum_code_width != self.FIXED_WIDTH_CODE_WIDTH and not variable_width:
+            raise ValueError('A maximum code width other than 12 bits requires the variable width layout.')
+
+        if unix_compress and not variable_width:
+            raise ValueError('The .Z format requires the variable width layout.')
+
+        if unix_compress and not self.UNIX_COMPRESS_SMALLEST_CODE_WIDTH <= maximum_code_width <= \
+                self.UNIX_COMPRESS_LARGEST_CODE_WIDTH:
+            raise ValueError(f'Unsupported maximum code width for the .Z format: {maximum_code_width}')
+
+        if not self.INITIAL_CODE_WIDTH <= maximum_code_width <= self.LARGEST_CODE_WIDTH:
+            raise ValueError(f'Unsupported maximum code width: {maximum_code_width}')
+
+        self.variable_width = variable_width
+        self.reset_codebook = reset_codebook
+        self.maximum_code_width = maximum_code_width
+        self.unix_compress = unix_compress
 
     def encode(self, uncompressed_data: bytes):
         """Will compress bytes input to bytes output.
@@ -63,74 +152,44 @@ class LZWCompression(CompressionABC):
             compressed_code (bytes): Compressed data.
         """
 
-        # Builds the initial codebook.
-        self.create_codebook()
+        encoder = self.create_encoder()
+
+        # In the variable width layout the whole data is a stream of one chunk.
+        # The code width follows the growth of the codebook instead of a fixed bit size.
+        if self.variable_width:
+            return encoder.feed(uncompressed_data) + encoder.flush()
 
         # A list of integers(codes) is created. The integers are references to content in the codebook.
-        code_array = self.create_code(uncompressed_data=uncompressed_data)
+        code_array = encoder.create_code(uncompressed_data=uncompressed_data) + encoder.create_last_code()
 
-        # Bit-packing on the code array reduces its size.
-        self.calculate_max_bit_size(code_array=code_array)
-        compressed_code = self.compress_code(code_array=code_array, bit_size=self.bit_size)
+        # Bit-packing on the code array reduces its size. The bit size is stored in the header for the decoding.
+        bit_size = self.calculate_max_bit_size(code_array=code_array)
+        compressed_code = bytes([self.FIXED_WIDTH_FLAG | bit_size]) + self.compress_code(code_array=code_array,
+                                                                                         bit_size=bit_size)
 
         return compressed_code
 
-    def create_codebook(self):
-        """Initiation of the base codebook.
-
-        A codebook with all 8-bit possibilities is created and saved in the instance attribute self.codebook.
-        The codebook is used and potentially extended in the method self.create_code().
-        """
-
-        self.codebook_size = self.INITIAL_CODEBOOK_SIZE
-        # k:v str:int
-        self.codebook = {chr(i): i for i in range(self.codebook_size)}
+    def create_encoder(self, unix_compress=None):
+        """Creates an encoder with the settings of the instance.
 
-    def create_code(self, uncompressed_data: bytes):
-        """Main encoding algorithm.
-
-        This method navigates through the initial data, develops further the initial codebook and
-        generates an array of codes referring to the codebook.
+        The encoder takes the data in chunks and writes the variable width layout.
 
         Args:
-            uncompressed_data (bytes): Data to encode. It will be compared with existing codebook entries.
+            unix_compress (None/bool): Selects the .Z format. None uses the setting of the instance.
 
         Returns:
-            code_array (list): Codes pointing to original uncompressed data in the codebook.
+            encoder (LZWEncoder): Incremental encoder.
         """
 
-        # Stores sequences of one or more symbols for entry in the codebook.
-        string = ""
-
-        # Encoded output in codepoints - integer array of codes.
-        code_array = []
-
-        # Start of LZW compression algorithm.
-        for symbol in uncompressed_data:                # Symbol is still a byte here.
-            string_and_symbol = string + chr(symbol)    # Here byte data turns into str.
-
-            if string_and_symbol in self.codebook:
-                string = string_and_symbol
-
-            else:
-                # Output the stored sequence to the codes array.
-                code_array.append(self.codebook[string])
-
-                # Adds string_and_symbol to the codebook.
-                if len(self.codebook) < self.MAXIMUM_CODEBOOK_SIZE:
-                    self.codebook[string_and_symbol] = self.codebook_size
-                    self.codebook_size += 1
-
-                # Stores sequences of one or more symbols for entry in the codebook.
-                string = chr(symbol)
+        if unix_compress is None:
+            unix_compress = self.unix_compress
 
-        # Output the code for string.
-        if string:
-            code_array.append(self.codebook[string])
-
-        return code_array
+        return LZWEncoder(maximum_code_width=self.maximum_code_width,
+                          reset_codebook=self.reset_codebook,
+                          unix_compress=unix_compress)
 
-    def calculate_max_bit_size(self, code_array: list):
+    @staticmethod
+    def calculate_max_bit_size(code_array: list):
         """Calculates the maximum bit size for the largest number in the code array.
 
         The bit size is used from self.compress_code() and self.decompress_code() for bit-packing and unpacking
@@ -138,8 +197,13 @@ class LZWCompression(CompressionABC):
 
         Args:
             code_array (list): Codes pointing to original uncompressed data in the codebook.
+
+        Returns:
+            bit_size (int): Maximum bit size for the largest number in the code array.
         """
-        self.bit_size = max(code_array).bit_length()
+        bit_size = max(code_array).bit_length()
+
+        return bit_size
 
     @staticmethod
     def compress_code(code_array: list, bit_size: int):
@@ -158,13 +222,14 @@ class LZWCompression(CompressionABC):
         compressed_code = bytearray()
 
         # Each integer from the code array is represented as array of bytes and added to a single variable.
+        # The codes are never negative, so they are stored unsigned and may use all bits of their bytes.
         for i in code_array:
-            i_bytes = int(i).to_bytes(byte_size, 'little', signed=True)
+            i_bytes = int(i).to_bytes(byte_size, 'little')
             compressed_code.extend(i_bytes)
 
         return bytes(compressed_code)
 
-    def decode(self, compressed_data: bytes):
+    def decode(self, compressed_data: bytes, bit_size=None):
         """Will decompress bytes input to bytes output.
 
         Decode and encode are the main methods of the compression algorithm. They make use of the other methods
@@ -172,22 +237,46 @@ class LZWCompression(CompressionABC):
 
         Args:
             compressed_data (bytes): The integer code array in bit-packed form.
+            bit_size (None/int): Bit size for data of the fixed width layout without header, as stored by older
+                versions. If None, the layout and its settings are read from the header.
 
         Returns:
             decompressed_data (bytes): Data identical to the original before compression.
         """
 
-        # Compressed data in form of bytes is turned into code array.
-        code_array = self.decompress_code(compressed_code=compressed_data, bit_size=self.bit_size)
+        if bit_size is None:
+
+            # The variable width layout carries its settings in the header.
+            if not compressed_data or not compressed_data[0] & self.FIXED_WIDTH_FLAG:
+                decoder = self.create_decoder()
+                return decoder.feed(compressed_data) + decoder.flush()
 
-        # Builds the initial codebook for decoding.
-        self.create_reversed_codebook()
+            bit_size = compressed_data[0] & ~self.FIXED_WIDTH_FLAG
+            compressed_data = compressed_data[1:]
+
+        # Compressed data in form of bytes is turned into code array.
+        code_array = self.decompress_code(compressed_code=compressed_data, bit_size=bit_size)
 
         # A list of integers(codes) is used to retrieve the original information from the codebook.
-        decompressed_data = self.recover_data(code_array=code_array)
+        # The fixed width layout always grows its codebook up to 12 bits, whatever the settings of this instance.
+        decoder = LZWDecoder(maximum_code_width=self.FIXED_WIDTH_CODE_WIDTH)
+        decompressed_data = decoder.recover_data(code_array=code_array)
 
         return decompressed_data
 
+    @staticmethod
+    def create_decoder():
+        """Creates a decoder for the variable width layout.
+
+        The decoder takes the compressed data in chunks and reads the settings from the header.
+        It decodes the .Z format as well.
+
+        Returns:
+            decoder (LZWDecoder): Incremental decoder.
+        """
+
+        return LZWDecoder()
+
     @staticmethod
     def decompress_code(compressed_code: bytes, bit_size: int):
         """Uses bit-unpacking to recreate the original code array from bytes.
@@ -207,483 +296,4117 @@ class LZWCompression(CompressionABC):
         # An integer is created from bytes and added to a recreated code array.
         for i in range(0, len(compressed_code), byte_size):
             i_bytes = compressed_code[i:i + byte_size]
-            code_array.append(int.from_bytes(i_bytes, 'little', signed=True))
+            code_array.append(int.from_bytes(i_bytes, 'little'))
 
         return code_array
 
-    def create_reversed_codebook(self):
-        """Initiation of the base codebook for decompression.
 
-        A codebook with all 8-bit possibilities is created and saved in the instance attribute self.codebook.
-        The codebook is used and potentially extended in the method self.recover_data().
-        """
+class LZWEncoder(object):
+    """Incremental LZW encoder for the variable width layout.
 
-        self.codebook_size = self.INITIAL_CODEBOOK_SIZE
-        # k:v int:str
-        self.codebook = {i: chr(i) for i in range(self.codebook_size)}
+    The data is passed in chunks of any size to self.feed(), which returns the compressed data completed so far.
+    self.flush() ends the stream. The memory in use depends on the codebook size, not on the size of the data.
+    The same data results in the same output no matter how it is split in chunks.
 
-    def recover_data(self, code_array: list):
-        """Main decoding algorithm.
+    Attributes:
+        maximum_code_width (int): The codebook grows until it exhausts all possibilities of this width.
+        maximum_codebook_size (int): Amount of codes for the maximum code width.
+        reset_codebook (bool): Allows the encoder to reset a full codebook.
+        unix_compress (bool): Writes the .Z format.
+        first_code (int): Code of the first entry after the 8-bit possibilities and the clear code.
+        codebook (dict): Codes for integers combining the code of a prefix and the next byte.
+        codebook_size (int): Tracks the current codebook size.
+        prefix_code (None/int): Code of the longest sequence found so far, not yet written. None at the start.
+        data_position (int): Amount of bytes passed to the encoder.
+        next_check (None/int): Data position of the next check of the compression ratio.
+        best_ratio (float): Compression ratio at the last check.
+        reset_position (int): Data position of the last codebook reset.
+        code_count (int): Amount of codes since the last codebook reset.
+        growing_bits (None/int): Bits written for the codes until the codebook is full.
+        header_written (bool): Tracks if the header is already in the output.
+        bit_buffer (int): Bits not yet written as whole bytes.
+        buffered_bits (int): Amount of bits in the bit buffer.
+        packed_codebook_size (int): Size of the codebook at the code which is packed next.
+        code_width (int): Width of the code which is packed next.
+        group_codes (int): Amount of codes packed with the current width since the last filled group of the .Z format.
+    """
 
-        Obtains the data identical to the original before compression using the codebook.
-        This method navigates through the encoded data, develops further the initial decompression codebook and
-        generates the original data from it.
+    def __init__(self, maximum_code_width=12, reset_codebook=False, unix_compress=False):
+        """Initiates an instance of the encoder.
 
         Args:
-            code_array (list): Codes pointing to original uncompressed data in the codebook.
+            maximum_code_width (int): Bits of the largest code.
+            reset_codebook (bool): If True, a full codebook is reset when the compression ratio drops.
+            unix_compress (bool): If True, the output is written in the .Z format.
 
-        Returns:
-            decompressed_data (bytes): Data identical to the original before compression.
+        Raises:
+            ValueError: If the maximum code width is out of range for the .Z format.
         """
 
-        # Start of LZW decoding algorithm.
-        w = result = chr(code_array.pop(0))
-
-        for code in code_array:
+        if unix_compress and not LZWCompression.UNIX_COMPRESS_SMALLEST_CODE_WIDTH <= maximum_code_width <= \
+                LZWCompression.UNIX_COMPRESS_LARGEST_CODE_WIDTH:
+            raise ValueError(f'Unsupported maximum code width for the .Z format: {maximum_code_width}')
 
-            if code in self.codebook:
-                # entry becomes the stored str in this int-code
-                entry = self.codebook[code]
-            elif code == self.codebook_size:
-                entry = w + w[0]
-            else:
-                raise ValueError(f'Poorly compressed code: {code}')
+        self.maximum_code_width = maximum_code_width
+        self.maximum_codebook_size = 1 << maximum_code_width
+        self.reset_codebook = reset_codebook
+        self.unix_compress = unix_compress
 
-            result += entry
+        # With the codebook reset the clear code is reserved and the first new entry gets the code after it.
+        initial_codebook_size = LZWCompression.INITIAL_CODEBOOK_SIZE
+        self.first_code = initial_codebook_size + 1 if reset_codebook else initial_codebook_size
 
-            if self.codebook_size < self.MAXIMUM_CODEBOOK_SIZE:
+        self.codebook = None
+        self.codebook_size = None
+        self.create_codebook()
 
-                # Add w+entry[0] to the codebook.
-                self.codebook[self.codebook_size] = w + entry[0]
-                self.codebook_size += 1
+        self.prefix_code = None
+        self.data_position = 0
+        self.next_check = None
+        self.best_ratio = 0
+        self.reset_position = 0
+        self.code_count = 0
+        self.growing_bits = None
 
-            w = entry
+        self.header_written = False
+        self.bit_buffer = 0
+        self.buffered_bits = 0
+        self.packed_codebook_size = self.first_code
+        self.code_width = LZWCompression.INITIAL_CODE_WIDTH
+        self.group_codes = 0
 
-        # Turns string into bytes before return.
-        decompressed_data = bytes(result, 'utf-8')
+    def feed(self, uncompressed_data: bytes):
+        """Encodes the next chunk of the data.
 
-        return decompressed_data
+        Args:
+            uncompressed_data (bytes): Chunk of the data to be compressed.
 
+        Returns:
+            compressed_code (bytes): Compressed data completed with this chunk. It may be empty.
+        """
 
-class HuffmanCompression(CompressionABC):
-    """Huffman compression algorithms.
+        code_array = self.create_code(uncompressed_data=uncompressed_data)
 
-    This class performs encoding and decoding using Huffman algorithm.
-    Input and output for the encoding and decoding are bytes.
-    This class relies on codebook generated from the BinaryTree class.
+        return self.compress_code(code_array=code_array)
 
-    Attributes:
-        codebook (dict): Contains the codebook used by the algorithm.
-    """
+    def flush(self):
+        """Ends the stream.
 
-    def __init__(self):
-        """Initiates an instance of the Huffman algorithm."""
+        Returns:
+            compressed_code (bytes): The rest of the compressed data.
+        """
 
-        # k:v data(int):code(str)
-        self.codebook = None
+        compressed_code = self.compress_code(code_array=self.create_last_code())
 
-    def set_codebook(self, uncompressed_data: bytes):
-        # FIXME: Better name it to create_codebook() or generate_codebook() and change the
-        # algorithm to create the codebook in one pass.
+        # The remaining bits are padded with zeros to a whole byte.
+        compressed_code += self.bit_buffer.to_bytes((self.buffered_bits + 7) // 8, 'little')
+        self.bit_buffer = 0
+        self.buffered_bits = 0
 
-        """Calls the codebook creation.
+        return compressed_code
 
-        The algorithm relies on an initial pass through the uncompressed data to generate an optimal codebook.
+    def create_codebook(self):
+        """Initiation of the base codebook.
 
-        Args:
-            uncompressed_data (bytes): Data to be compressed.
+        The codebook covers all 8-bit possibilities and is saved in the instance attribute self.codebook.
+        The codebook is used and potentially extended in the method self.create_code().
         """
 
-        binary_tree = BinaryTree()
-        self.codebook = binary_tree.create_codebook(uncompressed_data=uncompressed_data)
+        self.codebook_size = self.first_code
 
-    def encode(self, uncompressed_data: bytes, codebook=None):
-        """Will compress bytes input to bytes output.
+        # k:v (prefix_code << 8 | next_byte):code
+        # The single bytes are their own codes and need no entry, so the codebook holds only the extensions.
+        self.codebook = {}
 
-        Encode and decode are the main methods of the compression algorithm. They make use of the other methods
-        in the class to perform their function step by step.
+    def create_code(self, uncompressed_data: bytes):
+        """Main encoding algorithm.
+
+        This method navigates through the next chunk of data, develops further the codebook and
+        generates an array of codes referring to the codebook. The longest sequence found at the end of the chunk
+        stays in self.prefix_code, as the next chunk may continue it.
+        With the codebook reset, the compression ratio since the last reset is checked in regular intervals
+        once the codebook is full. If it dropped since the previous check, the current sequence and the clear code
+        are written and the encoding continues with the initial codebook.
 
         Args:
-            uncompressed_data (bytes): Data to be compressed.
-            codebook (None/dict): An option to add custom codebook instead of generating one automatically.
+            uncompressed_data (bytes): Data to encode. It will be compared with existing codebook entries.
 
         Returns:
-            encoded_data (bytes): Compressed data.
+            code_array (list): Codes pointing to original uncompressed data in the codebook.
         """
 
-        # If no specific codebook is passed, standard codebook will be created.
-        if codebook:
-            self.codebook = codebook
-        else:
-            self.set_codebook(uncompressed_data=uncompressed_data)
+        # Encoded output in codepoints - integer array of codes.
+        code_array = []
 
-        # Replaces data entries with code from the codebook.
-        converted_data = self.convert_to_code(uncompressed_data=uncompressed_data)
+        data_view = memoryview(uncompressed_data)
+        data_size = len(data_view)
+        position = 0
+
+        if not data_size:
+            return code_array
+
+        # The first byte of the stream starts the first sequence.
+        if self.prefix_code is None:
+            self.prefix_code = data_view[0]
+            position = 1
+            self.data_position = 1
+            if self.reset_codebook:
+                self.next_check = 1 + LZWCompression.RESET_CHECK_INTERVAL
+
+        # Local names avoid attribute lookups in the loop below.
+        codebook = self.codebook
+        codebook_size = self.codebook_size
+        maximum_codebook_size = self.maximum_codebook_size
+        prefix_code = self.prefix_code
+
+        # Codes already included in self.code_count.
+        counted_codes = 0
+
+        while position < data_size:
+
+            # The ratio is checked only if there is data left for a new codebook.
+            if self.data_position == self.next_check:
+                self.next_check += LZWCompression.RESET_CHECK_INTERVAL
+                self.code_count += len(code_array) - counted_codes
+                counted_codes = len(code_array)
+
+                if codebook_size == maximum_codebook_size and self.is_ratio_dropping():
+
+                    # Output the stored sequence and the clear code, then start again with the initial codebook.
+                    code_array.append(prefix_code)
+                    code_array.append(LZWCompression.CLEAR_CODE)
+                    codebook.clear()
+                    codebook_size = self.first_code
+                    self.best_ratio = 0
+                    self.code_count = 0
+                    counted_codes = len(code_array)
+
+                    prefix_code = data_view[position]
+                    position += 1
+                    self.data_position += 1
+                    self.reset_position = self.data_position - 1
+                    self.next_check = self.data_position + LZWCompression.RESET_CHECK_INTERVAL
+                    continue
+
+            # The chunk is encoded up to its end or up to the next check.
+            end = data_size if self.next_check is None else min(data_size,
+                                                                 position + self.next_check - self.data_position)
+
+            # Start of LZW compression algorithm.
+            # A sequence is identified by the code of its prefix and its last byte, so every lookup uses a small
+            # integer key instead of a string which grows with the length of the match.
+            for symbol in data_view[position:end]:
+                key = prefix_code << 8 | symbol
+                code = codebook.get(key)
+
+                if code is not None:
+                    prefix_code = code
+
+                else:
+                    # Output the stored sequence to the codes array.
+                    code_array.append(prefix_code)
+
+                    # Adds the sequence and the symbol to the codebook.
+                    if codebook_size < maximum_codebook_size:
+                        codebook[key] = codebook_size
+                        codebook_size += 1
+
+                    # The symbol starts the next sequence.
+                    prefix_code = symbol
+
+            self.data_position += end - position
+            position = end
+
+        self.codebook_size = codebook_size
+        self.prefix_code = prefix_code
+        self.code_count += len(code_array) - counted_codes
 
-        # Adds bits to the encoded data to keep it in 8-bit byte format.
-        padded_converted_data = self.pad_converted_data(converted_data=converted_data)
+        return code_array
 
-        # Data is converted from string to bytes.
-        encoded_data = self.encode_to_bytes(padded_converted_data=padded_converted_data)
+    def is_ratio_dropping(self):
+        """Compares the compression ratio since the last reset with the ratio at the previous check.
 
-        return encoded_data
+        All codes after the growth of the codebook have full width, so the bits written since the last reset
+        follow from the amount of codes.
 
-    def decode(self, compressed_data: bytes, codebook=None):
-        """Will decompress bytes input to bytes output.
+        Returns:
+            is_dropping (bool): True if the ratio didn't improve since the previous check.
+        """
 
-        Decide and encode are the main methods of the compression algorithm. They make use of the other methods
-        in the class to perform their function step by step.
+        if self.growing_bits is None:
+            self.growing_bits = sum(max(LZWCompression.INITIAL_CODE_WIDTH, (size - 1).bit_length())
+                                    for size in range(self.first_code, self.maximum_codebook_size))
 
-        Args:
-            compressed_data (bytes): Data to be decoded.
-            codebook (None/dict): An option to add custom codebook instead of using the saved one.
+        full_width_codes = self.code_count - (self.maximum_codebook_size - self.first_code)
+        code_bits = self.growing_bits + full_width_codes * self.maximum_code_width
+        ratio = (self.data_position - self.reset_position) * 8 / code_bits
+
+        if ratio > self.best_ratio:
+            self.best_ratio = ratio
+            return False
+
+        return True
+
+    def create_last_code(self):
+        """Ends the encoding of the data.
 
         Returns:
-            decompressed_data (bytes): Data identical to the original before compression.
+            code_array (list): The code for the last sequence, if there is any.
         """
-        # If no specific codebook is passed, created codebook will be used.
-        if codebook:
-            self.codebook = codebook
-
-        # Data is converted from bytes to string of bits.
-        bit_string = self.decode_to_string(compressed_data=compressed_data)
 
-        # Removes leading and trailing padding bits.
-        unpadded_bit_string = self.remove_padding(bit_string=bit_string)
+        if self.prefix_code is None:
+            return []
 
-        # Decoding using the reversed_codebook.
-        decompressed_data = self.convert_to_original(unpadded_bit_string=unpadded_bit_string)
+        code_array = [self.prefix_code]
+        self.prefix_code = None
 
-        return decompressed_data
+        return code_array
 
-    def convert_to_code(self, uncompressed_data: bytes):
-        # FIXME: Actually this is the true compression/encoding of the data, naming not good. Do we need a separate
-        #  function for this? Why not implement it in other places such as encode()? We use it only once.
+    def compress_code(self, code_array: list):
+        """Packs the code array with as many bits per code as the codebook size at that code requires.
 
-        """Replaces data entries with code from the codebook
+        The encoder adds one codebook entry after every code until the codebook is full. The width of each code
+        follows from its position in the code array after the last clear code, so the decoder needs no further
+        information. The codes are written starting with the least significant bit. The first byte of the output
+        holds the maximum code width and the flag for the codebook reset. Bits which don't fill a whole byte yet
+        stay in the bit buffer.
+        In the .Z format the header starts with the magic bytes. compress(1) reads the codes in groups of eight,
+        so the group is filled with zero bits before the width changes and after a clear code.
 
         Args:
-            uncompressed_data (bytes): Data to be converted to code.
+            code_array (list): Codes pointing to original uncompressed data in the codebook.
 
         Returns:
-            converted_data (str): String of codes(bits).
+            compressed_code (bytes): The integer code array in bit-packed form.
         """
 
-        converted_data = ""
+        compressed_code = bytearray()
+
+        if not self.header_written:
+            if self.unix_compress:
+                compressed_code += LZWCompression.UNIX_COMPRESS_MAGIC
+            reset_flag = LZWCompression.RESET_FLAG if self.reset_codebook else 0
+            compressed_code.append(self.maximum_code_width | reset_flag)
+            self.header_written = True
+
+        # Local names avoid attribute lookups in the loop below.
+        bit_buffer = self.bit_buffer
+        buffered_bits = self.buffered_bits
+        codebook_size = self.packed_codebook_size
+        code_width = self.code_width
+        group_codes = self.group_codes
+        unix_compress = self.unix_compress
+        maximum_codebook_size = self.maximum_codebook_size
+        clear_code = LZWCompression.CLEAR_CODE if self.reset_codebook else None
 
-        for entry in uncompressed_data:
-            converted_data += self.codebook[entry]
+        for code in code_array:
 
-        return converted_data
+            # The width grows when the largest possible code doesn't fit any more.
+            if codebook_size > 1 << code_width:
+                if unix_compress:
+                    # The zero bits fill the rest of the group of eight codes.
+                    buffered_bits += code_width * (-group_codes % 8)
+                    group_codes = 0
+                code_width += 1
+
+            bit_buffer |= code << buffered_bits
+            buffered_bits += code_width
+            group_codes += 1
+
+            # After a clear code the widths start again from the beginning.
+            if code == clear_code:
+                if unix_compress:
+                    buffered_bits += code_width * (-group_codes % 8)
+                    group_codes = 0
+                codebook_size = self.first_code
+                code_width = LZWCompression.INITIAL_CODE_WIDTH
+            elif codebook_size < maximum_codebook_size:
+                codebook_size += 1
+
+            # Whole bytes are moved to the output in groups to keep the buffer small.
+            while buffered_bits >= 64:
+                compressed_code += (bit_buffer & 0xFFFFFFFFFFFFFFFF).to_bytes(8, 'little')
+                bit_buffer >>= 64
+                buffered_bits -= 64
+
+        self.bit_buffer = bit_buffer
+        self.buffered_bits = buffered_bits
+        self.packed_codebook_size = codebook_size
+        self.code_width = code_width
+        self.group_codes = group_codes
 
-    def convert_to_original(self, unpadded_bit_string: str):
-        # FIXME: This is actually the true decompression/decoding of the data, naming not good. Do we need a separate or
-        # we can implement it in other places such as decode()? We use it only once.
+        return bytes(compressed_code)
 
-        """Converts encoded data to the original using the reversed codebook.
 
-        Args:
-            unpadded_bit_string (str): String of codes(bits).
+class LZWDecoder(object):
+    """Incremental LZW decoder.
 
-        Returns:
-            decompressed_data (bytes): Data identical to the original before compression.
+    The compressed data of the variable width layout is passed in chunks of any size to self.feed(), which returns
+    the original data recovered so far. self.flush() ends the stream. The settings of the encoder are read from
+    the header, unless they are given to the constructor. The memory in use depends on the codebook size, not on
+    the size of the data. Data in the .Z format is recognized by its magic bytes.
+
+    Attributes:
+        maximum_code_width (None/int): The codebook grows until it exhausts all possibilities of this width.
+            None until the header is read.
+        reset_codebook (bool): The codes may contain clear codes.
+        unix_compress (bool): The data is in the .Z format.
+        header (bytearray): Bytes of the header read so far.
+        first_code (int): Code of the first entry after the 8-bit possibilities and the clear code.
+        codebook (None/tuple): Prefix table of three arrays with the prefix code, the last byte and
+            the length of the entry for each code.
+        codebook_size (int): Tracks the current codebook size.
+        previous_code (None/int): The previous code. None at the start and after a clear code,
+            when there is no entry to extend.
+        previous_first_byte (int): First byte of the entry of the previous code.
+        bit_buffer (int): Bits not yet read as codes.
+        buffered_bits (int): Amount of bits in the bit buffer.
+        unpacked_codebook_size (int): Size of the codebook at the code which is unpacked next.
+        code_width (int): Width of the code which is unpacked next.
+        group_codes (int): Amount of codes unpacked with the current width since the last filled group of
+            the .Z format.
+        skipped_bits (int): Amount of zero bits filling the current group which are not skipped yet.
+    """
+
+    def __init__(self, maximum_code_width=None, reset_codebook=False):
+        """Initiates an instance of the decoder.
+
+        Args:
+            maximum_code_width (None/int): Bits of the largest code. None reads the settings from the header.
+            reset_codebook (bool): The codes may contain clear codes. Used only without header.
         """
-        current_code = ""
-        decoded_bytes = bytearray()
-        reversed_codebook = {v: k for k, v in self.codebook.items()}
 
-        # Reads bits from the encoded data, when match with the codebook is found the original data is recovered.
-        for bit in unpadded_bit_string:
-            current_code += bit
-            if current_code in reversed_codebook:
-                data = reversed_codebook[current_code]
-                decoded_bytes.append(data)
-                current_code = ""
+        self.maximum_code_width = None
+        self.reset_codebook = None
+        self.unix_compress = False
+        self.header = bytearray()
+        self.first_code = None
+        self.codebook = None
+        self.codebook_size = None
 
-        decompressed_data = bytes(decoded_bytes)
+        self.previous_code = None
+        self.previous_first_byte = 0
 
-        return decompressed_data
+        self.bit_buffer = 0
+        self.buffered_bits = 0
+        self.unpacked_codebook_size = None
+        self.code_width = LZWCompression.INITIAL_CODE_WIDTH
+        self.group_codes = 0
+        self.skipped_bits = 0
 
-    @staticmethod
-    def pad_converted_data(converted_data: str):
-        # FIXME: Rename to add_padding() or add_padding_bits().
+        if maximum_code_width is not None:
+            self.create_reversed_codebook(maximum_code_width=maximum_code_width, reset_codebook=reset_codebook)
 
-        """Adds padding to converted data to keep it multiple of 8.
+    def feed(self, compressed_data: bytes):
+        """Decodes the next chunk of the compressed data.
 
         Args:
-            converted_data (str): String of codes(bits).
+            compressed_data (bytes): Chunk of the compressed data.
 
         Returns:
-            padded_converted_data (str): String of codes(bits) with padding on both ends.
+            decompressed_data (bytes): Original data recovered with this chunk. It may be empty.
         """
-        # Finds the amount of missing bits and adds them at the end as trailing zero.
-        extra_padding = 8 - len(converted_data) % 8
-        converted_data += "0" * extra_padding
 
-        # Puts information about the padding in form of a full byte in the front of the converted data.
-        padding_info = f"{extra_padding:08b}"
-        converted_data = padding_info + converted_data
+        code_array = self.decompress_code(compressed_code=compressed_data)
 
-        return converted_data
+        return self.recover_data(code_array=code_array)
 
-    @staticmethod
-    def remove_padding(bit_string: str):
-        """Removes trailing and leading bits that don't belong to the encoded information.
+    def flush(self):
+        """Ends the stream.
+
+        Returns:
+            decompressed_data (bytes): The rest of the original data. Every code is decoded in self.feed().
+
+        Raises:
+            ValueError: If the compressed data ends inside a code.
+        """
+
+        # The padding of the last byte is shorter than a byte.
+        if self.buffered_bits >= 8:
+            raise ValueError('Incomplete compressed data')
+
+        return b''
+
+    def read_header(self, compressed_code: bytes):
+        """Reads the settings of the encoder from the header of the variable width layout.
+
+        The header is one byte with the maximum code width and the flag for the codebook reset.
+        In the .Z format the same byte follows the magic bytes. The header may be split over several chunks.
 
         Args:
-            bit_string (str): String of codes(bits) with padding on both ends.
+            compressed_code (bytes): Chunk of the integer code array in bit-packed form.
 
         Returns:
-            unpadded_bit_string (str): String of codes(bits).
+            position (int): Amount of bytes of the chunk which belong to the header.
+
+        Raises:
+            ValueError: If the magic bytes are wrong or the stored maximum code width is out of range.
         """
-        # The leading byte contains information about the trailing padding.
-        padding_info = bit_string[:8]
+        magic = LZWCompression.UNIX_COMPRESS_MAGIC
+        header = self.header
+        position = 0
+
+        while self.codebook is None and position < len(compressed_code):
+            header.append(compressed_code[position])
+            position += 1
+
+            # The .Z format starts with a byte which can't be the header of the variable width layout.
+            unix_compress = header[0] == magic[0]
+            if unix_compress and len(header) < len(magic) + 1:
+                continue
+
+            if unix_compress and header[:len(magic)] != magic:
+                raise ValueError('Unsupported compressed data')
+
+            reset_codebook = bool(header[-1] & LZWCompression.RESET_FLAG)
+            maximum_code_width = header[-1] & ~LZWCompression.RESET_FLAG
+            if unix_compress:
+                smallest_code_width = LZWCompression.UNIX_COMPRESS_SMALLEST_CODE_WIDTH
+                largest_code_width = LZWCompression.UNIX_COMPRESS_LARGEST_CODE_WIDTH
+            else:
+                smallest_code_width = LZWCompression.INITIAL_CODE_WIDTH
+                largest_code_width = LZWCompression.LARGEST_CODE_WIDTH
 
-        # Amount of trailing padding bits.
-        extra_padding = int(padding_info, 2)
+            if not smallest_code_width <= maximum_code_width <= largest_code_width:
+                raise ValueError(f'Unsupported maximum code width: {maximum_code_width}')
 
-        # Removes leading and trailing padding bits.
-        bit_string = bit_string[8:]
-        unpadded_bit_string = bit_string[:-1 * extra_padding]
+            self.unix_compress = unix_compress
+            self.create_reversed_codebook(maximum_code_width=maximum_code_width, reset_codebook=reset_codebook)
 
-        return unpadded_bit_string
+        return position
 
-    @staticmethod
-    def encode_to_bytes(padded_converted_data: str):
-        # FIXME: Very poor naming of the function and arguments...
+    def create_reversed_codebook(self, maximum_code_width: int, reset_codebook: bool):
+        """Initiation of the base codebook for decompression.
 
-        """Converts string of bits to bytes.
+        The codebook is saved in the instance attribute self.codebook as a prefix table with room for all codes.
+        For each code it holds the code of the prefix, the last byte and the length of the entry.
+        The 8-bit possibilities are their own last byte, have no prefix and a length of one.
+        The codebook is used and potentially extended in the method self.recover_data().
 
         Args:
-            padded_converted_data (str): String of codes(bits) with padding on both ends.
-
-        Returns:
-            encoded_data (bytes): Compressed data, output of the encoding.
+            maximum_code_width (int): Bits of the largest code of the encoder.
+            reset_codebook (bool): The encoder reserved the clear code, so the first new entry gets the code after it.
         """
-        if len(padded_converted_data) % 8 != 0:
-            print("Encoded text not padded properly")
-            exit(0)
 
-        # Creates mutable bytes array with 8-bit bytes from the string.
-        bytes_data = bytearray()
-        for i in range(0, len(padded_converted_data), 8):
-            byte = padded_converted_data[i:i + 8]
-            bytes_data.append(int(byte, 2))
+        initial_codebook_size = LZWCompression.INITIAL_CODEBOOK_SIZE
+        maximum_codebook_size = 1 << maximum_code_width
+        new_entries = maximum_codebook_size - initial_codebook_size
 
-        encoded_data = bytes(bytes_data)
+        prefix_codes = array('i', range(initial_codebook_size)) + array('i', [0]) * new_entries
+        last_bytes = bytearray(range(initial_codebook_size)) + bytearray(new_entries)
+        entry_lengths = array('i', [1]) * maximum_codebook_size
 
-        return encoded_data
+        self.maximum_code_width = maximum_code_width
+        self.reset_codebook = reset_codebook
+        self.first_code = initial_codebook_size + 1 if reset_codebook else initial_codebook_size
+        self.codebook = prefix_codes, last_bytes, entry_lengths
+        self.codebook_size = self.first_code
+        self.unpacked_codebook_size = self.first_code
 
-    @staticmethod
-    def decode_to_string(compressed_data: bytes):
-        # FIXME: Very poor naming of the function...
+    def decompress_code(self, compressed_code: bytes):
+        """Recreates the code array from the next chunk of the variable width layout.
 
-        """Converts bytes to string of bits.
+        The width of each code is recalculated in the same way as in LZWEncoder.compress_code().
+        Bits of a code which continues in the next chunk stay in the bit buffer.
+        In the .Z format the zero bits which fill a group of eight codes are skipped.
 
         Args:
-            compressed_data (bytes): Compressed data, output of the encoding.
+            compressed_code (bytes): Chunk of the integer code array in bit-packed form.
 
         Returns:
-            bit_string (str): String of codes(bits) with padding on both ends.
+            code_array (list): Codes pointing to original uncompressed data in the codebook.
         """
+        code_array = []
+        position = 0
+
+        if self.codebook is None:
+            position = self.read_header(compressed_code=compressed_code)
+
+            if self.codebook is None:
+                return code_array
+
+        # Local names avoid attribute lookups in the loop below.
+        bit_buffer = self.bit_buffer
+        buffered_bits = self.buffered_bits
+        codebook_size = self.unpacked_codebook_size
+        code_width = self.code_width
+        code_mask = (1 << code_width) - 1
+        group_codes = self.group_codes
+        skipped_bits = self.skipped_bits
+        unix_compress = self.unix_compress
+        maximum_codebook_size = 1 << self.maximum_code_width
+        clear_code = LZWCompression.CLEAR_CODE if self.reset_codebook else None
+
+        while True:
+
+            # The filling of a group is skipped in the buffer first and then directly in the chunk.
+            # It always ends at a whole byte.
+            if skipped_bits:
+                skipped_buffer_bits = min(skipped_bits, buffered_bits)
+                bit_buffer >>= skipped_buffer_bits
+                buffered_bits -= skipped_buffer_bits
+                skipped_bits -= skipped_buffer_bits
+
+                skipped_bytes = min(skipped_bits >> 3, len(compressed_code) - position)
+                position += skipped_bytes
+                skipped_bits -= skipped_bytes << 3
+
+                if skipped_bits:
+                    break
+
+            # Refills the buffer with several bytes at once.
+            if buffered_bits < code_width:
+                chunk = compressed_code[position:position + 8]
+                position += len(chunk)
+                bit_buffer |= int.from_bytes(chunk, 'little') << buffered_bits
+                buffered_bits += 8 * len(chunk)
+
+                # The rest of the code follows in the next chunk.
+                if buffered_bits < code_width:
+                    break
+
+            code = bit_buffer & code_mask
+            code_array.append(code)
+            bit_buffer >>= code_width
+            buffered_bits -= code_width
+            group_codes += 1
+
+            if code == clear_code:
+                if unix_compress:
+                    skipped_bits = code_width * (-group_codes % 8)
+                    group_codes = 0
+                codebook_size = self.first_code
+                code_width = LZWCompression.INITIAL_CODE_WIDTH
+                code_mask = (1 << code_width) - 1
+            elif codebook_size < maximum_codebook_size:
+                codebook_size += 1
+
+            # The width grows when the largest possible code doesn't fit any more.
+            if codebook_size > 1 << code_width:
+                if unix_compress:
+                    skipped_bits = code_width * (-group_codes % 8)
+                    group_codes = 0
+                code_width += 1
+                code_mask = (1 << code_width) - 1
+
+        self.bit_buffer = bit_buffer
+        self.buffered_bits = buffered_bits
+        self.unpacked_codebook_size = codebook_size
+        self.code_width = code_width
+        self.group_codes = group_codes
+        self.skipped_bits = skipped_bits
 
-        bit_string = ""
+        return code_array
 
-        # Extracts the bits from the bytes and combines them to a string in bit_string.
-        for b in compressed_data:
+    def recover_data(self, code_array: list):
+        """Main decoding algorithm.
 
-            # bin(int) is used to convert and obtain an integer value's binary string equivalent.
-            # Slice operator omits the prefix "0b" in the string.
-            # rjust() does right alignment of the string,
-            # while filling the left empty spaces with "0" until total length of 8 is reached.
-            bits = bin(b)[2:].rjust(8, '0')
-            bit_string += bits
+        Obtains the data identical to the original before compression using the codebook.
+        This method navigates through the encoded data, develops further the decompression codebook and
+        generates the original data from it.
 
-        return bit_string
+        The first pass over the codes only follows the entry lengths to find the size of the original data.
+        The second pass writes each entry from its last byte backwards through the prefix codes directly into
+        the output, so the time depends linearly on the size of the original data.
+        On a clear code the codebook starts again with its initial entries, like the encoder did at the same point.
 
+        Args:
+            code_array (list): Codes pointing to original uncompressed data in the codebook.
 
-class BinaryTree(object):
-    """Creates a Huffman tree and a codebook out of it.
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
 
-    It is used in the HuffmanCompression class.
+        Raises:
+            ValueError: If a code is not in the codebook.
+        """
 
-    Attributes:
-        heap (list): Contains priority queue of nodes with the lowest occurrence values in the front. Managed by heapq.
-        codebook (dict): Codebook with codes generated from the Huffman tree.
-    """
-    def __init__(self):
-        """Initiates an instance of the binary tree."""
+        # Without codes the codebook may not exist yet, as the header is still incomplete.
+        if not code_array:
+            return b''
 
-        self.heap = []
+        # Local names avoid attribute lookups in the loops below.
+        prefix_codes, last_bytes, entry_lengths = self.codebook
+        maximum_codebook_size = len(prefix_codes)
+        initial_codebook_size = LZWCompression.INITIAL_CODEBOOK_SIZE
+        first_code = self.first_code
+        clear_code = LZWCompression.CLEAR_CODE if self.reset_codebook else None
 
-        # k:v data(int):code(str) used for compression.
-        # FIXME: Doesn't this belong to the HuffmanCompression class?
-        self.codebook = {}
+        # First pass: the size of the original data.
+        data_size = 0
+        codebook_size = self.codebook_size
+        previous_code = self.previous_code
 
-    def create_codebook(self, uncompressed_data: bytes):
-        # FIXME: This method belongs to the HuffmanCompression class (see also this class' docstring).
+        for code in code_array:
 
-        """Based on frequency of occurrence a code is assigned to the original data points.
+            if code == clear_code:
+                # The entries from before the clear code are still needed in the second pass,
+                # so the lengths after it are calculated in a copy.
+                if entry_lengths is self.codebook[2]:
+                    entry_lengths = array('i', entry_lengths)
+                codebook_size = first_code
+                previous_code = None
+                continue
 
-        This is the first of two passes of the Huffman algorithm over the data.
-        This method makes use of the other methods in the class to perform its function step by step.
+            if previous_code is None:
+                if code >= initial_codebook_size:
+                    raise ValueError(f'Poorly compressed code: {code}')
+                data_size += 1
 
-        Args:
-            uncompressed_data (bytes): Data to be converted to code.
+            else:
+                if code < codebook_size:
+                    data_size += entry_lengths[code]
+                elif code == codebook_size < maximum_codebook_size:
+                    data_size += entry_lengths[previous_code] + 1
+                else:
+                    raise ValueError(f'Poorly compressed code: {code}')
+
+                if codebook_size < maximum_codebook_size:
+                    entry_lengths[codebook_size] = entry_lengths[previous_code] + 1
+                    codebook_size += 1
+
+            previous_code = code
+
+        # Second pass: the entries are written in the preallocated output.
+        entry_lengths = self.codebook[2]
+        decoded_bytes = bytearray(data_size)
+        position = 0
+        codebook_size = self.codebook_size
+        previous_code = self.previous_code
+        previous_first_byte = self.previous_first_byte
 
-        Returns:
-            codebook (dict): Codebook with codes generated from the Huffman tree.
-        """
+        # Start of LZW decoding algorithm.
+        for code in code_array:
 
-        # FIXME: Change to name to statistics, symbol_frequencies, etc.
-        frequency = self.create_frequency_dict(input_data=uncompressed_data)
+            if code == clear_code:
+                # The old entries are overwritten, so only the size is reset.
+                codebook_size = first_code
+                previous_code = None
+                continue
+
+            # A code can refer to the entry which is added just now, the previous entry + its own first byte.
+            # The first byte of the previous entry is known, so the entry is added in advance.
+            new_entry_first = previous_code is not None and code == codebook_size
+            if new_entry_first:
+                prefix_codes[codebook_size] = previous_code
+                last_bytes[codebook_size] = previous_first_byte
+                entry_lengths[codebook_size] = entry_lengths[previous_code] + 1
+                codebook_size += 1
+
+            # The entry is written from its last byte backwards.
+            end = position + entry_lengths[code]
+            index = end - 1
+            entry_code = code
+            while entry_code >= initial_codebook_size:
+                decoded_bytes[index] = last_bytes[entry_code]
+                entry_code = prefix_codes[entry_code]
+                index -= 1
+            decoded_bytes[index] = entry_code
+
+            # Add previous entry + first byte of this entry to the codebook.
+            if previous_code is not None and not new_entry_first and codebook_size < maximum_codebook_size:
+                prefix_codes[codebook_size] = previous_code
+                last_bytes[codebook_size] = entry_code
+                entry_lengths[codebook_size] = entry_lengths[previous_code] + 1
+                codebook_size += 1
+
+            previous_code = code
+            previous_first_byte = entry_code
+            position = end
+
+        self.codebook_size = codebook_size
+        self.previous_code = previous_code
+        self.previous_first_byte = previous_first_byte
 
-        self.create_heap(frequency=frequency)
-        self.create_tree()
-        self.initiate_create_codes()
+        decompressed_data = bytes(decoded_bytes)
 
-        return self.codebook
+        return decompressed_data
 
-    @staticmethod
-    def create_frequency_dict(input_data: bytes):
-        # FIXME: This method could be private or protected.
 
-        """Determines how many times each element from the input data occurred.
+class HuffmanCompression(CompressionABC):
+    """Huffman compression algorithms.
 
-        This is the first pass over the complete data. The occurrence determines how far in the front
-        of the priority que a node is stored.
+    This class performs encoding and decoding using Huffman algorithm.
+    Input and output for the encoding and decoding are bytes.
+    This class relies on codebook generated from the BinaryTree class.
 
-        Args:
-            input_data (bytes): Data to be converted to code.
+    The compressed data starts with a header holding the codebook, so the instance keeps no state between calls
+    and can be shared by several threads. Data without header, as stored by older versions together with
+    a separate codebook, is decoded when the codebook is passed to self.decode().
 
-        Returns:
-            frequency (dict): Contains frequency of occurrence for individual input data points.
-        """
-        # frequency dict k:v data:occurrence
-        # Note: byte is transformed automatically to int when becoming key in the dictionary.
+    In block mode the data is cut into blocks of fixed size and every block is encoded with its own codebook.
+    The blocks adapt to data with changing content and are encoded and decoded independently of each other.
 
-        frequency = {}
+    In adaptive mode the codes are updated after every byte, in the same way by the encoder and the decoder.
+    The data is read only once and no codebook is stored, so it can be encoded while it streams in.
 
-        for byte in input_data:
-            if byte not in frequency:
-                frequency[byte] = 0
-            frequency[byte] += 1
+    With a sync interval the encoder stores an index with the bit position of the code after every sync interval.
+    The decoder splits large data at these positions and decodes the parts in parallel processes.
 
-        return frequency
+    Codebooks trained on samples of similar data are added to the instance under an ID. Data encoded with such
+    a codebook stores only its ID, which saves the codebook creation and the header for small data.
+    The same codebooks must be added to the instance which decodes the data.
 
-    def create_heap(self, frequency: dict):
-        # FIXME: This method could be private or protected.
+    Data with fewer than three different data points bypasses the tree and the coders. Empty data is encoded as
+    no data, data of a single data point as the data point and the amount of bytes. Data of two data points is
+    encoded with one bit for each byte, which is converted all at once as the digits of a binary number.
 
-        """Fills the priority queue with elements.
+    Attributes:
+        CANONICAL_CODES (int): Header format byte for canonical codes stored with the code lengths of all data points.
+        LISTED_CANONICAL_CODES (int): Header format byte for canonical codes stored with the occurring data points and
+            their code lengths. It is shorter for data with few different bytes.
+        PACKED_CANONICAL_CODES (int): Header format byte for canonical codes stored with the code lengths of all
+            data points, two in one byte. Used for codes up to 15 bits.
+        BLOCKS (int): Format byte for data encoded in blocks. Each block is stored with its size in front.
+        ADAPTIVE_CODES (int): Format byte for data encoded with codes which are updated after every byte.
+        INDEXED_CODES (int): Format byte for data stored with an index of sync points in front of the header.
+        TRAINED_CODES (int): Format byte for data encoded with a trained codebook, stored with its ID.
+        SINGLE_SYMBOL (int): Format byte for data of a single data point, stored with the amount of bytes.
+        TWO_SYMBOLS (int): Format byte for data of two data points, stored with one bit for each byte.
+        SYMBOL_COUNT (int): Amount of possible data points.
+        BLOCK_SIZE_BYTES (int): Amount of bytes holding the size of an encoded block.
+        INDEX_FIELD_BYTES (int): Amount of bytes holding the sync interval and the amount of sync points.
+        SYNC_POINT_BYTES (int): Amount of bytes holding the bit position of a sync point.
+        PARALLEL_DECODE_SIZE (int): Codes from this size on are decoded by several processes, if they have an index.
+        CODEBOOK_ID_BYTES (int): Amount of bytes holding the ID of a trained codebook.
+        LENGTH_BYTES (int): Amount of bytes holding the amount of bytes of data of a single data point.
+        segment_decoder (None/HuffmanDecoder): Decoder for the parts of indexed data, created in each process
+            which decodes them.
+        maximum_code_length (None/int): Upper limit for the length of the generated codes. None for no limit.
+        block_size (None/int): Amount of bytes encoded with one codebook. None for a single codebook for all data.
+        adaptive (bool): Encodes with codes which are updated after every byte.
+        sync_interval (None/int): Amount of bytes between two sync points of the index. None for no index.
+        trained_codebooks (dict): Trained codebooks by their ID.
+        trained_coders (dict): Encoder and decoder prepared for each trained codebook by its ID.
+    """
 
-        Nodes are stored in the priority queue as preparation for the tree creation.
+    CANONICAL_CODES = 1
+    LISTED_CANONICAL_CODES = 2
+    PACKED_CANONICAL_CODES = 3
+    BLOCKS = 4
+    ADAPTIVE_CODES = 5
+    INDEXED_CODES = 6
+    TRAINED_CODES = 7
+    SINGLE_SYMBOL = 8
+    TWO_SYMBOLS = 9
+    SYMBOL_COUNT = 256
+    BLOCK_SIZE_BYTES = 4
+    INDEX_FIELD_BYTES = 4
+    SYNC_POINT_BYTES = 8
+    PARALLEL_DECODE_SIZE = 1 << 22
+    CODEBOOK_ID_BYTES = 2
+    LENGTH_BYTES = 8
+    segment_decoder = None
+
+    def __init__(self, maximum_code_length=None, block_size=None, adaptive=False, sync_interval=None):
+        """Initiates an instance of the Huffman algorithm.
 
         Args:
-            frequency (dict): Contains frequency of occurrence for individual input data points.
+            maximum_code_length (None/int): Upper limit for the length of the generated codes. Short codes keep
+                the lookup tables of the decoder small, at the cost of slightly worse compression of skewed data.
+            block_size (None/int): Amount of bytes encoded with one codebook. Small blocks follow changes in
+                the data closely, but every block carries its own codebook. None for a single codebook for all data.
+            adaptive (bool): If True, the codes are updated after every byte instead of being created from
+                the whole data. It needs a single pass over the data, but encodes and decodes slower.
+            sync_interval (None/int): Amount of bytes between two sync points of the index, which allows
+                decoding in parallel. None for no index.
+
+        Raises:
+            ValueError: If the codes can't cover all possible data points within the maximum code length,
+                the block size or the sync interval is not positive or another setting is combined with
+                the adaptive mode.
+        """
+
+        if maximum_code_length is not None and 1 << maximum_code_length < self.SYMBOL_COUNT:
+            raise ValueError(f'Unsupported maximum code length: {maximum_code_length}')
+
+        if block_size is not None and block_size < 1:
+            raise ValueError(f'Unsupported block size: {block_size}')
+
+        if sync_interval is not None and sync_interval < 1:
+            raise ValueError(f'Unsupported sync interval: {sync_interval}')
+
+        # The adaptive codes have neither a fixed length limit, blocks nor an index.
+        if adaptive and (maximum_code_length is not None or block_size is not None or sync_interval is not None):
+            raise ValueError('Unsupported settings for the adaptive mode')
+
+        self.maximum_code_length = maximum_code_length
+        self.block_size = block_size
+        self.adaptive = adaptive
+        self.sync_interval = sync_interval
+        self.trained_codebooks = {}
+        self.trained_coders = {}
+
+    def create_codebook(self, uncompressed_data: bytes):
+        # FIXME: Change the algorithm to create the codebook in one pass.
+
+        """Calls the codebook creation.
+
+        The algorithm relies on an initial pass through the uncompressed data to generate an optimal codebook.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+
+        Returns:
+            codebook (dict): Codebook with codes generated from the Huffman tree.
+        """
+
+        binary_tree = BinaryTree(maximum_code_length=self.maximum_code_length)
+
+        # k:v data(int):code(str)
+        codebook = binary_tree.create_codebook(uncompressed_data=uncompressed_data)
+
+        return codebook
+
+    def train_codebook(self, samples: list):
+        """Creates a codebook from samples of the data to be encoded later.
+
+        Every possible data point gets a code, so any data can be encoded with the codebook.
+
+        Args:
+            samples (list): Samples as bytes.
+
+        Returns:
+            codebook (dict): Canonical codebook for data similar to the samples.
+        """
+
+        # Each data point is counted once more than it occurs, so the ones missing in the samples get a code too.
+        frequency = dict.fromkeys(range(self.SYMBOL_COUNT), 1)
+        for sample in samples:
+            for symbol, occurrence in BinaryTree.create_frequency_dict(input_data=sample).items():
+                frequency[symbol] += occurrence
+
+        binary_tree = BinaryTree(maximum_code_length=self.maximum_code_length)
+        codebook = binary_tree.create_codebook_from_frequency(frequency=frequency)
+
+        return codebook
+
+    def add_codebook(self, codebook_id: int, codebook: dict):
+        """Saves a trained codebook under an ID for the encoding and decoding.
+
+        Only the code lengths are used, so the codebook is replaced by canonical codes of the same lengths.
+
+        Args:
+            codebook_id (int): ID stored with the data encoded with the codebook.
+            codebook (dict): Codebook created by self.train_codebook().
+
+        Raises:
+            ValueError: If the ID doesn't fit in the stored data.
+        """
+
+        if not 0 <= codebook_id < 1 << 8 * self.CODEBOOK_ID_BYTES:
+            raise ValueError(f'Unsupported codebook ID: {codebook_id}')
+
+        codebook = BinaryTree.create_canonical_codebook(code_lengths={symbol: len(code) for symbol, code
+                                                                      in codebook.items()})
+
+        # The tables of the coders are prepared once and serve all data encoded with the codebook.
+        self.trained_codebooks[codebook_id] = codebook
+        self.trained_coders[codebook_id] = HuffmanEncoder(codebook=codebook), HuffmanDecoder(codebook=codebook)
+
+    def encode(self, uncompressed_data: bytes, codebook=None, codebook_id=None):
+        """Will compress bytes input to bytes output.
+
+        Encode and decode are the main methods of the compression algorithm. They make use of the other methods
+        in the class to perform their function step by step.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+            codebook (None/dict): An option to add custom codebook instead of generating one automatically.
+            codebook_id (None/int): ID of a trained codebook to use instead of generating one automatically.
+                Only the ID is stored with the data.
+
+        Returns:
+            encoded_data (bytes): Compressed data with the codebook in the header.
+
+        Raises:
+            ValueError: If no trained codebook has the ID.
+        """
+
+        if codebook_id is not None:
+            if codebook_id not in self.trained_coders:
+                raise ValueError(f'Unknown codebook ID: {codebook_id}')
+
+            encoder = self.trained_coders[codebook_id][0]
+            return bytes([self.TRAINED_CODES]) + codebook_id.to_bytes(self.CODEBOOK_ID_BYTES, "little") + \
+                encoder.compress_data(uncompressed_data=uncompressed_data)
+
+        if self.adaptive and not codebook:
+            encoder = self.create_adaptive_encoder()
+            return encoder.feed(uncompressed_data) + encoder.flush()
+
+        if self.block_size:
+            return self.encode_blocks(uncompressed_data=uncompressed_data, codebook=codebook)
+
+        return self.encode_block(uncompressed_data=uncompressed_data, codebook=codebook)
+
+    @staticmethod
+    def create_adaptive_encoder():
+        """Creates an encoder of the adaptive mode, which takes the data in chunks.
+
+        Returns:
+            encoder (AdaptiveHuffmanEncoder): Encoder with feed and flush methods.
+        """
+
+        return AdaptiveHuffmanEncoder()
+
+    @staticmethod
+    def create_adaptive_decoder():
+        """Creates a decoder of the adaptive mode, which takes the compressed data in chunks.
+
+        Returns:
+            decoder (AdaptiveHuffmanDecoder): Decoder with feed and flush methods.
+        """
+
+        return AdaptiveHuffmanDecoder()
+
+    def encode_blocks(self, uncompressed_data: bytes, codebook=None):
+        """Cuts the data in blocks and encodes each of them with its own codebook.
+
+        The format byte is followed by the blocks, each of them with its encoded size in front.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+            codebook (None/dict): An option to add custom codebook, used for all blocks.
+
+        Returns:
+            encoded_data (bytes): Compressed blocks.
+        """
+
+        encoded_blocks = [bytes([self.BLOCKS])]
+
+        for position in range(0, len(uncompressed_data), self.block_size):
+            encoded_block = self.encode_block(uncompressed_data=uncompressed_data[position:position + self.block_size],
+                                              codebook=codebook)
+            encoded_blocks.append(len(encoded_block).to_bytes(self.BLOCK_SIZE_BYTES, "little"))
+            encoded_blocks.append(encoded_block)
+
+        encoded_data = b"".join(encoded_blocks)
+
+        return encoded_data
+
+    def encode_block(self, uncompressed_data: bytes, codebook=None):
+        """Compresses the data with a single codebook.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+            codebook (None/dict): An option to add custom codebook instead of generating one automatically.
+
+        Returns:
+            encoded_data (bytes): Compressed data with the codebook in the header.
+        """
+
+        # If no specific codebook is passed, standard codebook will be created from the counted data points.
+        # Only the code lengths are stored, so a custom codebook is replaced by canonical codes of the same lengths.
+        if not codebook:
+            frequency = BinaryTree.create_frequency_dict(input_data=uncompressed_data)
+
+            # Such data needs neither a tree, an index nor the coders.
+            if len(frequency) < 3:
+                return self.encode_few_symbols(uncompressed_data=uncompressed_data, symbols=sorted(frequency))
+
+            binary_tree = BinaryTree(maximum_code_length=self.maximum_code_length)
+            codebook = binary_tree.create_codebook_from_frequency(frequency=frequency)
+        else:
+            codebook = BinaryTree.create_canonical_codebook(code_lengths={symbol: len(code) for symbol, code
+                                                                          in codebook.items()})
+
+        # Replaces data entries with code from the codebook, bit-packed and padded to whole bytes.
+        encoder = HuffmanEncoder(codebook=codebook, sync_interval=self.sync_interval)
+        encoded_data = encoder.compress_data(uncompressed_data=uncompressed_data)
+
+        # The codebook travels with the data, so the decoding needs nothing else.
+        encoded_data = self.create_header(codebook=codebook) + encoded_data
+
+        if self.sync_interval:
+            encoded_data = self.create_index(sync_interval=self.sync_interval,
+                                             sync_points=encoder.sync_points) + encoded_data
+
+        return encoded_data
+
+    @classmethod
+    def encode_few_symbols(cls, uncompressed_data: bytes, symbols: list):
+        """Compresses data of fewer than three different data points without the tree.
+
+        Empty data stays empty. Data of a single data point is stored as the data point and the amount of bytes.
+        Data of two data points is stored as the data points followed by the payload with one bit for each byte,
+        0 for the smaller data point and 1 for the larger one.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+            symbols (list): The sorted different data points of the data.
+
+        Returns:
+            encoded_data (bytes): Compressed data.
+        """
+
+        if not symbols:
+            return b""
+
+        if len(symbols) == 1:
+            return bytes([cls.SINGLE_SYMBOL, symbols[0]]) + len(uncompressed_data).to_bytes(cls.LENGTH_BYTES, "little")
+
+        # The bytes are translated to the digits of a binary number, padded to whole bytes.
+        digit_table = bytearray(cls.SYMBOL_COUNT)
+        digit_table[symbols[0]] = ord("0")
+        digit_table[symbols[1]] = ord("1")
+        padding_bits = -len(uncompressed_data) % 8
+        digits = bytes(uncompressed_data).translate(digit_table) + b"0" * padding_bits
+
+        encoded_data = bytes([cls.TWO_SYMBOLS, symbols[0], symbols[1], padding_bits]) + \
+            int(digits, 2).to_bytes(len(digits) // 8, "big")
+
+        return encoded_data
+
+    def decode(self, compressed_data: bytes, codebook=None):
+        """Will decompress bytes input to bytes output.
+
+        Decide and encode are the main methods of the compression algorithm. They make use of the other methods
+        in the class to perform their function step by step.
+
+        Args:
+            compressed_data (bytes): Data to be decoded.
+            codebook (None/dict): Codebook passed to the encoding. The data stores the codes in its header,
+                so it isn't needed and only accepted for symmetry with self.encode().
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+        """
+
+        if compressed_data[:1] == bytes([self.ADAPTIVE_CODES]):
+            decoder = self.create_adaptive_decoder()
+            return decoder.feed(compressed_data) + decoder.flush()
+
+        if compressed_data[:1] == bytes([self.BLOCKS]):
+            return self.decode_blocks(compressed_data=compressed_data)
+
+        return self.decode_block(compressed_data=compressed_data)
+
+    @staticmethod
+    def decode_legacy(compressed_data: bytes, codebook: dict):
+        """Decompresses data without header, as stored by older versions together with their codebook.
+
+        Such data starts with any byte, so it can't be told apart from data with header and has its own method.
+
+        Args:
+            compressed_data (bytes): Data to be decoded.
+            codebook (dict): Codebook stored with the data.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+        """
+
+        return HuffmanDecoder(codebook=codebook).recover_data(compressed_data=compressed_data)
+
+    def decode_blocks(self, compressed_data: bytes):
+        """Decodes the blocks one after another.
+
+        Args:
+            compressed_data (bytes): Compressed blocks.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+        """
+
+        decompressed_data = b"".join(self.decode_block(compressed_data=encoded_block)
+                                     for encoded_block in self.split_blocks(compressed_data=compressed_data))
+
+        return decompressed_data
+
+    @classmethod
+    def split_blocks(cls, compressed_data: bytes):
+        """Separates the blocks by the sizes in front of them.
+
+        Args:
+            compressed_data (bytes): Compressed blocks.
+
+        Returns:
+            encoded_blocks (list): Each block with its header, ready to be decoded independently of the others.
+
+        Raises:
+            ValueError: If the last block is incomplete.
+        """
+
+        data_view = memoryview(compressed_data)
+        encoded_blocks = []
+
+        # The format byte is skipped.
+        position = 1
+        while position < len(data_view):
+            block_start = position + cls.BLOCK_SIZE_BYTES
+            block_end = block_start + int.from_bytes(data_view[position:block_start], "little")
+
+            if block_end > len(data_view):
+                raise ValueError('Incomplete compressed data')
+
+            encoded_blocks.append(data_view[block_start:block_end])
+            position = block_end
+
+        return encoded_blocks
+
+    def decode_block(self, compressed_data: bytes):
+        """Decompresses data encoded with a single codebook.
+
+        Args:
+            compressed_data (bytes): Data to be decoded.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+        """
+
+        if compressed_data[:1] == bytes([self.INDEXED_CODES]):
+            return self.decode_indexed(compressed_data=compressed_data)
+
+        if compressed_data[:1] == bytes([self.TRAINED_CODES]):
+            return self.decode_trained(compressed_data=compressed_data)
+
+        if compressed_data[:1] in (b"", bytes([self.SINGLE_SYMBOL]), bytes([self.TWO_SYMBOLS])):
+            return self.decode_few_symbols(compressed_data=compressed_data)
+
+        codebook, header_size = self.read_header(compressed_data=compressed_data)
+        compressed_data = compressed_data[header_size:]
+
+        # The codes are resolved through lookup tables prepared from the codebook.
+        decoder = HuffmanDecoder(codebook=codebook)
+        decompressed_data = decoder.recover_data(compressed_data=compressed_data)
+
+        return decompressed_data
+
+    @classmethod
+    def decode_few_symbols(cls, compressed_data: bytes):
+        """Decompresses data of fewer than three different data points.
+
+        Args:
+            compressed_data (bytes): Compressed data from self.encode_few_symbols().
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+
+        Raises:
+            ValueError: If the data is incomplete or the padding is out of range.
+        """
+
+        if not compressed_data:
+            return b""
+
+        if compressed_data[0] == cls.SINGLE_SYMBOL:
+            if len(compressed_data) != 2 + cls.LENGTH_BYTES:
+                raise ValueError('Incomplete compressed data')
+
+            return bytes(compressed_data[1:2]) * int.from_bytes(compressed_data[2:], "little")
+
+        if len(compressed_data) < 4:
+            raise ValueError('Incomplete compressed data')
+
+        padding_bits = compressed_data[3]
+        payload = compressed_data[4:]
+        if padding_bits > 7 or padding_bits > len(payload) * 8:
+            raise ValueError('Poorly compressed data')
+
+        # The bits are written out as the digits of a binary number and translated back to the data points.
+        symbol_table = bytearray(cls.SYMBOL_COUNT)
+        symbol_table[ord("0")] = compressed_data[1]
+        symbol_table[ord("1")] = compressed_data[2]
+        bit_count = len(payload) * 8
+        digits = f"{int.from_bytes(payload, 'big'):0{bit_count}b}".encode("ascii")
+
+        decompressed_data = digits[:bit_count - padding_bits].translate(symbol_table)
+
+        return decompressed_data
+
+    def decode_trained(self, compressed_data: bytes):
+        """Decompresses data encoded with a trained codebook.
+
+        Args:
+            compressed_data (bytes): Compressed data with the ID of the codebook in front.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+
+        Raises:
+            ValueError: If the ID is incomplete or no trained codebook has it.
+        """
+
+        header_size = 1 + self.CODEBOOK_ID_BYTES
+        if len(compressed_data) < header_size:
+            raise ValueError('Incomplete compressed data')
+
+        codebook_id = int.from_bytes(compressed_data[1:header_size], "little")
+        if codebook_id not in self.trained_coders:
+            raise ValueError(f'Unknown codebook ID: {codebook_id}')
+
+        decoder = self.trained_coders[codebook_id][1]
+        decompressed_data = decoder.recover_data(compressed_data=compressed_data[header_size:])
+
+        return decompressed_data
+
+    def decode_indexed(self, compressed_data: bytes):
+        """Decompresses data with an index of sync points.
+
+        The codes between two sync points are decoded independently of each other. Large data is split at
+        the sync points and the parts are decoded in parallel processes, if several processors are available.
+
+        Args:
+            compressed_data (bytes): Compressed data with the index in front of the header.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+
+        Raises:
+            ValueError: If the sync points don't match the codes.
+        """
+
+        sync_interval, sync_points, index_size = self.read_index(compressed_data=compressed_data)
+        codebook, header_size = self.read_header(compressed_data=compressed_data[index_size:])
+        encoded_data = compressed_data[index_size + header_size:]
+
+        if len(encoded_data) < self.PARALLEL_DECODE_SIZE or not sync_points or (os.cpu_count() or 1) < 2:
+            return HuffmanDecoder(codebook=codebook).recover_data(compressed_data=encoded_data)
+
+        # The first byte holds the amount of padding bits.
+        data_view = memoryview(encoded_data)[1:]
+        bit_positions = [0] + sync_points + [len(data_view) * 8 - encoded_data[0]]
+
+        if bit_positions != sorted(bit_positions):
+            raise ValueError('Poorly compressed data')
+
+        # Each process gets only the bytes of its part, with the bit positions counted from their first byte.
+        parts = []
+        start_bits = []
+        end_bits = []
+        for start_bit, end_bit in zip(bit_positions, bit_positions[1:]):
+            parts.append(bytes(data_view[start_bit >> 3:(end_bit + 7) >> 3]))
+            start_bits.append(start_bit & 7)
+            end_bits.append(end_bit - (start_bit & ~7))
+
+        # Each process prepares the lookup tables of the decoder once and reuses them for all its parts.
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=self.create_segment_decoder,
+                                 initargs=(codebook,)) as executor:
+            decoded_parts = list(executor.map(self.decode_segment, parts, start_bits, end_bits))
+
+        # Every part but the last holds the bytes of one sync interval.
+        if any(len(decoded_part) != sync_interval for decoded_part in decoded_parts[:-1]):
+            raise ValueError('Poorly compressed data')
+
+        decompressed_data = b"".join(decoded_parts)
+
+        return decompressed_data
+
+    @classmethod
+    def create_segment_decoder(cls, codebook: dict):
+        """Prepares the decoder for the parts of indexed data, once in every process which decodes them.
+
+        Args:
+            codebook (dict): Codebook used for the encoding.
+        """
+
+        cls.segment_decoder = HuffmanDecoder(codebook=codebook)
+
+    @classmethod
+    def decode_segment(cls, compressed_data: bytes, start_bit: int, end_bit: int):
+        """Decodes the codes between two sync points with the decoder of the process.
+
+        Args:
+            compressed_data (bytes): Codes containing the part.
+            start_bit (int): Position of the first bit of the part.
+            end_bit (int): Position after the last bit of the part.
+
+        Returns:
+            decompressed_data (bytes): Data of the part.
+        """
+
+        decompressed_data = cls.segment_decoder.recover_segment(data_view=memoryview(compressed_data),
+                                                                start_bit=start_bit, end_bit=end_bit)
+
+        return decompressed_data
+
+    @classmethod
+    def create_index(cls, sync_interval: int, sync_points: list):
+        """Stores the sync points in front of the header.
+
+        The format byte is followed by the sync interval, the amount of sync points and their bit positions.
+
+        Args:
+            sync_interval (int): Amount of bytes between two sync points.
+            sync_points (list): Bit position of the code after every sync interval.
+
+        Returns:
+            index (bytes): The sync points in stored form.
+        """
+
+        index = bytearray([cls.INDEXED_CODES])
+        index += sync_interval.to_bytes(cls.INDEX_FIELD_BYTES, "little")
+        index += len(sync_points).to_bytes(cls.INDEX_FIELD_BYTES, "little")
+
+        for sync_point in sync_points:
+            index += sync_point.to_bytes(cls.SYNC_POINT_BYTES, "little")
+
+        return bytes(index)
+
+    @classmethod
+    def read_index(cls, compressed_data: bytes):
+        """Reads the sync points in front of the header.
+
+        Args:
+            compressed_data (bytes): Compressed data with the index in front of the header.
+
+        Returns:
+            sync_interval (int): Amount of bytes between two sync points.
+            sync_points (list): Bit position of the code after every sync interval.
+            index_size (int): Amount of bytes of the index.
+
+        Raises:
+            ValueError: If the index is incomplete.
+        """
+
+        count_start = 1 + cls.INDEX_FIELD_BYTES
+        sync_points_start = count_start + cls.INDEX_FIELD_BYTES
+
+        if len(compressed_data) < sync_points_start:
+            raise ValueError('Incomplete compressed data')
+
+        sync_interval = int.from_bytes(compressed_data[1:count_start], "little")
+        sync_point_count = int.from_bytes(compressed_data[count_start:sync_points_start], "little")
+        index_size = sync_points_start + sync_point_count * cls.SYNC_POINT_BYTES
+
+        if len(compressed_data) < index_size:
+            raise ValueError('Incomplete compressed data')
+
+        sync_points = [int.from_bytes(compressed_data[position:position + cls.SYNC_POINT_BYTES], "little")
+                       for position in range(sync_points_start, index_size, cls.SYNC_POINT_BYTES)]
+
+        return sync_interval, sync_points, index_size
+
+    @classmethod
+    def create_header(cls, codebook: dict):
+        """Stores the codebook in front of the compressed data.
+
+        The codebook consists of canonical codes, so the code lengths are enough to recreate it.
+        The header starts with the format byte. For data with few different bytes it is followed by their amount and
+        a pair of data point and code length for each of them. Otherwise, the code length follows for every possible
+        data point, zero for data points which don't occur. Code lengths up to 15 are packed two in one byte,
+        the first one in the upper half.
+
+        Args:
+            codebook (dict): Canonical codebook used for the encoding.
+
+        Returns:
+            header (bytes): The code lengths in stored form.
+        """
+
+        listed_code_lengths = bytearray()
+        for symbol in sorted(codebook):
+            if codebook[symbol]:
+                listed_code_lengths += bytes([symbol, len(codebook[symbol])])
+
+        code_lengths = bytes(len(codebook.get(symbol, "")) for symbol in range(cls.SYMBOL_COUNT))
+
+        if max(code_lengths) < 16 and len(listed_code_lengths) + 1 >= cls.SYMBOL_COUNT // 2:
+            packed_code_lengths = bytes(upper << 4 | lower for upper, lower in zip(code_lengths[::2],
+                                                                                   code_lengths[1::2]))
+            header = bytes([cls.PACKED_CANONICAL_CODES]) + packed_code_lengths
+        elif len(listed_code_lengths) + 1 < cls.SYMBOL_COUNT:
+            header = bytes([cls.LISTED_CANONICAL_CODES, len(listed_code_lengths) // 2]) + listed_code_lengths
+        else:
+            header = bytes([cls.CANONICAL_CODES]) + code_lengths
+
+        return header
+
+    @classmethod
+    def read_header(cls, compressed_data: bytes):
+        """Recreates the codebook from the header of the compressed data.
+
+        Args:
+            compressed_data (bytes): Compressed data with the codebook in the header.
+
+        Returns:
+            codebook (dict): Codebook used for the encoding.
+            header_size (int): Amount of bytes of the header.
+
+        Raises:
+            ValueError: If the header format is unknown, the header is incomplete or
+                the code lengths don't fit a prefix code.
+        """
+
+        header_format = compressed_data[0] if compressed_data else None
+
+        if header_format == cls.CANONICAL_CODES:
+            header_size = cls.SYMBOL_COUNT + 1
+            code_lengths = dict(enumerate(compressed_data[1:header_size]))
+
+        elif header_format == cls.PACKED_CANONICAL_CODES:
+            header_size = cls.SYMBOL_COUNT // 2 + 1
+            code_lengths = {}
+            for symbol, packed_code_lengths in enumerate(compressed_data[1:header_size]):
+                code_lengths[2 * symbol] = packed_code_lengths >> 4
+                code_lengths[2 * symbol + 1] = packed_code_lengths & 0x0F
+
+        elif header_format == cls.LISTED_CANONICAL_CODES:
+            symbol_count = compressed_data[1] if len(compressed_data) > 1 else 0
+            header_size = 2 + 2 * symbol_count
+            listed_code_lengths = compressed_data[2:header_size]
+            code_lengths = dict(zip(listed_code_lengths[::2], listed_code_lengths[1::2]))
+
+        else:
+            raise ValueError('Unsupported compressed data')
+
+        if len(compressed_data) < header_size:
+            raise ValueError('Incomplete compressed data')
+
+        # The codes are recreated from their lengths in the same way as for the encoding.
+        codebook = BinaryTree.create_canonical_codebook(code_lengths={symbol: length for symbol, length
+                                                                      in code_lengths.items() if length})
+
+        return codebook, header_size
+
+    @staticmethod
+    def decode_to_string(compressed_data: bytes):
+        # FIXME: Very poor naming of the function...
+
+        """Converts bytes to string of bits.
+
+        Args:
+            compressed_data (bytes): Compressed data, output of the encoding.
+
+        Returns:
+            bit_string (str): String of codes(bits) with padding on both ends.
+        """
+
+        bit_string = ""
+
+        # Extracts the bits from the bytes and combines them to a string in bit_string.
+        for b in compressed_data:
+
+            # bin(int) is used to convert and obtain an integer value's binary string equivalent.
+            # Slice operator omits the prefix "0b" in the string.
+            # rjust() does right alignment of the string,
+            # while filling the left empty spaces with "0" until total length of 8 is reached.
+            bits = bin(b)[2:].rjust(8, '0')
+            bit_string += bits
+
+        return bit_string
+
+
+class HuffmanEncoder(object):
+    """Bit-buffer Huffman encoder.
+
+    The codes are kept as integers with their length and are collected in an integer bit buffer,
+    from which whole groups of eight bytes are moved to the output.
+
+    Attributes:
+        codebook (dict): Codebook used for the encoding.
+        codes (list): Value and length of the code for each byte. None for bytes without code.
+        sync_interval (None/int): Amount of bytes between two sync points. None for no sync points.
+        sync_points (list): Bit position of the code after every sync interval, filled by the encoding.
+    """
+
+    def __init__(self, codebook: dict, sync_interval=None):
+        """Initiates an instance of the encoder.
+
+        Args:
+            codebook (dict): Codebook used for the encoding.
+            sync_interval (None/int): Amount of bytes between two sync points. None for no sync points.
+        """
+
+        self.codebook = codebook
+        self.codes = [None] * HuffmanCompression.SYMBOL_COUNT
+        self.sync_interval = sync_interval
+        self.sync_points = []
+
+        for symbol, code in codebook.items():
+            self.codes[symbol] = int(code, 2) if code else 0, len(code)
+
+    def compress_data(self, uncompressed_data: bytes):
+        """Main encoding algorithm.
+
+        The codes are written starting with the most significant bit and padded with zeros to a whole byte.
+        A byte with the amount of padding bits is put in front. When the codes fill whole bytes,
+        a full byte of padding is added. With a sync interval the bit positions of the codes at the sync points
+        are collected in self.sync_points, not counting the byte in front.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+
+        Returns:
+            compressed_data (bytes): Codes of the data with the padding information in front.
+
+        Raises:
+            ValueError: If the codebook has no code for a byte of the data.
+        """
+
+        missing_symbols = set(uncompressed_data).difference(self.codebook)
+        if missing_symbols:
+            raise ValueError(f'No code for the byte: {min(missing_symbols)}')
+
+        # Local names avoid attribute lookups in the loop below.
+        codes = self.codes
+
+        encoded_bytes = bytearray()
+        bit_buffer = 0
+        buffered_bits = 0
+
+        sync_interval = self.sync_interval or max(len(uncompressed_data), 1)
+        self.sync_points = []
+
+        for sync_position in range(0, len(uncompressed_data), sync_interval):
+            if sync_position:
+                self.sync_points.append(len(encoded_bytes) * 8 + buffered_bits)
+
+            for byte in uncompressed_data[sync_position:sync_position + sync_interval]:
+                value, length = codes[byte]
+                bit_buffer = bit_buffer << length | value
+                buffered_bits += length
+
+                # The oldest 64 bits are moved to the output.
+                if buffered_bits >= 64:
+                    buffered_bits -= 64
+                    encoded_bytes += (bit_buffer >> buffered_bits).to_bytes(8, 'big')
+                    bit_buffer &= (1 << buffered_bits) - 1
+
+        # The remaining bits are padded with zeros to a whole byte.
+        extra_padding = 8 - buffered_bits % 8
+        encoded_bytes += (bit_buffer << extra_padding).to_bytes((buffered_bits + extra_padding) // 8, 'big')
+
+        compressed_data = bytes([extra_padding]) + encoded_bytes
+
+        return compressed_data
+
+
+class HuffmanDecoder(object):
+    """Table-driven Huffman decoder.
+
+    The decoder reads the compressed data from an integer bit buffer and resolves several bits at once through
+    lookup tables prepared from the codebook. The sequence table gives for each combination of its bits all
+    codes which fit completely in them, so one lookup often recovers several bytes. Codes longer than the table
+    are resolved through the symbol table, which branches into further tables for every additional group of bits.
+    The tables depend only on the codebook, so one decoder can be used for any amount of data and threads.
+
+    Attributes:
+        TABLE_BITS (int): Amount of bits resolved with one lookup.
+        maximum_code_length (int): Length of the longest code in the codebook.
+        symbol_table (tuple): Amount of bits and list with an entry for each of their combinations. An entry is
+            an integer with the byte and the length of the code, a table of the same form for longer codes or None
+            for combinations which don't start any code.
+        sequence_table (list): For each combination of TABLE_BITS bits the bytes of the codes which fit completely
+            in them and the amount of bits they take. None if the first code doesn't fit.
+    """
+
+    TABLE_BITS = 11
+
+    def __init__(self, codebook: dict):
+        """Initiates an instance of the decoder.
+
+        Args:
+            codebook (dict): Codebook used for the encoding.
+        """
+
+        # Codes as integers with their length. Codes without bits can't be read from the data.
+        codes = [(int(code, 2), len(code), symbol) for symbol, code in codebook.items() if code]
+
+        self.maximum_code_length = max((length for value, length, symbol in codes), default=0)
+        self.symbol_table = self.create_symbol_table(codes=codes, depth=0)
+        self.sequence_table = self.create_sequence_table()
+
+    def create_symbol_table(self, codes: list, depth: int):
+        """Creates the table for codes which share their first bits.
+
+        The table resolves up to TABLE_BITS bits after the shared bits. A code which fits in them fills all entries
+        starting with its remaining bits. Longer codes are grouped by these bits into a table for the next bits.
+
+        Args:
+            codes (list): Value, length and byte of the codes.
+            depth (int): Amount of bits the codes share and which are already resolved.
+
+        Returns:
+            symbol_table (tuple): Amount of bits and list with an entry for each of their combinations.
+        """
+
+        table_bits = min(self.TABLE_BITS, max((length for value, length, symbol in codes), default=0) - depth)
+        table = [None] * (1 << table_bits)
+        longer_codes = {}
+
+        for value, length, symbol in codes:
+            remaining_length = length - depth
+            remaining_value = value & ((1 << remaining_length) - 1)
+
+            if remaining_length <= table_bits:
+                start = remaining_value << (table_bits - remaining_length)
+                entry = symbol << 8 | length
+                for index in range(start, start + (1 << (table_bits - remaining_length))):
+                    table[index] = entry
+            else:
+                index = remaining_value >> (remaining_length - table_bits)
+                longer_codes.setdefault(index, []).append((value, length, symbol))
+
+        for index, group in longer_codes.items():
+            table[index] = self.create_symbol_table(codes=group, depth=depth + table_bits)
+
+        return table_bits, table
+
+    def create_sequence_table(self):
+        """Creates the table which resolves several short codes with one lookup.
+
+        Returns:
+            sequence_table (list): Bytes and their amount of bits for each combination of TABLE_BITS bits.
+        """
+
+        table_bits, table = self.symbol_table
+        mask = (1 << self.TABLE_BITS) - 1
+        sequence_table = []
+
+        for bits in range(1 << self.TABLE_BITS):
+            sequence = bytearray()
+            position = 0
+
+            # The codes are taken one after another as long as they end within the bits.
+            while position < self.TABLE_BITS:
+                entry = table[((bits << position) & mask) >> (self.TABLE_BITS - table_bits)]
+                if entry.__class__ is not int or entry & 0xFF > self.TABLE_BITS - position:
+                    break
+                sequence.append(entry >> 8)
+                position += entry & 0xFF
+
+            sequence_table.append((bytes(sequence), position) if sequence else None)
+
+        return sequence_table
+
+    def recover_data(self, compressed_data: bytes):
+        """Main decoding algorithm.
+
+        The first byte of the compressed data holds the amount of padding bits at its end. Whole bytes are moved
+        into the bit buffer in groups of eight and the codes are read starting with the most significant bit.
+        As long as more bytes follow the buffered ones, all buffered bits belong to the codes and the sequence table
+        is used without further checks. The rest of the codes is resolved one at a time.
+
+        Args:
+            compressed_data (bytes): Codes of the data with the padding information in front.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+
+        Raises:
+            ValueError: If the data contains a combination of bits which is not a code.
+        """
+
+        if not compressed_data:
+            raise ValueError('Incomplete compressed data')
+
+        data_view = memoryview(compressed_data)[1:]
+        data_bits = len(data_view) * 8 - compressed_data[0]
+
+        decompressed_data = self.recover_segment(data_view=data_view, start_bit=0, end_bit=data_bits)
+
+        return decompressed_data
+
+    def recover_segment(self, data_view: memoryview, start_bit: int, end_bit: int):
+        """Decodes the codes between two bit positions.
+
+        Both positions must be at the start of a code, so the codes of one stream can be decoded in parts.
+
+        Args:
+            data_view (memoryview): Codes of the data.
+            start_bit (int): Position of the first bit of the first code.
+            end_bit (int): Position after the last bit of the last code.
+
+        Returns:
+            decompressed_data (bytes): Data of the codes between the positions.
+
+        Raises:
+            ValueError: If the data contains a combination of bits which is not a code.
+        """
+
+        # Local names avoid attribute lookups in the loop below.
+        sequence_table = self.sequence_table
+        table_bits = self.TABLE_BITS
+        mask = (1 << table_bits) - 1
+
+        decoded_bytes = bytearray()
+        bit_buffer = 0
+        buffered_bits = 0
+        position = start_bit >> 3
+
+        # The bits of the first byte before the start belong to other codes.
+        if start_bit & 7:
+            buffered_bits = 8 - (start_bit & 7)
+            bit_buffer = data_view[position] & ((1 << buffered_bits) - 1)
+            position += 1
+
+        # The last group of bytes contains the end.
+        last_group = (end_bit >> 3) - 8
+
+        while position < last_group:
+
+            # Refills the buffer with eight bytes. Bits already read are removed.
+            if buffered_bits < table_bits:
+                bit_buffer = (bit_buffer & ((1 << buffered_bits) - 1)) << 64 | \
+                    int.from_bytes(data_view[position:position + 8], 'big')
+                position += 8
+                buffered_bits += 64
+
+            # Most of the time several short codes are resolved at once.
+            entry = sequence_table[(bit_buffer >> (buffered_bits - table_bits)) & mask]
+            if entry is not None:
+                decoded_bytes += entry[0]
+                buffered_bits -= entry[1]
+            else:
+                bit_buffer, buffered_bits, position = self.read_symbol(data_view, bit_buffer, buffered_bits,
+                                                                       position, decoded_bytes)
+
+        # The codes at the end are resolved one at a time, as the sequences could run past the end.
+        while position * 8 - buffered_bits < end_bit:
+            bit_buffer, buffered_bits, position = self.read_symbol(data_view, bit_buffer, buffered_bits,
+                                                                   position, decoded_bytes)
+
+        # The last code must end at the end.
+        if position * 8 - buffered_bits > end_bit:
+            raise ValueError('Poorly compressed data')
+
+        decompressed_data = bytes(decoded_bytes)
+
+        return decompressed_data
+
+    def read_symbol(self, data_view: memoryview, bit_buffer: int, buffered_bits: int, position: int,
+                    decoded_bytes: bytearray):
+        """Resolves one code and adds its byte to the decoded bytes.
+
+        The bit buffer is refilled until it holds the longest code or all data.
+
+        Args:
+            data_view (memoryview): Codes of the data.
+            bit_buffer (int): Bits starting with the code.
+            buffered_bits (int): Amount of bits in the bit buffer.
+            position (int): Position of the next byte to move into the bit buffer.
+            decoded_bytes (bytearray): Data recovered so far.
+
+        Returns:
+            bit_buffer (int): Bits after the code.
+            buffered_bits (int): Amount of bits in the bit buffer after the code.
+            position (int): Position of the next byte to move into the bit buffer.
+        """
+
+        while buffered_bits < self.maximum_code_length and position < len(data_view):
+            chunk = data_view[position:position + 8]
+            position += len(chunk)
+            bit_buffer = (bit_buffer & ((1 << buffered_bits) - 1)) << 8 * len(chunk) | int.from_bytes(chunk, 'big')
+            buffered_bits += 8 * len(chunk)
+
+        symbol, length = self.find_symbol(bit_buffer=bit_buffer, buffered_bits=buffered_bits)
+        decoded_bytes.append(symbol)
+
+        return bit_buffer, buffered_bits - length, position
+
+    def find_symbol(self, bit_buffer: int, buffered_bits: int):
+        """Resolves one code through the symbol table and the tables for longer codes.
+
+        Args:
+            bit_buffer (int): Bits starting with the code. Bits beyond the buffered ones are taken as zero.
+            buffered_bits (int): Amount of bits in the bit buffer.
+
+        Returns:
+            symbol (int): The byte of the code.
+            length (int): Length of the code.
+
+        Raises:
+            ValueError: If the bits don't start with a code.
+        """
+
+        # Zero bits are added behind the buffered bits, so every table can read its full amount of bits.
+        bit_buffer = (bit_buffer & ((1 << buffered_bits) - 1)) << self.maximum_code_length
+        buffered_bits += self.maximum_code_length
+
+        entry = self.symbol_table
+        depth = 0
+
+        while entry.__class__ is tuple:
+            table_bits, table = entry
+            entry = table[(bit_buffer >> (buffered_bits - depth - table_bits)) & ((1 << table_bits) - 1)]
+            depth += table_bits
+
+        if entry is None:
+            raise ValueError('Poorly compressed data')
+
+        return entry >> 8, entry & 0xFF
+
+
+class AdaptiveHuffmanTree(object):
+    """Huffman tree updated after every data point, following the FGK algorithm.
+
+    Encoder and decoder start with the same tree and update it in the same way, so no codebook is stored.
+    Data points which didn't occur yet are written as the code of the unseen node followed by their 8 bits.
+
+    The nodes are numbered in the order of their weights, the root having the highest number. The numbers are
+    the positions in the lists. When a weight grows, the node is first swapped with the highest numbered node of
+    the same weight, so the order holds. Swapping exchanges the subtrees at both positions.
+
+    Attributes:
+        UNSEEN (int): Entry in self.symbols for the node of data points which didn't occur yet.
+        INTERNAL (int): Entry in self.symbols for nodes with children.
+        ROOT (int): Number of the root node.
+        weights (list): Occurrence for each node.
+        parents (list): Parent for each node.
+        left_children (list): Child reached with bit 0 for each node.
+        right_children (list): Child reached with bit 1 for each node.
+        symbols (list): Data point for each leaf, UNSEEN or INTERNAL for the other nodes.
+        leaves (list): Leaf for each data point. None for data points which didn't occur yet.
+        unseen (int): Number of the node of data points which didn't occur yet.
+    """
+
+    UNSEEN = 256
+    INTERNAL = -1
+    ROOT = 2 * 256
+
+    def __init__(self):
+        """Initiates the tree with the unseen node as its root."""
+
+        node_count = self.ROOT + 1
+
+        self.weights = [0] * node_count
+        self.parents = [None] * node_count
+        self.left_children = [None] * node_count
+        self.right_children = [None] * node_count
+        self.symbols = [self.INTERNAL] * node_count
+        self.leaves = [None] * HuffmanCompression.SYMBOL_COUNT
+
+        self.unseen = self.ROOT
+        self.symbols[self.ROOT] = self.UNSEEN
+
+    def create_code(self, symbol: int):
+        """Finds the current code of a data point.
+
+        Args:
+            symbol (int): Data point to be encoded.
+
+        Returns:
+            code (int): Bits of the code.
+            length (int): Amount of bits of the code.
+        """
+
+        node = self.leaves[symbol]
+        is_unseen = node is None
+        if is_unseen:
+            node = self.unseen
+
+        # The path is followed from the leaf up to the root, so the bits are added in front.
+        code = 0
+        length = 0
+        while node != self.ROOT:
+            parent = self.parents[node]
+            if self.right_children[parent] == node:
+                code |= 1 << length
+            length += 1
+            node = parent
+
+        if is_unseen:
+            code = code << 8 | symbol
+            length += 8
+
+        return code, length
+
+    def update(self, symbol: int):
+        """Counts the occurrence of a data point and restores the order of the nodes.
+
+        Args:
+            symbol (int): Data point which occurred.
+        """
+
+        weights = self.weights
+        parents = self.parents
+
+        node = self.leaves[symbol]
+
+        # The unseen node becomes a parent of the new leaf and of the new unseen node.
+        if node is None:
+            node = self.unseen
+            leaf = node - 1
+            self.unseen = node - 2
+
+            self.symbols[node] = self.INTERNAL
+            self.symbols[leaf] = symbol
+            self.symbols[self.unseen] = self.UNSEEN
+            self.left_children[node] = self.unseen
+            self.right_children[node] = leaf
+            parents[leaf] = parents[self.unseen] = node
+            weights[leaf] = 1
+            self.leaves[symbol] = leaf
+
+        while True:
+            # Nodes of the same weight are numbered one after another.
+            leader = node
+            weight = weights[node]
+            while leader < self.ROOT and weights[leader + 1] == weight:
+                leader += 1
+
+            if leader != node and leader != parents[node]:
+                self.swap_nodes(node, leader)
+                node = leader
+
+            weights[node] += 1
+
+            if node == self.ROOT:
+                break
+
+            node = parents[node]
+
+    def swap_nodes(self, first: int, second: int):
+        """Exchanges the subtrees of two nodes of the same weight.
+
+        Args:
+            first (int): Number of the first node.
+            second (int): Number of the second node.
+        """
+
+        symbols = self.symbols
+        left_children = self.left_children
+        right_children = self.right_children
+
+        symbols[first], symbols[second] = symbols[second], symbols[first]
+        left_children[first], left_children[second] = left_children[second], left_children[first]
+        right_children[first], right_children[second] = right_children[second], right_children[first]
+
+        # The moved subtrees are linked to their new positions.
+        for node in (first, second):
+            if symbols[node] == self.INTERNAL:
+                self.parents[left_children[node]] = self.parents[right_children[node]] = node
+            else:
+                self.leaves[symbols[node]] = node
+
+
+class AdaptiveHuffmanEncoder(object):
+    """Incremental encoder of the adaptive Huffman mode.
+
+    The data is passed in chunks of any size to self.feed(), which returns the compressed data completed so far.
+    self.flush() ends the stream. The data is read only once and nothing is stored ahead of the codes,
+    so data from a pipe can be encoded as it arrives.
+
+    The output starts with the format byte. The codes follow starting with the most significant bit and are padded
+    with zeros to a whole byte. The last byte holds the amount of padding bits.
+
+    Attributes:
+        tree (AdaptiveHuffmanTree): Tree with the current codes.
+        header_written (bool): Tracks if the format byte is already in the output.
+        bit_buffer (int): Bits not yet written as whole bytes.
+        buffered_bits (int): Amount of bits in the bit buffer.
+    """
+
+    def __init__(self):
+        """Initiates an instance of the encoder."""
+
+        self.tree = AdaptiveHuffmanTree()
+        self.header_written = False
+        self.bit_buffer = 0
+        self.buffered_bits = 0
+
+    def feed(self, uncompressed_data: bytes):
+        """Encodes the next chunk of the data.
+
+        Args:
+            uncompressed_data (bytes): Chunk of the data to be compressed.
+
+        Returns:
+            compressed_data (bytes): Compressed data completed with this chunk. It may be empty.
+        """
+
+        compressed_data = bytearray()
+
+        if not self.header_written:
+            compressed_data.append(HuffmanCompression.ADAPTIVE_CODES)
+            self.header_written = True
+
+        create_code = self.tree.create_code
+        update = self.tree.update
+        bit_buffer = self.bit_buffer
+        buffered_bits = self.buffered_bits
+
+        for symbol in uncompressed_data:
+            code, length = create_code(symbol)
+            update(symbol)
+
+            bit_buffer = bit_buffer << length | code
+            buffered_bits += length
+
+            if buffered_bits >= 64:
+                buffered_bits -= 64
+                compressed_data += (bit_buffer >> buffered_bits).to_bytes(8, 'big')
+                bit_buffer &= (1 << buffered_bits) - 1
+
+        # Whole bytes are written, the rest waits for the next chunk.
+        whole_bytes = buffered_bits // 8
+        buffered_bits -= whole_bytes * 8
+        compressed_data += (bit_buffer >> buffered_bits).to_bytes(whole_bytes, 'big')
+        self.bit_buffer = bit_buffer & ((1 << buffered_bits) - 1)
+        self.buffered_bits = buffered_bits
+
+        return bytes(compressed_data)
+
+    def flush(self):
+        """Ends the stream.
+
+        Returns:
+            compressed_data (bytes): The rest of the compressed data.
+        """
+
+        compressed_data = bytearray(self.feed(b''))
+
+        # The remaining bits are padded with zeros to a whole byte.
+        padding = -self.buffered_bits % 8
+        if self.buffered_bits:
+            compressed_data.append(self.bit_buffer << padding)
+        compressed_data.append(padding)
+
+        self.bit_buffer = 0
+        self.buffered_bits = 0
+
+        return bytes(compressed_data)
+
+
+class AdaptiveHuffmanDecoder(object):
+    """Incremental decoder of the adaptive Huffman mode.
+
+    The compressed data is passed in chunks of any size to self.feed(), which returns the original data recovered
+    so far. self.flush() ends the stream. The last two bytes hold the padding and its amount, so they are kept
+    until the end of the stream is known.
+
+    Attributes:
+        HELD_BYTES (int): Amount of bytes at the end of the data received so far which are kept until the next chunk.
+        tree (AdaptiveHuffmanTree): Tree with the current codes.
+        header_read (bool): Tracks if the format byte is already read.
+        pending_data (bytes): Compressed data not yet decoded.
+        bit_position (int): Amount of bits of the pending data which are already decoded.
+    """
+
+    HELD_BYTES = 2
+
+    def __init__(self):
+        """Initiates an instance of the decoder."""
+
+        self.tree = AdaptiveHuffmanTree()
+        self.header_read = False
+        self.pending_data = b''
+        self.bit_position = 0
+
+    def feed(self, compressed_data: bytes):
+        """Decodes the next chunk of the compressed data.
+
+        Args:
+            compressed_data (bytes): Chunk of the compressed data.
+
+        Returns:
+            decompressed_data (bytes): Original data recovered with this chunk. It may be empty.
+
+        Raises:
+            ValueError: If the data doesn't start with the format byte of the adaptive mode.
+        """
+
+        pending_data = self.pending_data + compressed_data
+
+        if not self.header_read and pending_data:
+            if pending_data[0] != HuffmanCompression.ADAPTIVE_CODES:
+                raise ValueError('Unsupported compressed data')
+            pending_data = pending_data[1:]
+            self.header_read = True
+
+        # The held bytes may be the padding and its amount.
+        bit_count = max(len(pending_data) - self.HELD_BYTES, 0) * 8
+
+        decompressed_data = self.recover_data(pending_data=pending_data, bit_count=bit_count)
+
+        # Decoded whole bytes are dropped.
+        self.pending_data = pending_data[self.bit_position >> 3:]
+        self.bit_position &= 7
+
+        return decompressed_data
+
+    def flush(self):
+        """Ends the stream.
+
+        Returns:
+            decompressed_data (bytes): The rest of the original data.
+
+        Raises:
+            ValueError: If the compressed data is incomplete or ends inside a code.
+        """
+
+        pending_data = self.pending_data
+
+        if not self.header_read or not pending_data:
+            raise ValueError('Incomplete compressed data')
+
+        # The last byte holds the amount of padding bits before it.
+        bit_count = (len(pending_data) - 1) * 8 - pending_data[-1]
+
+        decompressed_data = self.recover_data(pending_data=pending_data, bit_count=bit_count)
+
+        if self.bit_position != bit_count:
+            raise ValueError('Incomplete compressed data')
+
+        self.pending_data = b''
+        self.bit_position = 0
+
+        return decompressed_data
+
+    def recover_data(self, pending_data: bytes, bit_count: int):
+        """Main decoding algorithm.
+
+        The tree is followed bit after bit from the root to a leaf. A code which is not complete within
+        the available bits is decoded again when more data arrives.
+
+        Args:
+            pending_data (bytes): Compressed data not yet decoded, starting with the already decoded bits.
+            bit_count (int): Amount of bits of the pending data available for decoding.
+
+        Returns:
+            decompressed_data (bytes): Original data recovered from the available bits. The position of the first
+                code not decoded is kept in self.bit_position.
+        """
+
+        tree = self.tree
+        symbols = tree.symbols
+        left_children = tree.left_children
+        right_children = tree.right_children
+        update = tree.update
+        root = tree.ROOT
+        unseen = tree.UNSEEN
+
+        decompressed_data = bytearray()
+        position = self.bit_position
+
+        while True:
+            code_start = position
+            node = root
+
+            while symbols[node] < 0 and position < bit_count:
+                bit = pending_data[position >> 3] >> (~position & 7) & 1
+                position += 1
+                node = right_children[node] if bit else left_children[node]
+
+            symbol = symbols[node]
+
+            # The code is not complete within the available bits.
+            if symbol < 0:
+                break
+
+            # A new data point follows as 8 bits.
+            if symbol == unseen:
+                if position + 8 > bit_count:
+                    break
+                index = position >> 3
+                next_byte = pending_data[index + 1] if index + 1 < len(pending_data) else 0
+                symbol = (pending_data[index] << 8 | next_byte) >> (8 - (position & 7)) & 0xFF
+                position += 8
+
+            decompressed_data.append(symbol)
+            update(symbol)
+
+        self.bit_position = code_start
+
+        return bytes(decompressed_data)
+
+
+class BinaryTree(object):
+    """Creates a Huffman tree and a codebook out of it.
+
+    It is used in the HuffmanCompression class.
+    The codebook is built from lists of integers instead of Node objects. The data points sorted by their occurrence
+    and the merged nodes, which are created in increasing order of occurrence, form two queues. The code lengths
+    follow from the depths of the nodes and are assigned canonical codes, so the same frequencies always give
+    the same codebook. The step by step methods with Node objects and heapq show the classic construction.
+    With a maximum code length, codes from the tree which are too long are replaced by codes of limited length,
+    which are optimal under this limit. They are found with the package-merge algorithm.
+
+    Attributes:
+        PARALLEL_COUNT_SIZE (int): Data from this size on is counted by several processes.
+        SAMPLE_SIZE (int): Size of the beginning of the data which is checked for the amount of different data points.
+        FEW_DATA_POINTS (int): Up to this amount of different data points, the data is searched for each of them.
+        heap (list): Contains priority queue of nodes with the lowest occurrence values in the front. Managed by heapq.
+        codebook (dict): Codebook with codes generated from the Huffman tree.
+        maximum_code_length (None/int): Upper limit for the code length. None for no limit.
+    """
+
+    PARALLEL_COUNT_SIZE = 1 << 25
+    SAMPLE_SIZE = 1 << 16
+    FEW_DATA_POINTS = 32
+
+    def __init__(self, maximum_code_length=None):
+        """Initiates an instance of the binary tree.
+
+        Args:
+            maximum_code_length (None/int): Upper limit for the code length. None for no limit.
+        """
+
+        self.heap = []
+        self.maximum_code_length = maximum_code_length
+
+        # k:v data(int):code(str) used for compression.
+        # FIXME: Doesn't this belong to the HuffmanCompression class?
+        self.codebook = {}
+
+    def create_codebook(self, uncompressed_data: bytes):
+        # FIXME: This method belongs to the HuffmanCompression class (see also this class' docstring).
+
+        """Based on frequency of occurrence a code is assigned to the original data points.
+
+        This is the first of two passes of the Huffman algorithm over the data.
+        This method makes use of the other methods in the class to perform its function step by step.
+
+        Args:
+            uncompressed_data (bytes): Data to be converted to code.
+
+        Returns:
+            codebook (dict): Codebook with codes generated from the Huffman tree.
+        """
+
+        # FIXME: Change to name to statistics, symbol_frequencies, etc.
+        frequency = self.create_frequency_dict(input_data=uncompressed_data)
+
+        return self.create_codebook_from_frequency(frequency=frequency)
+
+    def create_codebook_from_frequency(self, frequency: dict):
+        """Assigns a code to the data points based on their already counted frequency of occurrence.
+
+        Args:
+            frequency (dict): Contains frequency of occurrence for individual input data points.
+
+        Returns:
+            codebook (dict): Codebook with codes generated from the Huffman tree.
+        """
+
+        code_lengths = self.create_code_lengths(frequency=frequency)
+        code_lengths = self.limit_code_lengths(frequency=frequency, code_lengths=code_lengths)
+        self.codebook = self.create_canonical_codebook(code_lengths=code_lengths)
+
+        return self.codebook
+
+    @staticmethod
+    def create_code_lengths(frequency: dict):
+        """Finds the code lengths of the Huffman tree with two queues.
+
+        The data points are sorted by their occurrence, ties by their value. The two nodes with the least occurrence
+        are taken from the fronts of the sorted data points and of the merged nodes, preferring data points on ties.
+        Their parent is added to the end of the merged nodes, as every parent has at least the occurrence of
+        the parent before. The nodes are numbered in the order of creation, so the depths are assigned from the root
+        backwards without recursion.
+
+        Args:
+            frequency (dict): Contains frequency of occurrence for individual input data points.
+
+        Returns:
+            code_lengths (dict): Code length for each data point.
+        """
+
+        symbols = sorted(frequency, key=lambda symbol: (frequency[symbol], symbol))
+        leaf_count = len(symbols)
+
+        # A single data point still needs a code of one bit.
+        if leaf_count < 2:
+            return dict.fromkeys(symbols, 1)
+
+        node_count = 2 * leaf_count - 1
+        occurrences = [frequency[symbol] for symbol in symbols] + [0] * (leaf_count - 1)
+        parents = [0] * node_count
+
+        next_leaf = 0
+        next_merged = leaf_count
+        for parent in range(leaf_count, node_count):
+            for _ in range(2):
+                if next_leaf < leaf_count and (next_merged == parent or
+                                               occurrences[next_leaf] <= occurrences[next_merged]):
+                    child = next_leaf
+                    next_leaf += 1
+                else:
+                    child = next_merged
+                    next_merged += 1
+
+                occurrences[parent] += occurrences[child]
+                parents[child] = parent
+
+        # Parents have higher numbers than their children, the root the highest.
+        depths = [0] * node_count
+        for node in range(node_count - 2, -1, -1):
+            depths[node] = depths[parents[node]] + 1
+
+        code_lengths = dict(zip(symbols, depths))
+
+        return code_lengths
+
+    @classmethod
+    def create_frequency_dict(cls, input_data: bytes):
+        # FIXME: This method could be private or protected.
+
+        """Determines how many times each element from the input data occurred.
+
+        This is the first pass over the complete data. The occurrence determines how far in the front
+        of the priority que a node is stored.
+        Large data is counted in parts by several processes.
+
+        Args:
+            input_data (bytes): Data to be converted to code.
+
+        Returns:
+            frequency (dict): Contains frequency of occurrence for individual input data points.
+        """
+
+        if len(input_data) >= cls.PARALLEL_COUNT_SIZE and (os.cpu_count() or 1) > 1:
+            counts = cls.count_bytes_in_parallel(input_data=input_data)
+        else:
+            counts = cls.count_bytes(input_data=input_data)
+
+        # frequency dict k:v data:occurrence, in the order of the data points.
+        frequency = {byte: count for byte, count in enumerate(counts) if count}
+
+        return frequency
+
+    @classmethod
+    def count_bytes(cls, input_data: bytes):
+        """Counts the occurrence of every possible data point with loops in C instead of Python.
+
+        NumPy counts all data points in one pass, if it is installed. Otherwise, data with few different data points,
+        judged from its beginning, is searched once for each of them. Other data is counted with a Counter.
+
+        Args:
+            input_data (bytes/memoryview): Data to be counted.
+
+        Returns:
+            counts (list): Occurrence for each possible data point.
+        """
+
+        if numpy is not None:
+            return numpy.bincount(numpy.frombuffer(input_data, dtype=numpy.uint8), minlength=256).tolist()
+
+        # A memoryview has no count(), so the data is copied to bytes once.
+        input_data = bytes(input_data)
+
+        if len(set(input_data[:cls.SAMPLE_SIZE])) <= cls.FEW_DATA_POINTS:
+            counts = [0] * 256
+            for byte in set(input_data):
+                counts[byte] = input_data.count(byte)
+            return counts
+
+        counter = Counter(input_data)
+        counts = [counter[byte] for byte in range(256)]
+
+        return counts
+
+    @classmethod
+    def count_bytes_in_parallel(cls, input_data: bytes):
+        """Splits the data in one part per processor and counts the parts in separate processes.
+
+        Args:
+            input_data (bytes): Data to be counted.
+
+        Returns:
+            counts (list): Occurrence for each possible data point.
+        """
+
+        process_count = os.cpu_count()
+        part_size = -(-len(input_data) // process_count)
+        parts = [input_data[i:i + part_size] for i in range(0, len(input_data), part_size)]
+
+        with ProcessPoolExecutor(max_workers=process_count) as executor:
+            part_counts = list(executor.map(cls.count_bytes, parts))
+
+        counts = [sum(byte_counts) for byte_counts in zip(*part_counts)]
+
+        return counts
+
+    def create_heap(self, frequency: dict):
+        # FIXME: This method could be private or protected.
+
+        """Fills the priority queue with elements.
+
+        Nodes are stored in the priority queue as preparation for the tree creation.
+
+        Args:
+            frequency (dict): Contains frequency of occurrence for individual input data points.
         """
 
         for key in frequency:
             node = Node(key, frequency[key])
 
-            # Push the value item onto the heap, maintaining the heap invariant.
-            heapq.heappush(self.heap, node)
+            # Push the value item onto the heap, maintaining the heap invariant.
+            heapq.heappush(self.heap, node)
+
+    def create_tree(self):
+        # FIXME: Do not repeate words from the namespaces, why BinaryTree.create_tree()? Could we
+        #   use BinaryTree.create() instead?
+
+        """Connects individual nodes.
+
+        For two nodes with the lowest occurrence one parent is created with the sum of their occurrences.
+        The process is repeated until one parent/root node is left.
+        """
+
+        # In the last loop only two nodes will be left, so all nodes are regarded.
+        while len(self.heap) > 1:
+
+            # Takes out of the heap the two nodes with the least occurrence, maintaining the heap invariant.
+            node_1 = heapq.heappop(self.heap)
+            node_2 = heapq.heappop(self.heap)
+
+            # Creates a new node in the tree with occurrence level the sum of its child nodes.
+            # This node doesn't have any character info.
+            merged = Node(None, node_1.occurrence + node_2.occurrence)
+            merged.left_child = node_1
+            merged.right_child = node_2
+
+            # Returns the new node in the priority que for further use.
+            heapq.heappush(self.heap, merged)
+            # The root node:
+            # At the end the priority que will have only one node with the largest number of occurrence.
+
+    def initiate_create_codes(self):
+        # FIXME: Why we need a separate function for this? Why not implement it in other places
+        #   such as create_codes or the constructor?
+
+        """Starts the recursion for creation of codes."""
+
+        # Creates initial parameters for the recursion.
+        # A tree of a single data point is its root, which still needs a code of one bit.
+        root = heapq.heappop(self.heap)
+        current_code = "" if root.left_child or root.right_child else "0"
+
+        # Calls the recursion.
+        self.create_codes(root, current_code)
+
+    def create_codes(self, root, current_code: str):
+        # FIXME:  The root is a state of the instance, why we need it here?
+
+        """Generates codes by traversing the entire tree.
+
+        Args:
+            root (Node): Building block for the Huffman tree.
+            current_code (str): Contains the code for individual occurrences/datapoints.
+        """
+        # Recursion end condition:
+        # When bottom of the tree is reached - data containing nodes don't have children.
+        if root is None:
+            return None
+
+        # Activates only if the node is data containing, not only holding occurrence amount.
+        if root.byte or root.byte == 0:
+            # Used for encoding k:v character:code.
+            self.codebook[root.byte] = current_code
+            return
+
+        # Navigation adds to the code 0 for going to the left child and 1 for going to the right child.
+        self.create_codes(root.left_child, current_code + "0")
+        self.create_codes(root.right_child, current_code + "1")
+
+    def limit_code_lengths(self, frequency: dict, code_lengths: dict):
+        """Replaces the code lengths with limited ones, if the tree created longer codes.
+
+        Args:
+            frequency (dict): Contains frequency of occurrence for individual input data points.
+            code_lengths (dict): Code length for each data point from the tree.
+
+        Returns:
+            code_lengths (dict): Code length for each data point within the maximum code length.
+
+        Raises:
+            ValueError: If there are more data points than codes of the maximum code length.
+        """
+
+        if self.maximum_code_length is None or max(code_lengths.values(), default=0) <= self.maximum_code_length:
+            return code_lengths
+
+        if 1 << self.maximum_code_length < len(frequency):
+            raise ValueError(f'Too many data points for the maximum code length: {self.maximum_code_length}')
+
+        code_lengths = self.create_limited_code_lengths(frequency=frequency,
+                                                        maximum_code_length=self.maximum_code_length)
+
+        return code_lengths
+
+    @staticmethod
+    def create_limited_code_lengths(frequency: dict, maximum_code_length: int):
+        """Finds the optimal code lengths under the maximum code length with the package-merge algorithm.
+
+        The data points are nodes sorted by their occurrence. In each of maximum_code_length - 1 rounds, neighbouring
+        nodes of the previous list are packaged in pairs, and the packages are merged into a copy of the data point
+        nodes by their occurrence. The first 2 * (amount of data points - 1) nodes of the last list are chosen. The code
+        length of a data point is how often it is contained in them.
+
+        Args:
+            frequency (dict): Contains frequency of occurrence for individual input data points.
+            maximum_code_length (int): Upper limit for the code length.
+
+        Returns:
+            code_lengths (dict): Code length for each data point.
+        """
+
+        leaves = sorted((Node(byte, occurrence) for byte, occurrence in frequency.items()),
+                        key=lambda node: (node.occurrence, node.byte))
+        nodes = leaves
+
+        for _ in range(maximum_code_length - 1):
+            packages = []
+            for i in range(0, len(nodes) - 1, 2):
+                package = Node(None, nodes[i].occurrence + nodes[i + 1].occurrence)
+                package.left_child = nodes[i]
+                package.right_child = nodes[i + 1]
+                packages.append(package)
+
+            # The sort is stable, so data points come before packages with the same occurrence.
+            nodes = sorted(leaves + packages, key=lambda node: node.occurrence)
+
+        # Every appearance of a data point in the chosen nodes adds one bit to its code.
+        code_lengths = dict.fromkeys(frequency, 0)
+        stack = nodes[:2 * (len(leaves) - 1)]
+        while stack:
+            node = stack.pop()
+            if node.byte is None:
+                stack.append(node.left_child)
+                stack.append(node.right_child)
+            else:
+                code_lengths[node.byte] += 1
+
+        return code_lengths
+
+    def create_canonical_codes(self):
+        """Replaces the codes from the tree with canonical codes of the same lengths.
+
+        The lengths of the codes decide about the compression, so the canonical codes compress equally well.
+        As they follow from the lengths alone, only the lengths need to be stored with the compressed data.
+        """
+
+        code_lengths = {byte: len(code) for byte, code in self.codebook.items()}
+        self.codebook = self.create_canonical_codebook(code_lengths=code_lengths)
+
+    @staticmethod
+    def create_canonical_codebook(code_lengths: dict):
+        """Assigns canonical codes to the data points.
+
+        The data points are sorted by the length of their code and by their value. The first one gets the code of
+        only zeros, each following one the next binary number, extended with zeros when the length grows.
+        A code without bits stays without bits.
+
+        Args:
+            code_lengths (dict): Code length for each data point.
+
+        Returns:
+            codebook (dict): Codebook with the canonical codes.
+
+        Raises:
+            ValueError: If there are too many short codes for a prefix code.
+        """
+
+        # k:v data(int):code(str)
+        codebook = {}
+        code = 0
+        previous_length = 0
+
+        for byte, length in sorted(code_lengths.items(), key=lambda item: (item[1], item[0])):
+            if not length:
+                codebook[byte] = ""
+                continue
+
+            code <<= length - previous_length
+            previous_length = length
+
+            if code >> length:
+                raise ValueError('Code lengths exceed the possible codes')
+
+            codebook[byte] = f"{code:0{length}b}"
+            code += 1
+
+        return codebook
+
+
+class Node(object):
+    # FIXME: Belongs to HuffmanTree or BinaryTree?
+
+    """Nodes are building blocks of the Huffman tree.
+
+    Node is used in the BinaryTree.
+
+    Attributes:
+        byte (None, bytes): Datapoint from the original data.
+        occurrence (int): How many times the datapoint appears in the uncompressed data.
+        left_child (Node, None): Node lower in the tree structure if any.
+        right_child (Node, None): Node lower in the tree structure if any.
+    """
+
+    def __init__(self, byte: [None, bytes], occurrence: int):
+        """Initiates an instance of the Node."""
+
+        # Note: self.create_frequency_dict changed the byte to an int.
+        self.byte = byte
+        self.occurrence = occurrence
+        self.left_child = None
+        self.right_child = None
+
+    # Comparison base is defined for use by the heapq module in the BinaryTree class.
+    def __lt__(self, other):
+        return self.occurrence < other.occurrence
+
+    def __eq__(self, other):
+        if other is None:
+            return False
+        if not isinstance(other, Node):
+            return False
+        return self.occurrence == other.occurrence
+
+
+class RANSCompression(CompressionABC):
+    """Range asymmetric numeral system (rANS) compression algorithm.
+
+    The occurrences of the bytes are scaled to probabilities with a fixed amount of bits. The encoder packs the data
+    into a single integer state, which grows by about the information of each byte, and moves whole bytes from the
+    state to the output when it would exceed its range. It works from the last byte to the first, so the decoder
+    recovers the data from the first byte on. The decoder resolves each byte with one lookup in a table with
+    an entry for every probability slot. Unlike the whole bits of Huffman codes, the probabilities give
+    compression close to the entropy of the data, especially for skewed data.
+
+    The compressed data starts with the length of the original data and the scaled occurrences.
+
+    Attributes:
+        PROBABILITY_BITS (int): The scaled occurrences of all bytes add up to 2 ** PROBABILITY_BITS.
+        LOWER_BOUND (int): The state is kept between LOWER_BOUND and 256 * LOWER_BOUND.
+        STATE_BYTES (int): Amount of bytes holding the final state of the encoder.
+        LENGTH_BYTES (int): Amount of bytes holding the length of the original data.
+        LISTED_FREQUENCIES (int): Header format byte for the scaled occurrences stored with their data points.
+        ALL_FREQUENCIES (int): Header format byte for the scaled occurrences of all possible bytes.
+        SYMBOL_COUNT (int): Amount of possible data points.
+    """
+
+    PROBABILITY_BITS = 14
+    LOWER_BOUND = 1 << 23
+    STATE_BYTES = 4
+    LENGTH_BYTES = 8
+    LISTED_FREQUENCIES = 0
+    ALL_FREQUENCIES = 1
+    SYMBOL_COUNT = 256
+
+    def encode(self, uncompressed_data: bytes):
+        """Will compress bytes input to bytes output.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+
+        Returns:
+            encoded_data (bytes): Compressed data with the scaled occurrences in the header.
+        """
+
+        header = len(uncompressed_data).to_bytes(self.LENGTH_BYTES, "little")
+
+        if not uncompressed_data:
+            return header
+
+        frequency = self.scale_frequency(frequency=BinaryTree.create_frequency_dict(input_data=uncompressed_data))
+        header += self.create_header(frequency=frequency)
+
+        # Per byte: the state limit before the byte is added and the start of its probability slots.
+        probability_bits = self.PROBABILITY_BITS
+        limit_factor = (self.LOWER_BOUND >> probability_bits) << 8
+        symbol_table = [None] * self.SYMBOL_COUNT
+        start = 0
+        for symbol, occurrence in frequency.items():
+            symbol_table[symbol] = occurrence, limit_factor * occurrence, start
+            start += occurrence
+
+        # The output is collected backwards, as the decoder reads it in the opposite order.
+        reversed_output = bytearray()
+        state = self.LOWER_BOUND
+
+        for symbol in reversed(uncompressed_data):
+            occurrence, state_limit, start = symbol_table[symbol]
+
+            while state >= state_limit:
+                reversed_output.append(state & 0xFF)
+                state >>= 8
+
+            state = (state // occurrence << probability_bits) + state % occurrence + start
+
+        reversed_output += state.to_bytes(self.STATE_BYTES, "little")
+        reversed_output.reverse()
+
+        encoded_data = header + reversed_output
+
+        return encoded_data
+
+    def decode(self, compressed_data: bytes):
+        """Will decompress bytes input to bytes output.
+
+        Args:
+            compressed_data (bytes): Data to be decoded.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+
+        Raises:
+            ValueError: If the compressed data is incomplete or was not created with the same header.
+        """
+
+        if len(compressed_data) < self.LENGTH_BYTES:
+            raise ValueError('Incomplete compressed data')
+
+        data_length = int.from_bytes(compressed_data[:self.LENGTH_BYTES], "little")
+
+        if not data_length:
+            return b''
+
+        frequency, header_size = self.read_header(compressed_data=compressed_data[self.LENGTH_BYTES:])
+        position = self.LENGTH_BYTES + header_size
+
+        if len(compressed_data) < position + self.STATE_BYTES:
+            raise ValueError('Incomplete compressed data')
+
+        # Each probability slot leads to its byte, the occurrence of the byte and the start of its slots.
+        slot_table = []
+        start = 0
+        for symbol, occurrence in frequency.items():
+            slot_table += [(symbol, occurrence, start)] * occurrence
+            start += occurrence
+
+        # Local names avoid attribute lookups in the loop below.
+        probability_bits = self.PROBABILITY_BITS
+        mask = (1 << probability_bits) - 1
+        lower_bound = self.LOWER_BOUND
+        data_view = memoryview(compressed_data)
+
+        state = int.from_bytes(data_view[position:position + self.STATE_BYTES], "big")
+        position += self.STATE_BYTES
+        last_position = len(data_view)
+
+        decoded_bytes = bytearray(data_length)
+
+        try:
+            for index in range(data_length):
+                symbol, occurrence, start = slot_table[state & mask]
+                decoded_bytes[index] = symbol
+                state = occurrence * (state >> probability_bits) + (state & mask) - start
+
+                while state < lower_bound:
+                    state = state << 8 | data_view[position]
+                    position += 1
+        except IndexError:
+            # The encoder wrote every byte the decoder reads, so only missing data ends up here.
+            raise ValueError('Incomplete compressed data')
+
+        if state != lower_bound or position != last_position:
+            raise ValueError('Poorly compressed data')
+
+        decompressed_data = bytes(decoded_bytes)
+
+        return decompressed_data
+
+    @classmethod
+    def scale_frequency(cls, frequency: dict):
+        """Scales the occurrences so they add up to 2 ** PROBABILITY_BITS.
+
+        Every occurring byte keeps an occurrence of at least one. The rounding difference is taken from or given to
+        the bytes with the largest occurrences, where it changes the probabilities the least.
+
+        Args:
+            frequency (dict): Contains frequency of occurrence for individual input data points.
+
+        Returns:
+            scaled_frequency (dict): Scaled occurrence for each occurring data point, in the order of the data points.
+        """
+
+        total = sum(frequency.values())
+        scale = 1 << cls.PROBABILITY_BITS
+
+        scaled_frequency = {symbol: max(occurrence * scale // total, 1) for symbol, occurrence
+                            in sorted(frequency.items())}
+        difference = scale - sum(scaled_frequency.values())
+
+        largest_first = sorted(scaled_frequency, key=lambda symbol: (-scaled_frequency[symbol], symbol))
+        if difference > 0:
+            scaled_frequency[largest_first[0]] += difference
+
+        while difference < 0:
+            for symbol in largest_first:
+                if scaled_frequency[symbol] > 1 and difference < 0:
+                    scaled_frequency[symbol] -= 1
+                    difference += 1
+
+        return scaled_frequency
+
+    @classmethod
+    def create_header(cls, frequency: dict):
+        """Stores the scaled occurrences in front of the compressed data.
+
+        The header starts with the format byte. For data with few different bytes it is followed by their amount
+        minus one and each of them with its scaled occurrence. Otherwise, the scaled occurrence of every possible
+        data point follows, zero for data points which don't occur. Occurrences below 128 take one byte, larger
+        ones two bytes with the highest bit set in the first one.
+
+        Args:
+            frequency (dict): Scaled occurrence for each occurring data point.
+
+        Returns:
+            header (bytes): The scaled occurrences in stored form, whichever format is shorter.
+        """
+
+        listed_header = bytearray([cls.LISTED_FREQUENCIES, len(frequency) - 1])
+        for symbol, occurrence in frequency.items():
+            listed_header.append(symbol)
+            listed_header += cls.pack_occurrence(occurrence=occurrence)
+
+        header = bytearray([cls.ALL_FREQUENCIES])
+        for symbol in range(cls.SYMBOL_COUNT):
+            header += cls.pack_occurrence(occurrence=frequency.get(symbol, 0))
+
+        return bytes(min(listed_header, header, key=len))
+
+    @staticmethod
+    def pack_occurrence(occurrence: int):
+        """Stores a scaled occurrence in one or two bytes.
+
+        Args:
+            occurrence (int): Scaled occurrence below 2 ** 15.
+
+        Returns:
+            packed_occurrence (bytes): The occurrence in stored form.
+        """
+
+        if occurrence < 0x80:
+            return bytes([occurrence])
+
+        return bytes([0x80 | occurrence >> 8, occurrence & 0xFF])
+
+    @classmethod
+    def read_header(cls, compressed_data: bytes):
+        """Reads the scaled occurrences from the header.
+
+        Args:
+            compressed_data (bytes): Compressed data starting with the header.
+
+        Returns:
+            frequency (dict): Scaled occurrence for each occurring data point, in the order of the data points.
+            header_size (int): Amount of bytes of the header.
+
+        Raises:
+            ValueError: If the header format is unknown, the header is incomplete or
+                the scaled occurrences don't add up.
+        """
+
+        header_format = compressed_data[0] if compressed_data else None
+
+        try:
+            if header_format == cls.LISTED_FREQUENCIES:
+                symbols = []
+                position = 2
+                for _ in range(compressed_data[1] + 1):
+                    symbols.append(compressed_data[position])
+                    position += 1
+                    occurrence, position = cls.unpack_occurrence(compressed_data=compressed_data, position=position)
+                    symbols.append(occurrence)
+                frequency = dict(zip(symbols[::2], symbols[1::2]))
+
+            elif header_format == cls.ALL_FREQUENCIES:
+                frequency = {}
+                position = 1
+                for symbol in range(cls.SYMBOL_COUNT):
+                    frequency[symbol], position = cls.unpack_occurrence(compressed_data=compressed_data,
+                                                                        position=position)
+
+            else:
+                raise ValueError('Unsupported compressed data')
+
+        except IndexError:
+            raise ValueError('Incomplete compressed data')
+
+        frequency = {symbol: occurrence for symbol, occurrence in sorted(frequency.items()) if occurrence}
+
+        if sum(frequency.values()) != 1 << cls.PROBABILITY_BITS:
+            raise ValueError('Poorly compressed data')
+
+        return frequency, position
+
+    @staticmethod
+    def unpack_occurrence(compressed_data: bytes, position: int):
+        """Reads a scaled occurrence stored in one or two bytes.
+
+        Args:
+            compressed_data (bytes): Compressed data containing the occurrence.
+            position (int): Position of the first byte of the occurrence.
+
+        Returns:
+            occurrence (int): The scaled occurrence.
+            position (int): Position after the occurrence.
+        """
+
+        occurrence = compressed_data[position]
+
+        if occurrence < 0x80:
+            return occurrence, position + 1
+
+        return (occurrence & 0x7F) << 8 | compressed_data[position + 1], position + 2
+
+
+class LZSSCompression(CompressionABC):
+    """LZSS compression algorithm.
+
+    Repeated sequences are replaced by the offset and the length of their previous occurrence within a sliding
+    window. Bytes without a long enough match stay literal. A flag byte in front of every eight tokens tells with
+    one bit per token, starting with the lowest bit, if the token is a match. A literal takes one byte, a match
+    takes two bytes of offset and one byte of length.
+
+    Matches are found through hash chains. The positions of the data are linked by their first three bytes,
+    the most recent first, and the chain of the current position is searched up to the search depth. The decoding
+    copies previous output and is much faster than the encoding.
+
+    Attributes:
+        WINDOW_SIZE (int): Matches are searched among the previous WINDOW_SIZE - 1 bytes.
+        MINIMUM_MATCH_LENGTH (int): Shorter matches are written as literals.
+        MAXIMUM_MATCH_LENGTH (int): Longest match, limited by the length byte.
+        COMPARED_BYTES (int): Amount of bytes compared at once when a match is extended.
+        search_depth (int): Amount of previous positions checked for a match at each position.
+    """
+
+    WINDOW_SIZE = 1 << 16
+    MINIMUM_MATCH_LENGTH = 3
+    MAXIMUM_MATCH_LENGTH = 258
+    COMPARED_BYTES = 16
+
+    def __init__(self, search_depth=16):
+        """Initiates an instance of the LZSS algorithm.
+
+        Args:
+            search_depth (int): Amount of previous positions checked for a match at each position. Deep searches
+                find longer matches for better compression, at the cost of slower encoding.
+
+        Raises:
+            ValueError: If the search depth is not positive.
+        """
+
+        if search_depth < 1:
+            raise ValueError(f'Unsupported search depth: {search_depth}')
+
+        self.search_depth = search_depth
+
+    def encode(self, uncompressed_data: bytes):
+        """Will compress bytes input to bytes output.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+
+        Returns:
+            encoded_data (bytes): Literals and matches with their flag bytes.
+        """
+
+        data = bytes(uncompressed_data)
+        data_length = len(data)
+
+        # Local names avoid attribute lookups in the loop below.
+        window_mask = self.WINDOW_SIZE - 1
+        minimum_length = self.MINIMUM_MATCH_LENGTH
+        compared_bytes = self.COMPARED_BYTES
+
+        # Most recent position for each three bytes and, for each position in the window, the previous one.
+        heads = {}
+        chain = [-1] * self.WINDOW_SIZE
+
+        encoded_data = bytearray()
+        flag_position = 0
+        flag_bit = 8
+
+        # Positions from which three bytes are left.
+        last_hashed = data_length - minimum_length
+        position = 0
+
+        while position < data_length:
+
+            if flag_bit == 8:
+                flag_position = len(encoded_data)
+                encoded_data.append(0)
+                flag_bit = 0
+
+            best_length = 0
+            best_candidate = 0
+
+            if position <= last_hashed:
+                maximum_length = min(self.MAXIMUM_MATCH_LENGTH, data_length - position)
+                window_start = max(position - window_mask, 0)
+                candidate = heads.get(data[position:position + minimum_length], -1)
+                depth = self.search_depth
+
+                while candidate >= window_start and depth:
+
+                    # A candidate can only be longer if it matches at the end of the best match.
+                    if data[candidate + best_length] == data[position + best_length]:
+                        length = 0
+                        while length < maximum_length and data[candidate + length:candidate + length + compared_bytes] \
+                                == data[position + length:position + length + compared_bytes]:
+                            length += compared_bytes
+                        while length < maximum_length and data[candidate + length] == data[position + length]:
+                            length += 1
+                        length = min(length, maximum_length)
+
+                        if length > best_length:
+                            best_length = length
+                            best_candidate = candidate
+                            if length == maximum_length:
+                                break
+
+                    candidate = chain[candidate & window_mask]
+                    depth -= 1
+
+            if best_length >= minimum_length:
+                encoded_data[flag_position] |= 1 << flag_bit
+                encoded_data += (position - best_candidate).to_bytes(2, 'little')
+                encoded_data.append(best_length - minimum_length)
+                step = best_length
+            else:
+                encoded_data.append(data[position])
+                step = 1
+
+            flag_bit += 1
+
+            # The covered positions are added to the hash chains for the following matches.
+            for hashed_position in range(position, min(position + step, last_hashed + 1)):
+                key = data[hashed_position:hashed_position + minimum_length]
+                chain[hashed_position & window_mask] = heads.get(key, -1)
+                heads[key] = hashed_position
+
+            position += step
+
+        return bytes(encoded_data)
+
+    def decode(self, compressed_data: bytes):
+        """Will decompress bytes input to bytes output.
+
+        Args:
+            compressed_data (bytes): Data to be decoded.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+
+        Raises:
+            ValueError: If a match is incomplete or reaches before the start of the data.
+        """
+
+        minimum_length = self.MINIMUM_MATCH_LENGTH
+        data_length = len(compressed_data)
+
+        decoded_bytes = bytearray()
+        position = 0
+
+        while position < data_length:
+            flags = compressed_data[position]
+            position += 1
+
+            for flag_bit in range(8):
+                if position >= data_length:
+                    break
+
+                if not flags >> flag_bit & 1:
+                    decoded_bytes.append(compressed_data[position])
+                    position += 1
+                    continue
+
+                if position + 3 > data_length:
+                    raise ValueError('Incomplete compressed data')
+
+                offset = compressed_data[position] | compressed_data[position + 1] << 8
+                length = compressed_data[position + 2] + minimum_length
+                position += 3
+
+                if not 0 < offset <= len(decoded_bytes):
+                    raise ValueError('Poorly compressed data')
+
+                # A match longer than its offset repeats the bytes from the offset on.
+                start = len(decoded_bytes) - offset
+                if offset >= length:
+                    decoded_bytes += decoded_bytes[start:start + length]
+                else:
+                    decoded_bytes += (decoded_bytes[start:] * (length // offset + 1))[:length]
+
+        decompressed_data = bytes(decoded_bytes)
+
+        return decompressed_data
+
+
+class BWTCompression(CompressionABC):
+    """Burrows-Wheeler compression algorithm.
+
+    The data is cut into blocks. The Burrows-Wheeler transform sorts all rotations of a block and takes the last
+    byte of each, which brings bytes with similar context together. It is read from the suffix array of the block,
+    built in linear time with the SA-IS algorithm. The move-to-front transform turns the repeated bytes into small
+    numbers, mostly zeros. The runs of zeros are written as binary numbers with the two symbols RUN_A and RUN_B,
+    the other numbers follow shifted above them. Huffman compression encodes the result.
+
+    Each block is stored with the position of the original block among the sorted rotations and the size of
+    its Huffman compressed data in front.
+
+    Attributes:
+        RUN_A (int): Symbol for a digit of the value one in the length of a run of zeros.
+        RUN_B (int): Symbol for a digit of the value two in the length of a run of zeros.
+        ESCAPE (int): Symbol in front of the numbers which don't fit in a byte after the shift.
+        FIELD_BYTES (int): Amount of bytes holding the position of the original block and the size of a block.
+        block_size (int): Amount of bytes transformed together.
+        huffman_compression (HuffmanCompression): Entropy stage for the transformed blocks.
+    """
+
+    RUN_A = 0
+    RUN_B = 1
+    ESCAPE = 255
+    FIELD_BYTES = 4
+
+    # Numbers 1 to 253 are shifted by one, 254 and 255 are escaped.
+    SHIFT_TABLE = bytes([0]) + bytes(range(2, 255)) + bytes([0, 0])
+    UNSHIFT_TABLE = bytes([0, 0]) + bytes(range(1, 254)) + bytes([0])
+
+    def __init__(self, block_size=1 << 20, huffman_compression=None):
+        """Initiates an instance of the Burrows-Wheeler algorithm.
+
+        Args:
+            block_size (int): Amount of bytes transformed together. Large blocks compress better, while the time and
+                memory of the transform grow linearly with them.
+            huffman_compression (None/HuffmanCompression): Entropy stage for the transformed blocks. None for
+                Huffman compression with codes up to 15 bits.
+
+        Raises:
+            ValueError: If the block size is not positive or the position in the block doesn't fit in its field.
+        """
+
+        if not 0 < block_size < 1 << 8 * self.FIELD_BYTES:
+            raise ValueError(f'Unsupported block size: {block_size}')
+
+        self.block_size = block_size
+        self.huffman_compression = huffman_compression or HuffmanCompression(maximum_code_length=15)
+
+    def encode(self, uncompressed_data: bytes):
+        """Will compress bytes input to bytes output.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+
+        Returns:
+            encoded_data (bytes): Compressed blocks.
+        """
+
+        encoded_blocks = []
+
+        for position in range(0, len(uncompressed_data), self.block_size):
+            block = bytes(uncompressed_data[position:position + self.block_size])
+
+            transformed_block, primary_index = self.transform_block(block=block)
+            zero_runs = self.encode_zero_runs(ranks=self.move_to_front(data=transformed_block))
+            encoded_block = self.huffman_compression.encode(zero_runs)
+
+            encoded_blocks.append(primary_index.to_bytes(self.FIELD_BYTES, "little"))
+            encoded_blocks.append(len(encoded_block).to_bytes(self.FIELD_BYTES, "little"))
+            encoded_blocks.append(encoded_block)
+
+        encoded_data = b"".join(encoded_blocks)
+
+        return encoded_data
+
+    def decode(self, compressed_data: bytes):
+        """Will decompress bytes input to bytes output.
+
+        Args:
+            compressed_data (bytes): Data to be decoded.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+
+        Raises:
+            ValueError: If a block is incomplete.
+        """
+
+        data_view = memoryview(compressed_data)
+        decoded_blocks = []
+        position = 0
+
+        while position < len(data_view):
+            size_start = position + self.FIELD_BYTES
+            block_start = size_start + self.FIELD_BYTES
+            if block_start > len(data_view):
+                raise ValueError('Incomplete compressed data')
+
+            primary_index = int.from_bytes(data_view[position:size_start], "little")
+            block_end = block_start + int.from_bytes(data_view[size_start:block_start], "little")
+            if block_end > len(data_view):
+                raise ValueError('Incomplete compressed data')
+
+            zero_runs = self.huffman_compression.decode(bytes(data_view[block_start:block_end]))
+            transformed_block = self.move_to_front_inverse(ranks=self.decode_zero_runs(zero_runs=zero_runs))
+            decoded_blocks.append(self.transform_block_inverse(transformed_block=transformed_block,
+                                                               primary_index=primary_index))
+            position = block_end
+
+        decompressed_data = b"".join(decoded_blocks)
+
+        return decompressed_data
+
+    @classmethod
+    def transform_block(cls, block: bytes):
+        """Burrows-Wheeler transform of a block with an end marker.
+
+        The end marker sorts before all bytes and ends the rotations, so they are ordered like the suffixes.
+        The rotation starting with the end marker comes first. The end marker itself is not stored,
+        only its position in the transformed block.
+
+        Args:
+            block (bytes): Data to be transformed.
+
+        Returns:
+            transformed_block (bytes): Last byte of each sorted rotation, without the end marker.
+            primary_index (int): Position of the end marker in the transformed block.
+        """
+
+        suffix_array = cls.create_suffix_array(data=block, alphabet_size=HuffmanCompression.SYMBOL_COUNT)
+
+        # The rotation starting with the end marker ends with the last byte.
+        transformed_block = bytearray(block[-1:])
+        primary_index = 0
+        for rank, suffix in enumerate(suffix_array, 1):
+            if suffix:
+                transformed_block.append(block[suffix - 1])
+            else:
+                primary_index = rank
+
+        return bytes(transformed_block), primary_index
+
+    @staticmethod
+    def transform_block_inverse(transformed_block: bytes, primary_index: int):
+        """Recreates the block from its Burrows-Wheeler transform.
+
+        The rotations which end with the same byte keep their order when the byte is moved to their front.
+        Following this mapping from the rotation of the end marker gives the block from its end to its start.
+
+        Args:
+            transformed_block (bytes): Last byte of each sorted rotation, without the end marker.
+            primary_index (int): Position of the end marker in the transformed block.
+
+        Returns:
+            block (bytes): Data identical to the block before the transform.
+
+        Raises:
+            ValueError: If the position of the end marker is out of range.
+        """
+
+        block_length = len(transformed_block)
+
+        if not transformed_block:
+            return b''
+
+        if not 0 < primary_index <= block_length:
+            raise ValueError('Poorly compressed data')
+
+        # The first rotation starting with each byte comes after the end marker and all smaller bytes.
+        next_rows = []
+        row_count = 1
+        for symbol in range(HuffmanCompression.SYMBOL_COUNT):
+            next_rows.append(row_count)
+            row_count += transformed_block.count(symbol)
+
+        last_column = list(transformed_block)
+        last_column.insert(primary_index, None)
+
+        previous_rows = [0] * (block_length + 1)
+        for row, symbol in enumerate(last_column):
+            if symbol is not None:
+                previous_rows[row] = next_rows[symbol]
+                next_rows[symbol] += 1
+
+        block = bytearray(block_length)
+        row = 0
+        for position in range(block_length - 1, -1, -1):
+            block[position] = last_column[row]
+            row = previous_rows[row]
+
+        return bytes(block)
+
+    @classmethod
+    def create_suffix_array(cls, data: list, alphabet_size: int):
+        """Sorts the suffixes of the data with the SA-IS algorithm in linear time.
+
+        Each position is of type S if its suffix is smaller than the next one, otherwise of type L. S positions after
+        an L position are LMS positions. Sorting the LMS suffixes is enough, as all other suffixes are induced from
+        them: the L suffixes in a pass from the front and the S suffixes in a pass from the back. The LMS substrings
+        are named by their order and, if some are equal, their names form a shorter string sorted recursively.
+        A suffix which is the start of another sorts before it.
+
+        Args:
+            data (list): Integers below the alphabet size, e.g. bytes.
+            alphabet_size (int): Upper limit for the integers of the data.
+
+        Returns:
+            suffix_array (list): Start positions of the suffixes in sorted order.
+        """
+
+        data_length = len(data)
+
+        if data_length < 2:
+            return list(range(data_length))
+
+        # S types, counted from the back.
+        is_s_type = [False] * data_length
+        for position in range(data_length - 2, -1, -1):
+            if data[position] == data[position + 1]:
+                is_s_type[position] = is_s_type[position + 1]
+            else:
+                is_s_type[position] = data[position] < data[position + 1]
+
+        # Buckets: L positions of each value come before its S positions.
+        counts = [0] * (alphabet_size + 1)
+        for value in data:
+            counts[value + 1] += 1
+        bucket_starts = []
+        bucket_ends = []
+        total = 0
+        for value in range(alphabet_size):
+            total += counts[value]
+            bucket_starts.append(total)
+            bucket_ends.append(total + counts[value + 1])
+
+        lms_positions = [position for position in range(1, data_length)
+                         if is_s_type[position] and not is_s_type[position - 1]]
+
+        def induce(sorted_lms_positions):
+            suffix_array = [-1] * data_length
+
+            # The LMS suffixes go to the ends of their buckets, keeping their order.
+            bucket_tails = bucket_ends[:]
+            for lms_position in reversed(sorted_lms_positions):
+                value = data[lms_position]
+                bucket_tails[value] -= 1
+                suffix_array[bucket_tails[value]] = lms_position
+
+            # L suffixes follow from the front, starting with the last suffix.
+            bucket_heads = bucket_starts[:]
+            value = data[data_length - 1]
+            suffix_array[bucket_heads[value]] = data_length - 1
+            bucket_heads[value] += 1
+            for index in range(data_length):
+                suffix = suffix_array[index]
+                if suffix > 0 and not is_s_type[suffix - 1]:
+                    value = data[suffix - 1]
+                    suffix_array[bucket_heads[value]] = suffix - 1
+                    bucket_heads[value] += 1
+
+            # S suffixes follow from the back and replace the LMS suffixes placed before.
+            bucket_tails = bucket_ends[:]
+            for index in range(data_length - 1, -1, -1):
+                suffix = suffix_array[index]
+                if suffix > 0 and is_s_type[suffix - 1]:
+                    value = data[suffix - 1]
+                    bucket_tails[value] -= 1
+                    suffix_array[bucket_tails[value]] = suffix - 1
+
+            return suffix_array
+
+        suffix_array = induce(lms_positions)
+
+        if not lms_positions:
+            return suffix_array
+
+        # The LMS substrings reach to the next LMS position, the last one to the end of the data.
+        lms_indexes = [-1] * data_length
+        for lms_index, lms_position in enumerate(lms_positions):
+            lms_indexes[lms_position] = lms_index
+        lms_ends = lms_positions[1:] + [data_length]
+
+        sorted_lms_positions = [suffix for suffix in suffix_array if lms_indexes[suffix] >= 0]
+
+        # Equal neighbouring LMS substrings get the same name.
+        names = [0] * len(lms_positions)
+        name = 0
+        previous = sorted_lms_positions[0]
+        for current in sorted_lms_positions[1:]:
+            previous_end = lms_ends[lms_indexes[previous]]
+            current_end = lms_ends[lms_indexes[current]]
+            if previous_end - previous != current_end - current or previous_end == data_length or \
+                    current_end == data_length or \
+                    data[previous:previous_end + 1] != data[current:current_end + 1]:
+                name += 1
+            names[lms_indexes[current]] = name
+            previous = current
+
+        # With equal substrings the order of their suffixes depends on the rest of the data and is found recursively.
+        if name + 1 < len(lms_positions):
+            reduced_suffix_array = cls.create_suffix_array(data=names, alphabet_size=name + 1)
+            sorted_lms_positions = [lms_positions[lms_index] for lms_index in reduced_suffix_array]
+
+        suffix_array = induce(sorted_lms_positions)
+
+        return suffix_array
+
+    @staticmethod
+    def move_to_front(data: bytes):
+        """Replaces each byte by its position in a list of bytes, which is then moved to the front of the list.
+
+        Args:
+            data (bytes): Transformed block.
+
+        Returns:
+            ranks (bytes): Position of each byte in the list at the time it occurred.
+        """
+
+        order = bytearray(range(256))
+        ranks = bytearray(len(data))
+
+        for position, symbol in enumerate(data):
+            rank = order.index(symbol)
+            if rank:
+                ranks[position] = rank
+                order[1:rank + 1] = order[:rank]
+                order[0] = symbol
+
+        return bytes(ranks)
+
+    @staticmethod
+    def move_to_front_inverse(ranks: bytes):
+        """Recreates the bytes from their positions in the list of bytes.
+
+        Args:
+            ranks (bytes): Position of each byte in the list at the time it occurred.
+
+        Returns:
+            data (bytes): Transformed block.
+        """
+
+        order = bytearray(range(256))
+        data = bytearray(len(ranks))
+
+        for position, rank in enumerate(ranks):
+            symbol = order[rank]
+            data[position] = symbol
+            if rank:
+                order[1:rank + 1] = order[:rank]
+                order[0] = symbol
+
+        return bytes(data)
+
+    @classmethod
+    def encode_zero_runs(cls, ranks: bytes):
+        """Writes runs of zeros as their length and shifts the other numbers above the run symbols.
+
+        A run length is written with the digits RUN_A for one and RUN_B for two, starting with the lowest digit,
+        e.g. 1 = A, 2 = B, 3 = AA, 4 = BA, 5 = AB. Numbers which don't fit in a byte after the shift follow ESCAPE.
+
+        Args:
+            ranks (bytes): Output of the move-to-front transform.
+
+        Returns:
+            zero_runs (bytes): Ranks with the runs of zeros replaced.
+        """
+
+        zero_runs = bytearray()
+
+        for run in re.finditer(rb"\x00+|[\xfe\xff]|[^\x00\xfe\xff]+", ranks):
+            run_bytes = run.group()
+
+            if not run_bytes[0]:
+                run_length = len(run_bytes)
+                while run_length:
+                    if run_length & 1:
+                        zero_runs.append(cls.RUN_A)
+                        run_length -= 1
+                    else:
+                        zero_runs.append(cls.RUN_B)
+                        run_length -= 2
+                    run_length >>= 1
+
+            elif run_bytes[0] >= cls.ESCAPE - 1:
+                zero_runs += bytes([cls.ESCAPE, run_bytes[0] - (cls.ESCAPE - 1)])
+
+            else:
+                zero_runs += run_bytes.translate(cls.SHIFT_TABLE)
+
+        return bytes(zero_runs)
+
+    @classmethod
+    def decode_zero_runs(cls, zero_runs: bytes):
+        """Recreates the runs of zeros and the shifted numbers.
+
+        Args:
+            zero_runs (bytes): Ranks with the runs of zeros replaced.
+
+        Returns:
+            ranks (bytes): Output of the move-to-front transform.
+
+        Raises:
+            ValueError: If the data ends after ESCAPE.
+        """
+
+        ranks = bytearray()
+
+        for run in re.finditer(rb"[\x00\x01]+|\xff.?|[\x02-\xfe]+", zero_runs, re.DOTALL):
+            run_bytes = run.group()
+
+            if run_bytes[0] <= cls.RUN_B:
+                run_length = 0
+                for digit, symbol in enumerate(run_bytes):
+                    run_length += (symbol + 1) << digit
+                ranks += bytes(run_length)
+
+            elif run_bytes[0] == cls.ESCAPE:
+                if len(run_bytes) < 2:
+                    raise ValueError('Incomplete compressed data')
+                ranks.append(run_bytes[1] + cls.ESCAPE - 1)
+
+            else:
+                ranks += run_bytes.translate(cls.UNSHIFT_TABLE)
+
+        return bytes(ranks)
+
+
+class RLECompression(CompressionABC):
+    """Run-length encoding.
+
+    Runs of a repeated byte are replaced by their length and the byte. It is meant as a stage in front of another
+    algorithm in a pipeline, e.g. "rle+huf", which then works on the data without the runs. The data is compared with
+    itself shifted by one byte as large integers, which turns equal neighbouring bytes into zero bytes. The runs are
+    found among them by bytes methods, so long runs as in zero-padded disk images are encoded and decoded at about
+    the speed of copying memory.
+
+    The compressed data alternates between literal bytes and runs. The literal bytes are stored with their amount
+    in front, each run with its length and its byte. All amounts and lengths are stored with 7 bits in each byte,
+    the lowest bits first and the highest bit set in all bytes but the last.
+
+    Attributes:
+        DIFFERENCE_PART_SIZE (int): Amount of bytes compared at once, which limits the size of the integers.
+        ZERO_BYTES_PATTERN (re.Pattern): Regular expression for the zero bytes of a run.
+        minimum_run_length (int): Shortest run replaced by its length and byte.
+    """
+
+    DIFFERENCE_PART_SIZE = 1 << 20
+    ZERO_BYTES_PATTERN = re.compile(rb"\x00+")
+
+    def __init__(self, minimum_run_length=4):
+        """Initiates an instance of the run-length encoding.
+
+        Args:
+            minimum_run_length (int): Shortest run replaced by its length and byte. Shorter runs stay literal bytes,
+                as a run takes at least three bytes with the amount of the literal bytes in front.
+
+        Raises:
+            ValueError: If the minimum run length is below two.
+        """
+
+        if minimum_run_length < 2:
+            raise ValueError(f'Unsupported minimum run length: {minimum_run_length}')
+
+        self.minimum_run_length = minimum_run_length
+
+    def encode(self, uncompressed_data: bytes):
+        """Will compress bytes input to bytes output.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+
+        Returns:
+            encoded_data (bytes): Literal bytes and runs, each with its length.
+        """
+
+        data_view = memoryview(uncompressed_data)
+        differences = self.compare_neighbours(data_view=data_view)
+        encoded_data = bytearray()
+        position = 0
+
+        # A run of n bytes leaves n - 1 zero bytes in the differences.
+        run_marker = bytes(self.minimum_run_length - 1)
+        run_start = differences.find(run_marker)
+
+        while run_start >= 0:
+            run_end = self.ZERO_BYTES_PATTERN.match(differences, run_start).end() + 1
+
+            encoded_data += self.pack_length(length=run_start - position)
+            encoded_data += data_view[position:run_start]
+            encoded_data += self.pack_length(length=run_end - run_start)
+            encoded_data.append(data_view[run_start])
+            position = run_end
+
+            run_start = differences.find(run_marker, run_end)
+
+        # The literal bytes after the last run end the data without a run.
+        if position < len(data_view):
+            encoded_data += self.pack_length(length=len(data_view) - position)
+            encoded_data += data_view[position:]
 
-    def create_tree(self):
-        # FIXME: Do not repeate words from the namespaces, why BinaryTree.create_tree()? Could we
-        #   use BinaryTree.create() instead?
+        return bytes(encoded_data)
 
-        """Connects individual nodes.
+    def decode(self, compressed_data: bytes):
+        """Will decompress bytes input to bytes output.
 
-        For two nodes with the lowest occurrence one parent is created with the sum of their occurrences.
-        The process is repeated until one parent/root node is left.
+        Args:
+            compressed_data (bytes): Data to be decoded.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+
+        Raises:
+            ValueError: If a length or the bytes it counts are incomplete.
         """
 
-        # In the last loop only two nodes will be left, so all nodes are regarded.
-        while len(self.heap) > 1:
+        data_view = memoryview(compressed_data)
+        decompressed_data = bytearray()
+        position = 0
 
-            # Takes out of the heap the two nodes with the least occurrence, maintaining the heap invariant.
-            node_1 = heapq.heappop(self.heap)
-            node_2 = heapq.heappop(self.heap)
+        while position < len(data_view):
+            literal_length, position = self.unpack_length(compressed_data=data_view, position=position)
+            literal_end = position + literal_length
+            if literal_end > len(data_view):
+                raise ValueError('Incomplete compressed data')
 
-            # Creates a new node in the tree with occurrence level the sum of its child nodes.
-            # This node doesn't have any character info.
-            merged = Node(None, node_1.occurrence + node_2.occurrence)
-            merged.left_child = node_1
-            merged.right_child = node_2
+            decompressed_data += data_view[position:literal_end]
+            position = literal_end
 
-            # Returns the new node in the priority que for further use.
-            heapq.heappush(self.heap, merged)
-            # The root node:
-            # At the end the priority que will have only one node with the largest number of occurrence.
+            if position == len(data_view):
+                break
 
-    def initiate_create_codes(self):
-        # FIXME: Why we need a separate function for this? Why not implement it in other places
-        #   such as create_codes or the constructor?
+            run_length, position = self.unpack_length(compressed_data=data_view, position=position)
+            if position == len(data_view):
+                raise ValueError('Incomplete compressed data')
 
-        """Starts the recursion for creation of codes."""
+            decompressed_data += bytes(data_view[position:position + 1]) * run_length
+            position += 1
 
-        # Creates initial parameters for the recursion.
-        root = heapq.heappop(self.heap)
-        current_code = ""
+        return bytes(decompressed_data)
 
-        # Calls the recursion.
-        self.create_codes(root, current_code)
+    @classmethod
+    def compare_neighbours(cls, data_view: memoryview):
+        """Compares each byte with the following one.
 
-    def create_codes(self, root, current_code: str):
-        # FIXME:  The root is a state of the instance, why we need it here?
+        The data and the data shifted by one byte are read as large integers and combined with XOR in parts.
 
-        """Generates codes by traversing the entire tree.
+        Args:
+            data_view (memoryview): Data to be compressed.
+
+        Returns:
+            differences (bytes): Zero byte at each position where the byte is equal to the following one.
+        """
+
+        difference_parts = []
+
+        # The parts overlap by one byte, so every byte is compared with the following one.
+        for position in range(0, len(data_view) - 1, cls.DIFFERENCE_PART_SIZE):
+            part = data_view[position:position + cls.DIFFERENCE_PART_SIZE + 1]
+            difference = int.from_bytes(part[:-1], "big") ^ int.from_bytes(part[1:], "big")
+            difference_parts.append(difference.to_bytes(len(part) - 1, "big"))
+
+        differences = b"".join(difference_parts)
+
+        return differences
+
+    @staticmethod
+    def pack_length(length: int):
+        """Stores a length in as many bytes as needed.
 
         Args:
-            root (Node): Building block for the Huffman tree.
-            current_code (str): Contains the code for individual occurrences/datapoints.
+            length (int): Amount of literal bytes or length of a run.
+
+        Returns:
+            length_bytes (bytes): 7 bits of the length in each byte, the lowest first. The highest bit marks
+                that another byte follows.
         """
-        # Recursion end condition:
-        # When bottom of the tree is reached - data containing nodes don't have children.
-        if root is None:
-            return None
 
-        # Activates only if the node is data containing, not only holding occurrence amount.
-        if root.byte or root.byte == 0:
-            # Used for encoding k:v character:code.
-            self.codebook[root.byte] = current_code
-            return
+        length_bytes = bytearray()
 
-        # Navigation adds to the code 0 for going to the left child and 1 for going to the right child.
-        self.create_codes(root.left_child, current_code + "0")
-        self.create_codes(root.right_child, current_code + "1")
+        while length >= 0x80:
+            length_bytes.append(0x80 | length & 0x7F)
+            length >>= 7
+        length_bytes.append(length)
 
+        return length_bytes
 
-class Node(object):
-    # FIXME: Belongs to HuffmanTree or BinaryTree?
+    @staticmethod
+    def unpack_length(compressed_data: bytes, position: int):
+        """Reads a length stored by self.pack_length().
 
-    """Nodes are building blocks of the Huffman tree.
+        Args:
+            compressed_data (bytes): Data to be decoded.
+            position (int): Position of the first byte of the length.
 
-    Node is used in the BinaryTree.
+        Returns:
+            length (int): Amount of literal bytes or length of a run.
+            position (int): Position after the last byte of the length.
+
+        Raises:
+            ValueError: If the data ends within the length.
+        """
+
+        length = 0
+        shift = 0
+
+        while True:
+            if position == len(compressed_data):
+                raise ValueError('Incomplete compressed data')
+
+            length_byte = compressed_data[position]
+            position += 1
+            length |= (length_byte & 0x7F) << shift
+            shift += 7
+
+            if length_byte < 0x80:
+                return length, position
+
+
+class StoreCompression(CompressionABC):
+    """Stores the data without compression.
+
+    Data which doesn't get smaller by compression, like JPEG images, zip archives or videos, is stored as it is.
+    Encoding and decoding copy the data.
+    """
+
+    def encode(self, uncompressed_data: bytes):
+        """Will copy bytes input to bytes output.
+
+        Args:
+            uncompressed_data (bytes): Data to be stored.
+
+        Returns:
+            encoded_data (bytes): Copy of the data.
+        """
+
+        return bytes(uncompressed_data)
+
+    def decode(self, compressed_data: bytes):
+        """Will copy bytes input to bytes output.
+
+        Args:
+            compressed_data (bytes): Stored data.
+
+        Returns:
+            decompressed_data (bytes): Copy of the data.
+        """
+
+        return bytes(compressed_data)
+
+
+class PipelineCompression(CompressionABC):
+    """Chain of compression algorithms.
+
+    Each stage compresses the output of the stage before, e.g. Huffman codes for the output of LZW. The names of the
+    stages are written in front of the compressed data, so decoding runs the stages in reverse without further
+    settings. The output of a stage is handed on to the next one as it is and the compressed data after the names
+    reaches the first decoding stage as a view instead of a copy.
+
+    The compressed data starts with the amount of stages, followed by the length and the ASCII name of each stage
+    in the order of encoding.
 
     Attributes:
-        byte (None, bytes): Datapoint from the original data.
-        occurrence (int): How many times the datapoint appears in the uncompressed data.
-        left_child (Node, None): Node lower in the tree structure if any.
-        right_child (Node, None): Node lower in the tree structure if any.
+        SEPARATOR (str): Character between the names of the stages in a written pipeline, e.g. "lzw+huf".
+        stages (dict): Compression algorithms by their names.
+        stage_names (list): Names of the stages used for encoding, in the order of encoding.
     """
 
-    def __init__(self, byte: [None, bytes], occurrence: int):
-        """Initiates an instance of the Node."""
+    SEPARATOR = "+"
 
-        # Note: self.create_frequency_dict changed the byte to an int.
-        self.byte = byte
-        self.occurrence = occurrence
-        self.left_child = None
-        self.right_child = None
+    def __init__(self, stages: dict, stage_names=None):
+        """Initiates an instance of the pipeline.
 
-    # Comparison base is defined for use by the heapq module in the BinaryTree class.
-    def __lt__(self, other):
-        return self.occurrence < other.occurrence
+        Args:
+            stages (dict): Compression algorithms by their names. Decoding finds the stages by these names,
+                so the same names are needed for encoding and decoding.
+            stage_names (None/list/str): Names of the stages used for encoding, in the order of encoding.
+                A string is split at the separator. None if they are given for each encoding.
 
-    def __eq__(self, other):
-        if other is None:
-            return False
-        if not isinstance(other, Node):
-            return False
-        return self.occurrence == other.occurrence
+        Raises:
+            ValueError: If a name doesn't fit in the header or a stage is unknown.
+        """
+
+        for name in stages:
+            if not 0 < len(name.encode("ascii")) < 256 or self.SEPARATOR in name:
+                raise ValueError(f'Unsupported stage name: {name}')
+
+        self.stages = stages
+        self.stage_names = self.split_stage_names(stage_names=stage_names) if stage_names is not None else None
+
+    def split_stage_names(self, stage_names):
+        """Checks the names of the stages and splits a written pipeline at the separator.
+
+        Args:
+            stage_names (list/str): Names of the stages in the order of encoding.
+
+        Returns:
+            stage_names (list): Names of the stages in the order of encoding.
+
+        Raises:
+            ValueError: If there are no stages, too many stages or an unknown stage.
+        """
+
+        if isinstance(stage_names, str):
+            stage_names = stage_names.split(self.SEPARATOR)
+
+        if not 0 < len(stage_names) < 256:
+            raise ValueError(f'Unsupported amount of stages: {len(stage_names)}')
+
+        for name in stage_names:
+            if name not in self.stages:
+                raise ValueError(f'Unsupported stage: {name}')
+
+        return list(stage_names)
+
+    def encode(self, uncompressed_data: bytes, stage_names=None):
+        """Will compress bytes input to bytes output.
+
+        Args:
+            uncompressed_data (bytes): Data to be compressed.
+            stage_names (None/list/str): Names of the stages in the order of encoding. None for the stages of the
+                instance.
+
+        Returns:
+            encoded_data (bytes): Names of the stages followed by the compressed data.
+
+        Raises:
+            ValueError: If no stages are given or a stage is unknown.
+        """
+
+        if stage_names is None:
+            if self.stage_names is None:
+                raise ValueError('Unsupported amount of stages: 0')
+            stage_names = self.stage_names
+        else:
+            stage_names = self.split_stage_names(stage_names=stage_names)
+
+        header = bytearray([len(stage_names)])
+        for name in stage_names:
+            name_bytes = name.encode("ascii")
+            header.append(len(name_bytes))
+            header += name_bytes
+
+        data = uncompressed_data
+        for name in stage_names:
+            data = self.stages[name].encode(data)
+
+        encoded_data = bytes(header) + data
+
+        return encoded_data
+
+    def decode(self, compressed_data: bytes):
+        """Will decompress bytes input to bytes output.
+
+        Args:
+            compressed_data (bytes): Data to be decoded.
+
+        Returns:
+            decompressed_data (bytes): Data identical to the original before compression.
+
+        Raises:
+            ValueError: If the names of the stages are incomplete or a stage is unknown.
+        """
+
+        stage_names, header_size = self.read_header(compressed_data=compressed_data)
+
+        data = memoryview(compressed_data)[header_size:]
+        for name in reversed(stage_names):
+            data = self.stages[name].decode(data)
+
+        decompressed_data = bytes(data)
+
+        return decompressed_data
+
+    def read_header(self, compressed_data: bytes):
+        """Reads the names of the stages in front of the compressed data.
+
+        Args:
+            compressed_data (bytes): Data to be decoded.
+
+        Returns:
+            stage_names (list): Names of the stages in the order of encoding.
+            header_size (int): Amount of bytes taken by the names.
+
+        Raises:
+            ValueError: If the names are incomplete or a stage is unknown.
+        """
+
+        if not compressed_data:
+            raise ValueError('Incomplete compressed data')
+
+        stage_names = []
+        header_size = 1
+        for _ in range(compressed_data[0]):
+            if header_size >= len(compressed_data):
+                raise ValueError('Incomplete compressed data')
+
+            name_end = header_size + 1 + compressed_data[header_size]
+            if name_end > len(compressed_data):
+                raise ValueError('Incomplete compressed data')
+
+            stage_names.append(bytes(compressed_data[header_size + 1:name_end]).decode("ascii", errors="replace"))
+            header_size = name_end
+
+        return self.split_stage_names(stage_names=stage_names), header_size
+
+
+class AlgorithmSelector(object):
+    """Chooses between Huffman and LZW compression for data from samples of it and detects incompressible data.
+
+    Slices spread evenly over the data are taken as samples. The order-0 entropy of their bytes predicts the bits
+    per byte of Huffman codes, which can't be shorter than one bit. The LZW encoder encodes the samples one after
+    another, so repetition between distant parts of the data is seen too. The bits of its codes predict the bits
+    per byte of LZW and the average amount of bytes covered by one code its speed. The samples are short,
+    so LZW is rather underestimated on large repetitive data.
+
+    The algorithm with the highest predicted compression rate per CPU second is chosen. The CPU time is predicted
+    from costs per byte and per code. They were timed once on one machine on the example files, with the coders
+    configured as by the application. Only their proportions matter for the choice, so they hold on faster
+    or slower machines as well. Huffman codes take the same time for each byte. LZW spends most of its time on each
+    code it writes, so it encodes repetitive data with few codes much faster than data which is hard to compress.
+
+    Data is incompressible, if the bytes of the samples are close to evenly distributed and LZW predicts no gain
+    either. Such data is usually compressed already and is better stored as it is.
+
+    Attributes:
+        INCOMPRESSIBLE_ENTROPY (float): Entropy in bits per byte from which on data may be incompressible.
+        ENCODING_COSTS (dict): CPU seconds for each byte and for each written code by the name of the algorithm,
+            timed once and not calibrated on the running machine.
+        sample_count (int): Amount of slices taken from the data.
+        sample_size (int): Amount of bytes in each slice.
+        maximum_code_width (int): Bits of the largest LZW code, as used for the encoding.
+        reset_codebook (bool): Reset of a full LZW codebook, as used for the encoding.
+    """
+
+    ENCODING_COSTS = {"huf": (0.28e-6, 0), "lzw": (0.15e-6, 0.8e-6)}
+    INCOMPRESSIBLE_ENTROPY = 7.9
+
+    def __init__(self, sample_count=8, sample_size=1 << 13, maximum_code_width=16, reset_codebook=True):
+        """Initiates an instance of the selection.
+
+        Args:
+            sample_count (int): Amount of slices taken from the data.
+            sample_size (int): Amount of bytes in each slice. Data up to sample_count * sample_size bytes is
+                taken as a whole.
+            maximum_code_width (int): Bits of the largest LZW code, as used for the encoding.
+            reset_codebook (bool): Reset of a full LZW codebook, as used for the encoding.
+
+        Raises:
+            ValueError: If the amount or the size of the samples is not positive.
+        """
+
+        if sample_count < 1 or sample_size < 1:
+            raise ValueError(f'Unsupported samples: {sample_count} of {sample_size} bytes')
+
+        self.sample_count = sample_count
+        self.sample_size = sample_size
+        self.maximum_code_width = maximum_code_width
+        self.reset_codebook = reset_codebook
+
+    def select(self, data: bytes):
+        """Chooses the algorithm for the data.
+
+        Args:
+            data (bytes): Data to be compressed.
+
+        Returns:
+            algorithm (str): Name of the chosen algorithm, "huf" or "lzw".
+            estimates (dict): Reasons for the choice: the entropy in bits per byte, the LZW bytes per code,
+                the predicted compression rate and the predicted bytes encoded per CPU second of each algorithm.
+        """
+
+        samples = self.take_samples(data=data)
+        sample_length = sum(len(sample) for sample in samples)
+
+        entropy = self.estimate_entropy(samples=samples)
+        lzw_bytes_per_code, lzw_bit_count = self.estimate_lzw(samples=samples,
+                                                              maximum_code_width=self.maximum_code_width,
+                                                              reset_codebook=self.reset_codebook)
+
+        # Empty data has no LZW codes and is left to Huffman.
+        predicted_rates = {"huf": 8 / max(entropy, 1),
+                           "lzw": 8 * sample_length / lzw_bit_count if lzw_bit_count else 1}
+
+        codes_per_byte = {"huf": 0, "lzw": 1 / lzw_bytes_per_code if lzw_bytes_per_code else 0}
+        predicted_speeds = {}
+        for name, (byte_cost, code_cost) in self.ENCODING_COSTS.items():
+            predicted_speeds[name] = 1 / (byte_cost + code_cost * codes_per_byte[name])
+
+        algorithm = max(predicted_rates, key=lambda name: predicted_rates[name] * predicted_speeds[name])
+
+        estimates = {"entropy": entropy, "lzw_bytes_per_code": lzw_bytes_per_code, "predicted_rates": predicted_rates,
+                     "predicted_speeds": predicted_speeds}
+
+        return algorithm, estimates
+
+    def check_incompressible(self, data: bytes):
+        """Predicts from samples of the data whether compression makes it larger.
+
+        Only the entropy is estimated, if it is low enough for Huffman codes to compress the data.
+
+        Args:
+            data (bytes): Data to be compressed.
+
+        Returns:
+            incompressible (bool): True if neither Huffman codes nor LZW are predicted to compress the data.
+            entropy (float): Order-0 entropy of the samples in bits per byte.
+        """
+
+        samples = self.take_samples(data=data)
+        entropy = self.estimate_entropy(samples=samples)
+
+        if entropy < self.INCOMPRESSIBLE_ENTROPY:
+            return False, entropy
+
+        _, lzw_bit_count = self.estimate_lzw(samples=samples, maximum_code_width=self.maximum_code_width,
+                                             reset_codebook=self.reset_codebook)
+        incompressible = lzw_bit_count >= 8 * sum(len(sample) for sample in samples)
+
+        return incompressible, entropy
+
+    def take_samples(self, data: bytes):
+        """Takes slices spread evenly over the data.
+
+        Args:
+            data (bytes): Data to be compressed.
+
+        Returns:
+            samples (list): Slices of the data as bytes.
+        """
+
+        if len(data) <= self.sample_count * self.sample_size:
+            return [bytes(data)]
+
+        # The first slice starts at the beginning of the data and the last one ends at its end.
+        last_position = len(data) - self.sample_size
+        positions = [index * last_position // max(self.sample_count - 1, 1) for index in range(self.sample_count)]
+        samples = [bytes(data[position:position + self.sample_size]) for position in positions]
+
+        return samples
+
+    @staticmethod
+    def estimate_entropy(samples: list):
+        """Calculates the order-0 entropy of the bytes of the samples.
+
+        Args:
+            samples (list): Slices of the data as bytes.
+
+        Returns:
+            entropy (float): Average information of a byte in bits.
+        """
+
+        counter = Counter()
+        for sample in samples:
+            counter.update(sample)
+
+        total = sum(counter.values())
+        entropy = sum(count / total * math.log2(total / count) for count in counter.values())
+
+        return entropy
+
+    @staticmethod
+    def estimate_lzw(samples: list, maximum_code_width: int, reset_codebook: bool):
+        """Encodes the samples one after another with the LZW encoder and counts the codes it writes.
+
+        Args:
+            samples (list): Slices of the data as bytes.
+            maximum_code_width (int): Bits of the largest code, as used for the encoding.
+            reset_codebook (bool): Resets a full codebook when the compression ratio drops, as used for the encoding.
+
+        Returns:
+            bytes_per_code (float): Average amount of bytes covered by one code. 0 for no data.
+            bit_count (int): Amount of bits of all codes.
+        """
+
+        encoder = LZWEncoder(maximum_code_width=maximum_code_width, reset_codebook=reset_codebook)
+        compressed_code = bytearray()
+        code_count = 0
+
+        for sample in samples:
+            code_array = encoder.create_code(uncompressed_data=sample)
+            code_count += len(code_array)
+            compressed_code += encoder.compress_code(code_array=code_array)
+
+        # The last sequence is written as one more code, if there is any data.
+        code_count += encoder.prefix_code is not None
+        compressed_code += encoder.flush()
+
+        # The first byte holds the settings of the encoding.
+        bit_count = 8 * (len(compressed_code) - 1)
+        bytes_per_code = sum(len(sample) for sample in samples) / code_count if code_count else 0
+
+        return bytes_per_code, bit_count
@@ -6,7 +6,8 @@ import os
 from pathlib import Path
 import time
 import fire
-from core.compression import LZWCompression, HuffmanCompression
+from core.compression import LZWCompression, HuffmanCompression, RANSCompression, LZSSCompression, BWTCompression, \
+    RLECompression, StoreCompression, PipelineCompression, AlgorithmSelector
 from data.file_handler import FileHandler
 from frontend.rich_output import RichOutput
 
@@ -15,18 +16,34 @@ class Application(object):
     """Creates input-output interface for a human operator.
 
     Using structured commands the user is able to access encoding and decoding for
-    LZW compression and Huffman compression algorithms.
-    A new file is created after encoding or decoding and some information about the process is displayed in
-    the terminal.
+    LZW, Huffman, rANS, LZSS and Burrows-Wheeler compression algorithms. LZW is available in the .Z format of
+    compress(1) as well. The algorithms can be chained in pipelines like "lzw+huf", also behind run-length encoding
+    like "rle+huf". With "auto" the algorithm is chosen from samples of the file. Files which don't get smaller by
+    compression are stored as they are. A new file is created after encoding or decoding and some information about
+    the process is displayed in the terminal.
 
     Attributes:
         file_handler (FileHandler): Handles paths, file names and writing and reading to/from files.
         lzw_compression (LZWCompression): LZW encoding and decoding algorithm.
         huffman_compression (HuffmanCompression): Huffman encoding and decoding algorithm.
+        rans_compression (RANSCompression): rANS encoding and decoding algorithm.
+        lzss_compression (LZSSCompression): LZSS encoding and decoding algorithm.
+        bwt_compression (BWTCompression): Burrows-Wheeler encoding and decoding algorithm.
+        pipeline_compression (PipelineCompression): Encoding and decoding with chained algorithms.
+        store_compression (StoreCompression): Storage without compression.
+        algorithm_selector (AlgorithmSelector): Chooses the algorithm for "auto" from samples of the data.
         rich_output (RichOutput): Handles structured output to the terminal.
+        ALGORITHM_NAMES (dict): Name of the algorithm for the output by the file extension of the compressed file.
+        ENCODING_ALGORITHMS (tuple): Algorithms available for encoding on their own, besides pipelines.
     """
 
-    def __init__(self, file_handler, lzw_compression, huffman_compression, rich_output):
+    ALGORITHM_NAMES = {"lzw": "LZW", "Z": "LZW", "huf": "Huffman", "ans": "rANS", "lzss": "LZSS", "bwt": "BWT",
+                       "rle": "RLE",
+                       "store": "Store"}
+    ENCODING_ALGORITHMS = ("lzw", "huf", "ans", "lzss", "bwt", "store", "Z", "auto")
+
+    def __init__(self, file_handler, lzw_compression, huffman_compression, rans_compression, lzss_compression,
+                 bwt_compression, pipeline_compression, store_compression, algorithm_selector, rich_output):
         """Initiates an instance of the Application.
 
         As the Application class handles the communication with the backend, it works with objects of the
@@ -36,12 +53,24 @@ class Application(object):
             file_handler (FileHandler): Handles paths, file names and writing and reading to/from files.
             lzw_compression (LZWCompression): LZW encoding and decoding algorithm.
             huffman_compression (HuffmanCompression): Huffman encoding and decoding algorithm.
+            rans_compression (RANSCompression): rANS encoding and decoding algorithm.
+            lzss_compression (LZSSCompression): LZSS encoding and decoding algorithm.
+            bwt_compression (BWTCompression): Burrows-Wheeler encoding and decoding algorithm.
+            pipeline_compression (PipelineCompression): Encoding and decoding with chained algorithms.
+            store_compression (StoreCompression): Storage without compression.
+            algorithm_selector (AlgorithmSelector): Chooses the algorithm for "auto" from samples of the data.
             rich_output (RichOutput): Handles structured output to the terminal.
         """
 
         self.file_handler = file_handler
         self.lzw_compression = lzw_compression
         self.huffman_compression = huffman_compression
+        self.rans_compression = rans_compression
+        self.lzss_compression = lzss_compression
+        self.bwt_compression = bwt_compression
+        self.pipeline_compression = pipeline_compression
+        self.store_compression = store_compression
+        self.algorithm_selector = algorithm_selector
         self.rich_output = rich_output
 
     def encode(self, complete_path: str, algorithm: str, new_name=None):
@@ -53,41 +82,82 @@ class Application(object):
         Args:
             complete_path (str): Complete path can be absolute path to file or just the file name.
             Files without extension are accepted as well.
-            algorithm (str): Used to determine which compression algorithm to use. Choices are "lzw"/"huf"
+            algorithm (str): Used to determine which compression algorithm to use.
+            Choices are "lzw"/"huf"/"ans"/"lzss"/"bwt"/"Z" or a pipeline of them joined by "+", e.g. "lzw+huf".
+            "auto" chooses between "huf" and "lzw" from samples of the file. "store" keeps the data as it is, which is
+            chosen automatically for data which doesn't get smaller by compression.
             new_name (str): Optional new file name for the generated file. File extension is generated automatically
             for the new file. If no new file name is given the original file name is used with new file extension.
+
+        Raises:
+            ValueError: If the algorithm or a stage of the pipeline is unknown.
         """
 
+        # Unknown algorithms are rejected before any decision about the data, like storing it as it is.
+        self._check_algorithm(algorithm)
+
         # The given path is split in path to containing folder, file name, file extension.
         path_info = self.file_handler.get_path_info(complete_path)
 
         file_path = path_info[0]
         file_name = new_name if new_name else path_info[1]
         file_extension = path_info[2]
-        file_extension_compressed = "." + algorithm
 
         # Input file represented as bytes.
         data_for_compression = self.file_handler.get_file_bytes(complete_path)
 
-        # Timestamp for beginning of encoding.
+        # Timestamp for beginning of encoding. It includes the selection of the algorithm.
         start = time.time()
 
+        # The chosen algorithm gives the file extension, so decoding needs no knowledge of the selection.
+        estimates = None
+        if algorithm == "auto":
+            algorithm, estimates = self.algorithm_selector.select(data_for_compression)
+        selected_algorithm = algorithm
+
+        # Data predicted to grow by compression is stored without the encoding. The .Z format is kept for compress(1).
+        store_reason = None
+        if algorithm not in ("Z", "store"):
+            incompressible, entropy = self.algorithm_selector.check_incompressible(data_for_compression)
+            if incompressible:
+                algorithm = "store"
+                store_reason = f"sampled entropy of {entropy:.2f} bits per byte"
+
         # Holds compressed data and metadata.
         # During execution of the encoding a loading animation is played.
         compressed_data = self.rich_output.execute_with_spinner(self._execute_encoding_algorithm,
                                                                 algorithm, data_for_compression, file_extension)
+
+        # Data which grew nevertheless is stored instead.
+        if algorithm not in ("Z", "store") and len(compressed_data[1]) >= len(data_for_compression):
+            compressed_data = self._execute_encoding_algorithm("store", data_for_compression, file_extension)
+            algorithm = "store"
+            store_reason = "compressed data not smaller than the original"
+
         # Timestamp for end of encoding.
         end = time.time()
 
-        # Creates new file.
-        self.file_handler.write_in_file(compressed_data,
-                                        file_path,
-                                        file_name,
-                                        file_extension_compressed)
+        file_extension_compressed = "." + algorithm
+
+        # Like in compress(1) the .Z file keeps the original file extension in its name.
+        if algorithm == "Z":
+            file_name += file_extension
+
+        # Creates new file. The .Z format holds only the compressed data, so it is written as it is.
+        if algorithm == "Z":
+            self.file_handler.recreate_file(compressed_data,
+                                            file_path,
+                                            file_name,
+                                            file_extension_compressed)
+        else:
+            self.file_handler.write_in_file(compressed_data,
+                                            file_path,
+                                            file_name,
+                                            file_extension_compressed)
 
         # Data for output creation.
 
-        output_header = "LZW" if algorithm == "lzw" else "Huffman"
+        output_header = self._get_output_header(algorithm)
 
         # Related to original file.
         original_filename = path_info[1] + file_extension
@@ -108,6 +178,22 @@ class Application(object):
         self.rich_output.add_rule(f"{output_header} Encoding")
 
         self.rich_output.add_path(path)
+
+        # The reasons for the automatic selection.
+        if estimates:
+            predicted_rates = {self._get_output_header(name): rate
+                               for name, rate in estimates["predicted_rates"].items()}
+            predicted_speeds = {self._get_output_header(name): speed
+                                for name, speed in estimates["predicted_speeds"].items()}
+            self.rich_output.display_selection(self._get_output_header(selected_algorithm),
+                                               estimates["entropy"],
+                                               estimates["lzw_bytes_per_code"],
+                                               predicted_rates,
+                                               predicted_speeds)
+
+        if store_reason:
+            self.rich_output.display_storage(self._get_output_header(selected_algorithm), store_reason)
+
         print()
 
         self.rich_output.display_output(original_filename,
@@ -132,27 +218,67 @@ class Application(object):
             decoded file later.
 
         Returns:
-            compressed_data (tuple): Contains the compressed data from the original file, the original file extension
-            and additional data needed for decoding.
+            compressed_data (tuple/bytes): Contains the compressed data from the original file, the original file
+            extension and a placeholder for additional decoding data. The .Z format is returned as bytes.
+
+        Raises:
+            ValueError: If the algorithm is unknown. Run-length encoding is only available as a stage of a pipeline.
         """
 
+        # The compressed data carries its decoding information in the header, so None is stored in its place.
+        # Older files have the bit size or the codebook there.
         if algorithm == "lzw":
 
             encoded_data = self.lzw_compression.encode(data_for_compression)
 
-            # Needed for decoding.
-            bit_size = self.lzw_compression.bit_size
-
-            return bit_size, encoded_data, file_extension
+            return None, encoded_data, file_extension
 
         elif algorithm == "huf":
 
             encoded_data = self.huffman_compression.encode(data_for_compression)
 
-            # Needed for decoding.
-            codebook = self.huffman_compression.codebook
+            return None, encoded_data, file_extension
+
+        elif algorithm == "ans":
+
+            encoded_data = self.rans_compression.encode(data_for_compression)
 
-            return codebook, encoded_data, file_extension
+            return None, encoded_data, file_extension
+
+        elif algorithm == "lzss":
+
+            encoded_data = self.lzss_compression.encode(data_for_compression)
+
+            return None, encoded_data, file_extension
+
+        elif algorithm == "bwt":
+
+            encoded_data = self.bwt_compression.encode(data_for_compression)
+
+            return None, encoded_data, file_extension
+
+        elif PipelineCompression.SEPARATOR in algorithm:
+
+            # The stages are recorded in the compressed data.
+            encoded_data = self.pipeline_compression.encode(data_for_compression, stage_names=algorithm)
+
+            return None, encoded_data, file_extension
+
+        elif algorithm == "store":
+
+            encoded_data = self.store_compression.encode(data_for_compression)
+
+            return None, encoded_data, file_extension
+
+        elif algorithm == "Z":
+
+            encoder = self.lzw_compression.create_encoder(unix_compress=True)
+            encoded_data = encoder.feed(data_for_compression) + encoder.flush()
+
+            return encoded_data
+
+        else:
+            raise ValueError(f'Unsupported algorithm: {algorithm}')
 
     def decode(self, complete_path: str, new_name=None):
         """Will take compressed file and recreate the original version.
@@ -177,7 +303,13 @@ class Application(object):
         file_extension = path_info[2]
 
         # Contains decoding information, compressed data, original file extension.
-        retrieved_data = self.file_handler.read_from_file(complete_path)
+        # A .Z file holds only the compressed data and the original file extension is part of its name.
+        if file_extension == ".Z":
+            file_name_original, file_extension_original = os.path.splitext(path_info[1])
+            file_name = new_name if new_name else file_name_original
+            retrieved_data = None, self.file_handler.get_file_bytes(complete_path), file_extension_original
+        else:
+            retrieved_data = self.file_handler.read_from_file(complete_path)
 
         # The file extension of the original file is red from the compressed data where it was saved.
         file_extension_original = retrieved_data[2]
@@ -201,7 +333,7 @@ class Application(object):
 
         # Data for output creation.
 
-        output_header = "LZW" if file_extension == ".lzw" else "Huffman"
+        output_header = self._get_output_header(file_extension[1:])
 
         # Related to original file.
         path = file_path if len(file_path) else Path.cwd()
@@ -250,18 +382,89 @@ class Application(object):
 
         if file_extension == ".lzw":
 
-            self.lzw_compression.bit_size = retrieved_data[0]
-            decoded_data = self.lzw_compression.decode(retrieved_data[1])
+            # Older files of the fixed width layout carry their bit size, all others carry None.
+            decoded_data = self.lzw_compression.decode(retrieved_data[1], bit_size=retrieved_data[0])
 
             return decoded_data
 
         elif file_extension == ".huf":
 
-            self.huffman_compression.codebook = retrieved_data[0]
-            decoded_data = self.huffman_compression.decode(retrieved_data[1])
+            # Older files carry their codebook and no header, all others carry None.
+            if retrieved_data[0] is not None:
+                decoded_data = self.huffman_compression.decode_legacy(retrieved_data[1], codebook=retrieved_data[0])
+            else:
+                decoded_data = self.huffman_compression.decode(retrieved_data[1])
+
+            return decoded_data
+
+        elif file_extension == ".ans":
+
+            decoded_data = self.rans_compression.decode(retrieved_data[1])
+
+            return decoded_data
+
+        elif file_extension == ".lzss":
+
+            decoded_data = self.lzss_compression.decode(retrieved_data[1])
+
+            return decoded_data
+
+        elif file_extension == ".bwt":
+
+            decoded_data = self.bwt_compression.decode(retrieved_data[1])
+
+            return decoded_data
+
+        elif PipelineCompression.SEPARATOR in file_extension:
+
+            decoded_data = self.pipeline_compression.decode(retrieved_data[1])
+
+            return decoded_data
+
+        elif file_extension == ".store":
+
+            decoded_data = self.store_compression.decode(retrieved_data[1])
 
             return decoded_data
 
+        elif file_extension == ".Z":
+
+            # The decoder reads the settings from the header of the .Z format.
+            decoder = self.lzw_compression.create_decoder()
+            decoded_data = decoder.feed(retrieved_data[1]) + decoder.flush()
+
+            return decoded_data
+
+    def _check_algorithm(self, algorithm: str):
+        """Checks that the algorithm can be used for encoding.
+
+        Args:
+            algorithm (str): Compression algorithm or pipeline of algorithms joined by the separator.
+
+        Raises:
+            ValueError: If the algorithm or a stage of the pipeline is unknown.
+        """
+
+        if PipelineCompression.SEPARATOR in algorithm:
+            self.pipeline_compression.split_stage_names(stage_names=algorithm)
+        elif algorithm not in self.ENCODING_ALGORITHMS:
+            raise ValueError(f'Unsupported algorithm: {algorithm}')
+
+    def _get_output_header(self, algorithm: str):
+        """Names the algorithm for the output.
+
+        Args:
+            algorithm (str): Compression algorithm or pipeline of algorithms as given by the file extension.
+
+        Returns:
+            output_header (str): Name of the algorithm, e.g. "LZW+Huffman" for the pipeline "lzw+huf".
+        """
+
+        output_header = PipelineCompression.SEPARATOR.join(self.ALGORITHM_NAMES.get(name, name)
+                                                           for name in algorithm.split(PipelineCompression.SEPARATOR))
+
+        return output_header
+
     def print_info(self):
         """Pints an information block about available functionalities.
 
@@ -285,14 +488,34 @@ def run():
 
     # Backend objects.
     file_handler = FileHandler()
-    lzw_compression = LZWCompression()
-    huffman_compression = HuffmanCompression()
+    lzw_compression = LZWCompression(variable_width=True, reset_codebook=True, maximum_code_width=16)
+    huffman_compression = HuffmanCompression(maximum_code_length=15, block_size=1 << 16)
+    rans_compression = RANSCompression()
+    lzss_compression = LZSSCompression(search_depth=16)
+    bwt_compression = BWTCompression(block_size=1 << 20)
+    # The .Z format is a file format of its own and no stage. Run-length encoding is only used as a stage.
+    store_compression = StoreCompression()
+    algorithm_selector = AlgorithmSelector(sample_count=8, sample_size=1 << 13,
+                                           maximum_code_width=lzw_compression.maximum_code_width,
+                                           reset_codebook=lzw_compression.reset_codebook)
+    pipeline_compression = PipelineCompression(stages={"lzw": lzw_compression,
+                                                       "huf": huffman_compression,
+                                                       "ans": rans_compression,
+                                                       "lzss": lzss_compression,
+                                                       "bwt": bwt_compression,
+                                                       "rle": RLECompression(minimum_run_length=4)})
     rich_output = RichOutput()
 
     # Frontend.
     application = Application(file_handler=file_handler,
                               lzw_compression=lzw_compression,
                               huffman_compression=huffman_compression,
+                              rans_compression=rans_compression,
+                              lzss_compression=lzss_compression,
+                              bwt_compression=bwt_compression,
+                              pipeline_compression=pipeline_compression,
+                              store_compression=store_compression,
+                              algorithm_selector=algorithm_selector,
                               rich_output=rich_output)
 
     # Mapping of methods to commands for their execution in CLI.
@@ -53,6 +53,36 @@ class RichOutput(object):
 
         rprint(f"[rgb(229,193,0)]path to containing folder: [green]{path}")
 
+    @staticmethod
+    def display_selection(algorithm, entropy, lzw_bytes_per_code, predicted_rates, predicted_speeds):
+        """Prints out the automatically selected algorithm and the reasons for the selection.
+
+        Args:
+            algorithm (str): Name of the selected algorithm.
+            entropy (float): Order-0 entropy of the samples in bits per byte.
+            lzw_bytes_per_code (float): Average amount of sampled bytes covered by one LZW code.
+            predicted_rates (dict): Predicted compression rate by the name of the algorithm.
+            predicted_speeds (dict): Predicted bytes encoded per CPU second by the name of the algorithm.
+        """
+
+        rprint(f"[rgb(229,193,0)]automatically selected: [green]{algorithm}")
+        rprint(f"[rgb(229,193,0)]sampled entropy: [green]{entropy:.2f} bits per byte[rgb(229,193,0)], "
+               f"LZW: [green]{lzw_bytes_per_code:.1f} bytes per code")
+        rprint("[rgb(229,193,0)]predicted compression rate: " +
+               ", ".join(f"[rgb(229,193,0)]{name} [green]{rate:.2f} at {predicted_speeds[name] / 1e6:.1f} MB/s"
+                         for name, rate in predicted_rates.items()))
+
+    @staticmethod
+    def display_storage(algorithm, reason):
+        """Prints out that the data is stored without compression instead of being compressed.
+
+        Args:
+            algorithm (str): Name of the algorithm which was replaced.
+            reason (str): Reason for storing the data as it is.
+        """
+
+        rprint(f"[rgb(229,193,0)]stored without compression instead of {algorithm}: [rgb(254,44,45)]{reason}")
+
     def display_output(self, original_filename, converted_filename, original_size,
                        converted_size, compression_rate, time_elapsed):
         """Creates information summary of encoding or decoding process.
@@ -103,7 +133,7 @@ class RichOutput(object):
                                    style="dim rgb(229,193,0)")
 
         # Creates rows of the table.
-        self.info_table.add_row("--encode", "filename.extension", "lzw/huf", "new_filename")
+        self.info_table.add_row("--encode", "filename.extension", "lzw/huf/ans/lzss/bwt/Z/auto/store", "new_filename")
         self.info_table.add_row("--decode", "filename.extension", "", "new_filename")
 
         self.console.print(self.info_table)
@@ -122,6 +152,12 @@ class RichOutput(object):
                "[green]lzw",
                "[dim rgb(229,193,0)]encoded_text")
 
+        # Encode example with a pipeline of algorithms.
+        rprint("[green]-e",
+               "[rgb(229,193,0)]text.txt",
+               "[green]lzss+huf",
+               "[dim rgb(229,193,0)]encoded_text")
+
         # Decode example - short and long notation.
         rprint("[green]-d",
                "[rgb(229,193,0)]encoded_text.lzw",
@@ -0,0 +1,61 @@
+"""Tests the selection of the compression algorithm from samples of the data.
+
+The selection and the detection of incompressible data are compared with the compression rates of the algorithms
+on the example files.
+"""
+import os
+
+from core.compression import AlgorithmSelector, HuffmanCompression, LZWCompression, StoreCompression
+
+example_files_path = os.path.join(os.path.dirname(__file__), "example_files")
+
+algorithm_selector = AlgorithmSelector()
+compressions = {"huf": HuffmanCompression(maximum_code_length=15, block_size=1 << 16),
+                "lzw": LZWCompression(variable_width=True, reset_codebook=True, maximum_code_width=16)}
+
+
+def select_and_compare(input_data: bytes):
+    """Selects the algorithm for the data and creates printout of the reasons and the actual compression rates.
+
+    Data detected as incompressible is stored and decoded again.
+
+    Args:
+        input_data (bytes): Data to select the algorithm for.
+    """
+
+    algorithm, estimates = algorithm_selector.select(data=input_data)
+    incompressible, _ = algorithm_selector.check_incompressible(data=input_data)
+
+    print("Selected algorithm: ", algorithm)
+    print(f"Entropy: {estimates['entropy']:.2f} bits per byte")
+    print(f"LZW bytes per code: {estimates['lzw_bytes_per_code']:.2f}")
+    print("Incompressible: ", incompressible)
+
+    if incompressible:
+        store_compression = StoreCompression()
+        print("Stored data = Input data:", store_compression.decode(store_compression.encode(input_data)) == input_data)
+
+    for name, compression in compressions.items():
+        compression_rate = len(input_data) / max(len(compression.encode(input_data)), 1)
+        print(f"{name} predicted compression rate: {estimates['predicted_rates'][name]:.2f}, "
+              f"actual compression rate: {compression_rate:.2f}, "
+              f"predicted speed: {estimates['predicted_speeds'][name] / 1e6:.1f} MB/s")
+
+
+# Executes the selection on all example files.
+for file_name in sorted(os.listdir(example_files_path)):
+    print()
+    print(file_name)
+    with open(os.path.join(example_files_path, file_name), "rb") as file:
+        select_and_compare(file.read())
+
+# LZW compresses the STL example far better and at a similar speed, so it gives the better rate per CPU second.
+print()
+print("adapter_plate.stl")
+with open(os.path.join(example_files_path, "adapter_plate.stl"), "rb") as file:
+    print("LZW selected:", algorithm_selector.select(file.read())[0] == "lzw")
+
+# Empty data is left to Huffman.
+print()
+print("Empty data")
+select_and_compare(b"")
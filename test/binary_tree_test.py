@@ -48,6 +48,18 @@ def create_codebook_step_by_step(input_data: bytes):
     binary_tree.initiate_create_codes()
     print("Codebook:")
     print(binary_tree.codebook)
+    print()
+
+    binary_tree.create_canonical_codes()
+    print("Canonical codebook with the same code lengths:")
+    print(binary_tree.codebook)
+    print()
+
+    code_lengths = binary_tree.create_code_lengths(frequency=frequency_dict)
+    print("Code lengths found with two queues instead of the tree of nodes:")
+    print(code_lengths)
+    print("Canonical codebook from these code lengths:")
+    print(binary_tree.create_canonical_codebook(code_lengths=code_lengths))
 
 
 def create_codebook(input_data: bytes):
@@ -66,3 +78,9 @@ def create_codebook(input_data: bytes):
 # Initiation of the tests.
 create_codebook_step_by_step(input_data=data)
 create_codebook(input_data=data)
+
+# The bytes are counted the same way from a memoryview, also if the data has only few different bytes.
+print("Counts of a memoryview = Counts of the bytes:",
+      BinaryTree.count_bytes(input_data=memoryview(data)) == BinaryTree.count_bytes(input_data=data))
+print("Counts of a memoryview with few different bytes = Counts of the bytes:",
+      BinaryTree.count_bytes(input_data=memoryview(b"AB" * 1000)) == BinaryTree.count_bytes(input_data=b"AB" * 1000))
@@ -0,0 +1,78 @@
+"""Tests the Burrows-Wheeler compression with different input options.
+
+The methods are addressed directly without the use of data handler.
+For simplicity only the main methods (encode and decode) of the algorithm are tested here.
+The goal is to try testdata with different amount of repetition.
+"""
+import sys
+
+from core.compression import BWTCompression, HuffmanCompression
+
+data_0 = b""
+data_1 = b"A"
+data_2 = b"AAAAAAAAAAAAAAAAAAAAAAAAAA"
+data_3 = b"AAA BBB AB  CDDDD CCAA CCAAAAAAAXRRPPLLL  OO"
+data_4 = b"AAA BBB AB  CDDDD CCAA CCAAAAAAAXRRPPLLL  OO" * 100
+data_5 = b"Python is a programming language that lets you work quickly and integrate systems more effectively."
+data_6 = b"Python is a programming language that lets you work quickly and integrate systems more effectively." * 16
+# Binary data with bytes outside of the ASCII range.
+data_7 = bytes(range(256)) * 4 + bytes(range(255, -1, -3)) * 8
+
+input_options = [data_0, data_1, data_2, data_3, data_4, data_5, data_6, data_7]
+
+# Text where the same words appear in changing context.
+data_8 = b" ".join(b"%d bananas and %d ananas" % (i % 97, i % 89) for i in range(5000))
+
+
+def encode_and_decode(input_data: bytes, block_size=1 << 20):
+    """Tests encoding and decoding and creates printout of essential data.
+
+    Args:
+        input_data (bytes): Data to be encoded.
+        block_size (int): Amount of bytes transformed together.
+    """
+
+    print("Input data size: ", sys.getsizeof(input_data), "bytes")
+    print("Input data type: ", type(input_data))
+
+    bwt_compression = BWTCompression(block_size=block_size)
+    compressed_data = bwt_compression.encode(uncompressed_data=input_data)
+
+    print("Compressed data size: ", sys.getsizeof(compressed_data), "bytes")
+    print("Compressed data type: ", type(compressed_data))
+
+    decoded_data = bwt_compression.decode(compressed_data=compressed_data)
+
+    print("Decompressed data size: ", sys.getsizeof(decoded_data), "bytes")
+    print("Decompressed data type: ", type(decoded_data))
+
+    print("Decompressed data = Input data:", decoded_data == input_data)
+
+    compression_rate = sys.getsizeof(input_data) / sys.getsizeof(compressed_data)
+    print(f"Compression rate: {compression_rate:.2f}")
+
+
+# Executes all testcases and names them for the output.
+n = 0
+for data in input_options:
+    print()
+    print(f'data_{n}')
+    n += 1
+    encode_and_decode(data)
+
+# Shows the transform of a short text.
+print()
+print("Burrows-Wheeler transform of data_5 with the position of the end marker:")
+print(BWTCompression.transform_block(block=data_5))
+
+# Shows difference between large and small blocks.
+print()
+print("Large blocks in comparison with small blocks.")
+print()
+print("Block size 1 MiB:")
+encode_and_decode(data_8)
+print()
+print("Block size 1 KiB:")
+encode_and_decode(data_8, block_size=1 << 10)
+print()
+print("Compressed data size with Huffman only: ", sys.getsizeof(HuffmanCompression().encode(data_8)), "bytes")
@@ -5,6 +5,7 @@ For simplicity only the main methods (encode and decode) of the algorithm are te
 The goal is to try testdata with different amount of repetition.
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from core.compression import HuffmanCompression
 
@@ -17,7 +18,10 @@ data_5 = b"Python is a programming language that lets you work quickly and integ
 data_6 = b"Python is a programming language that lets you work quickly and integrate systems more effectively." * 6
 data_7 = b"Python is a programming language that lets you work quickly and integrate systems more effectively." * 16
 
-input_options = [data_0, data_1, data_2, data_3, data_4, data_5, data_6, data_7]
+# Skewed occurrences of the bytes lead to codes longer than one lookup table of the decoder.
+data_8 = b"".join(bytes([i]) * (1 << i) for i in range(16))
+
+input_options = [data_0, data_1, data_2, data_3, data_4, data_5, data_6, data_7, data_8]
 
 # A custom codebook is an option for the encoding and decoding.
 # A-Z and space are represented by their corresponding decimal ASCII numbers.
@@ -29,17 +33,23 @@ custom_codebook = {65: '00000', 66: '00001', 67: '00010', 68: '00011', 69: '0010
                    89: '11000', 90: '11001', 32: '11010'}
 
 
-def encode_and_decode(input_data: bytes):
+def encode_and_decode(input_data: bytes, maximum_code_length=None, block_size=None, adaptive=False,
+                      sync_interval=None):
     """Tests encoding and decoding and creates printout of essential data.
 
     Args:
         input_data (bytes): Data to be encoded.
+        maximum_code_length (None/int): Upper limit for the length of the generated codes.
+        block_size (None/int): Amount of bytes encoded with one codebook.
+        adaptive (bool): Uses codes which are updated after every byte.
+        sync_interval (None/int): Amount of bytes between two sync points of the index for parallel decoding.
     """
 
     print("Input data size: ", sys.getsizeof(input_data), "bytes")
     print("Input data type: ", type(input_data))
 
-    huffman_compression = HuffmanCompression()
+    huffman_compression = HuffmanCompression(maximum_code_length=maximum_code_length, block_size=block_size,
+                                             adaptive=adaptive, sync_interval=sync_interval)
     compressed_data = huffman_compression.encode(uncompressed_data=input_data)
 
     print("Compressed data size: ", sys.getsizeof(compressed_data), "bytes")
@@ -73,7 +83,7 @@ def encode_and_decode_custom_codebook(input_data: bytes, codebook: dict):
     print("Compressed data size: ", sys.getsizeof(compressed_data), "bytes")
     print("Compressed data type: ", type(compressed_data))
 
-    decoded_data = huffman_compression.decode(compressed_data=compressed_data)
+    decoded_data = huffman_compression.decode(compressed_data=compressed_data, codebook=codebook)
 
     print("Decompressed data size: ", sys.getsizeof(decoded_data), "bytes")
     print("Decompressed data type: ", type(decoded_data))
@@ -101,3 +111,113 @@ encode_and_decode_custom_codebook(data_4, custom_codebook)
 print()
 print("Generated codebook:")
 encode_and_decode(data_4)
+
+# The same codebook is passed to the encoding and the decoding, also for data of few different bytes.
+print()
+print("Custom codebook passed to both the encoding and the decoding.")
+print()
+encode_and_decode_custom_codebook(b"ABCABC", {65: '0', 66: '10', 67: '11'})
+encode_and_decode_custom_codebook(b"AB CD", custom_codebook)
+
+# Older versions stored the data without header next to its codebook.
+print()
+print("Data without header, as stored by older versions:")
+legacy_codebook = {65: '0', 66: '10', 67: '11'}
+print("Decompressed data = Input data:",
+      HuffmanCompression.decode_legacy(compressed_data=bytes([6, 0b01011010, 0b11000000]),
+                                       codebook=legacy_codebook) == b"ABCABC")
+
+# Shows difference between limited and unlimited code length on data with codes up to 15 bits.
+print()
+print("Codes limited to 12 bits in comparison with unlimited codes.")
+print()
+print("Limited codes:")
+encode_and_decode(data_8, maximum_code_length=12)
+print()
+print("Unlimited codes:")
+encode_and_decode(data_8)
+
+# Shows difference between one codebook and a codebook for every block on data with changing content.
+print()
+print("Blocks with own codebooks in comparison with one codebook.")
+print()
+print("Blocks of 1000 bytes:")
+encode_and_decode(data_4 + data_7 + data_8, block_size=1000)
+print()
+print("One codebook:")
+encode_and_decode(data_4 + data_7 + data_8)
+
+# Shows the adaptive mode, which reads the data only once.
+print()
+print("Adaptive codes in comparison with codes created from the whole data.")
+print()
+print("Adaptive codes:")
+encode_and_decode(data_7, adaptive=True)
+print()
+print("Codes created from the whole data:")
+encode_and_decode(data_7)
+
+# Shows that the adaptive mode processes data in chunks as it streams in, e.g. from a pipe.
+print()
+print("Adaptive encoding and decoding in chunks of 10 bytes.")
+encoder = HuffmanCompression.create_adaptive_encoder()
+compressed_chunks = [encoder.feed(data_6[i:i + 10]) for i in range(0, len(data_6), 10)] + [encoder.flush()]
+decoder = HuffmanCompression.create_adaptive_decoder()
+decoded_chunks = [decoder.feed(chunk) for chunk in compressed_chunks] + [decoder.flush()]
+print("Decompressed data = Input data:", b"".join(decoded_chunks) == data_6)
+
+# Shows the size of the index of sync points, which allows decoding of the parts in parallel processes.
+print()
+print("Codes with sync points every 100 bytes in comparison with codes without index.")
+print()
+print("Codes with index:")
+encode_and_decode(data_7, sync_interval=100)
+print()
+print("Codes without index:")
+encode_and_decode(data_7)
+
+# Shows a codebook trained on samples, which is stored only by its ID with the data.
+print()
+print("Trained codebook in comparison with generated codebook on small data.")
+huffman_compression = HuffmanCompression()
+huffman_compression.add_codebook(codebook_id=1, codebook=huffman_compression.train_codebook(samples=[data_6, data_4]))
+trained_compressed_data = huffman_compression.encode(uncompressed_data=data_5, codebook_id=1)
+print("Compressed data size with trained codebook: ", sys.getsizeof(trained_compressed_data), "bytes")
+print("Compressed data size with generated codebook: ", sys.getsizeof(huffman_compression.encode(data_5)), "bytes")
+print("Decompressed data = Input data:", huffman_compression.decode(trained_compressed_data) == data_5)
+
+# Shows data of one and two different bytes, which is encoded without tree.
+print()
+print("Data of few different bytes encoded without tree.")
+print()
+print("Empty data:")
+encode_and_decode(b"")
+print()
+print("Single data point:")
+encode_and_decode(data_2 * 1000)
+print()
+print("Two data points:")
+encode_and_decode(b"AB BA " * 1000 + b"ABBA")
+
+# Shows that one instance can serve several threads at once, as every call keeps its own state.
+print()
+print("Encoding and decoding of all testcases in parallel threads with one instance.")
+huffman_compression = HuffmanCompression()
+
+
+def round_trip(input_data: bytes):
+    """Encodes and decodes the data with the shared instance.
+
+    Args:
+        input_data (bytes): Data to be encoded.
+
+    Returns:
+        matches (bool): Whether the decoded data is identical to the input data.
+    """
+
+    return huffman_compression.decode(huffman_compression.encode(input_data)) == input_data
+
+
+with ThreadPoolExecutor(max_workers=4) as executor:
+    results = list(executor.map(round_trip, input_options))
+print("Decompressed data = Input data:", results)
@@ -0,0 +1,71 @@
+"""Tests the LZSS compression with different input options.
+
+The methods are addressed directly without the use of data handler.
+For simplicity only the main methods (encode and decode) of the algorithm are tested here.
+The goal is to try testdata with different amount of repetition.
+"""
+import sys
+
+from core.compression import LZSSCompression
+
+data_0 = b""
+data_1 = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+data_2 = b"AAAAAAAAAAAAAAAAAAAAAAAAAA"
+data_3 = b"AAA BBB AB  CDDDD CCAA CCAAAAAAAXRRPPLLL  OO"
+data_4 = b"AAA BBB AB  CDDDD CCAA CCAAAAAAAXRRPPLLL  OO" * 100
+data_5 = b"Python is a programming language that lets you work quickly and integrate systems more effectively."
+data_6 = b"Python is a programming language that lets you work quickly and integrate systems more effectively." * 16
+# Binary data with bytes outside of the ASCII range.
+data_7 = bytes(range(256)) * 4 + bytes(range(255, -1, -3)) * 8
+
+input_options = [data_0, data_1, data_2, data_3, data_4, data_5, data_6, data_7]
+
+# Changing content, where matches are found only with a deeper search.
+data_8 = b"".join(bytes((i * 7 + j) % 94 + 32 for j in range(i % 50 + 1)) for i in range(20000))
+
+
+def encode_and_decode(input_data: bytes, search_depth=16):
+    """Tests encoding and decoding and creates printout of essential data.
+
+    Args:
+        input_data (bytes): Data to be encoded.
+        search_depth (int): Amount of previous positions checked for a match at each position.
+    """
+
+    print("Input data size: ", sys.getsizeof(input_data), "bytes")
+    print("Input data type: ", type(input_data))
+
+    lzss_compression = LZSSCompression(search_depth=search_depth)
+    compressed_data = lzss_compression.encode(uncompressed_data=input_data)
+
+    print("Compressed data size: ", sys.getsizeof(compressed_data), "bytes")
+    print("Compressed data type: ", type(compressed_data))
+
+    decoded_data = lzss_compression.decode(compressed_data=compressed_data)
+
+    print("Decompressed data size: ", sys.getsizeof(decoded_data), "bytes")
+    print("Decompressed data type: ", type(decoded_data))
+
+    print("Decompressed data = Input data:", decoded_data == input_data)
+
+    compression_rate = sys.getsizeof(input_data) / sys.getsizeof(compressed_data)
+    print(f"Compression rate: {compression_rate:.2f}")
+
+
+# Executes all testcases and names them for the output.
+n = 0
+for data in input_options:
+    print()
+    print(f'data_{n}')
+    n += 1
+    encode_and_decode(data)
+
+# Shows difference between a shallow and a deep search for matches.
+print()
+print("Deep search in comparison with shallow search.")
+print()
+print("Search depth 128:")
+encode_and_decode(data_8, search_depth=128)
+print()
+print("Search depth 1:")
+encode_and_decode(data_8, search_depth=1)
@@ -5,6 +5,7 @@ For simplicity only the main methods (encode and decode) of the algorithm are te
 The goal is to try testdata with different amount of repetition.
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from core.compression import LZWCompression
 
@@ -16,21 +17,28 @@ data_4 = b"AAA BBB AB  CDDDD CCAA CCAAAAAAAXRRPPLLL  OO" * 100
 data_5 = b"Python is a programming language that lets you work quickly and integrate systems more effectively."
 data_6 = b"Python is a programming language that lets you work quickly and integrate systems more effectively." * 6
 data_7 = b"Python is a programming language that lets you work quickly and integrate systems more effectively." * 16
+# Binary data with bytes outside of the ASCII range.
+data_8 = bytes(range(256)) * 4 + bytes(range(255, -1, -3)) * 8
 
-input_options = [data_0, data_1, data_2, data_3, data_4, data_5, data_6, data_7]
+input_options = [data_0, data_1, data_2, data_3, data_4, data_5, data_6, data_7, data_8]
 
+# Changing content fills the codebook with sequences which don't repeat later on.
+data_9 = b"".join(bytes((i * 7 + j) % 94 + 32 for j in range(i % 50 + 1)) for i in range(20000)) + data_7 * 100
 
-def encode_and_decode(input_data):
+
+def encode_and_decode(input_data, variable_width=False, reset_codebook=False):
     """Tests encoding and decoding and creates printout of essential data.
 
     Args:
         input_data (bytes): Data to be encoded.
+        variable_width (bool): Selects the bit-packed layout with growing code width.
+        reset_codebook (bool): Allows the reset of a full codebook when the compression ratio drops.
     """
 
     print("Input data size: ", sys.getsizeof(input_data), "bytes")
     print("Input data type: ", type(input_data))
 
-    lzw_compression = LZWCompression()
+    lzw_compression = LZWCompression(variable_width=variable_width, reset_codebook=reset_codebook)
     compressed_data = lzw_compression.encode(uncompressed_data=input_data)
 
     print("Compressed data size: ", sys.getsizeof(compressed_data), "bytes")
@@ -54,3 +62,80 @@ for data in input_options:
     print(f'data_{n}')
     n += 1
     encode_and_decode(data)
+
+# Shows difference between the fixed width and the variable width layout.
+print()
+print("Variable width layout in comparison with fixed width layout.")
+print()
+print("Variable width layout:")
+encode_and_decode(data_7, variable_width=True)
+print()
+print("Fixed width layout:")
+encode_and_decode(data_7)
+
+# Shows difference between using and not using the codebook reset.
+print()
+print("Codebook reset in comparison with a codebook which stays unchanged when full.")
+print()
+print("Codebook reset:")
+encode_and_decode(data_9, variable_width=True, reset_codebook=True)
+print()
+print("No codebook reset:")
+encode_and_decode(data_9, variable_width=True)
+
+# Shows that the encoder and decoder objects give the same result when the data arrives in chunks.
+print()
+print("Encoding and decoding in chunks of 1000 bytes.")
+lzw_compression = LZWCompression(variable_width=True, reset_codebook=True)
+encoder = lzw_compression.create_encoder()
+compressed_data = b''.join(encoder.feed(data_9[i:i + 1000]) for i in range(0, len(data_9), 1000)) + encoder.flush()
+print("Compressed data = Compressed data in one chunk:", compressed_data == lzw_compression.encode(data_9))
+decoder = lzw_compression.create_decoder()
+decoded_data = b''.join(decoder.feed(compressed_data[i:i + 1000]) for i in range(0, len(compressed_data), 1000))
+decoded_data += decoder.flush()
+print("Decompressed data = Input data:", decoded_data == data_9)
+
+# Shows the .Z format of compress(1). It is recognized by the decoder from its magic bytes.
+print()
+print("Encoding and decoding in the .Z format.")
+lzw_compression = LZWCompression(variable_width=True, reset_codebook=True, maximum_code_width=16, unix_compress=True)
+compressed_data = lzw_compression.encode(data_9)
+print("Magic bytes:", compressed_data[:2] == LZWCompression.UNIX_COMPRESS_MAGIC)
+decoded_data = lzw_compression.decode(compressed_data)
+print("Decompressed data = Input data:", decoded_data == data_9)
+
+# Shows that the maximum code width travels with the data of the variable width layout.
+print()
+print("Encoding with 16 bit codes and decoding with the default settings.")
+compressed_data = LZWCompression(variable_width=True, maximum_code_width=16).encode(data_9)
+print("Decompressed data = Input data:", LZWCompression().decode(compressed_data) == data_9)
+
+# The fixed width layout doesn't store the maximum code width, so it only supports the default one.
+try:
+    LZWCompression(maximum_code_width=16)
+    print("Fixed width layout with 16 bit codes rejected:", False)
+except ValueError:
+    print("Fixed width layout with 16 bit codes rejected:", True)
+
+# Shows that one instance can serve several threads at once, as every call keeps its own state.
+print()
+print("Encoding and decoding of all testcases in parallel threads with one instance.")
+lzw_compression = LZWCompression(variable_width=True, reset_codebook=True)
+
+
+def round_trip(input_data: bytes):
+    """Encodes and decodes the data with the shared instance.
+
+    Args:
+        input_data (bytes): Data to be encoded.
+
+    Returns:
+        matches (bool): Whether the decoded data is identical to the input data.
+    """
+
+    return lzw_compression.decode(lzw_compression.encode(input_data)) == input_data
+
+
+with ThreadPoolExecutor(max_workers=4) as executor:
+    results = list(executor.map(round_trip, input_options))
+print("Decompressed data = Input data:", results)
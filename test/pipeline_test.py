@@ -0,0 +1,68 @@
+"""Tests the pipelines of compression algorithms with different input options.
+
+The methods are addressed directly without the use of data handler.
+For simplicity only the main methods (encode and decode) of the pipeline are tested here.
+The goal is to try testdata with different amount of repetition on different chains of algorithms.
+"""
+import sys
+
+from core.compression import LZWCompression, HuffmanCompression, RANSCompression, LZSSCompression, BWTCompression, \
+    PipelineCompression
+
+data_0 = b""
+data_1 = b"AAAAAAAAAAAAAAAAAAAAAAAAAA"
+data_2 = b"AAA BBB AB  CDDDD CCAA CCAAAAAAAXRRPPLLL  OO"
+data_3 = b"AAA BBB AB  CDDDD CCAA CCAAAAAAAXRRPPLLL  OO" * 100
+data_4 = b"Python is a programming language that lets you work quickly and integrate systems more effectively." * 16
+data_5 = bytes(range(256)) * 4
+
+input_options = [data_0, data_1, data_2, data_3, data_4, data_5]
+
+pipelines = ["lzw+huf", "lzss+huf", "lzss+ans", "bwt+lzss"]
+
+stages = {"lzw": LZWCompression(variable_width=True, reset_codebook=True, maximum_code_width=16),
+          "huf": HuffmanCompression(maximum_code_length=15),
+          "ans": RANSCompression(),
+          "lzss": LZSSCompression(),
+          "bwt": BWTCompression()}
+
+
+def encode_and_decode(input_data: bytes, stage_names: str):
+    """Tests encoding and decoding and creates printout of essential data.
+
+    Args:
+        input_data (bytes): Data to be encoded.
+        stage_names (str): Names of the stages joined by the separator, e.g. "lzw+huf".
+    """
+
+    print("Input data size: ", sys.getsizeof(input_data), "bytes")
+
+    pipeline_compression = PipelineCompression(stages=stages, stage_names=stage_names)
+    compressed_data = pipeline_compression.encode(uncompressed_data=input_data)
+
+    print("Compressed data size: ", sys.getsizeof(compressed_data), "bytes")
+
+    # A pipeline without own stages reads them from the compressed data.
+    decoded_data = PipelineCompression(stages=stages).decode(compressed_data=compressed_data)
+
+    print("Decompressed data size: ", sys.getsizeof(decoded_data), "bytes")
+
+    print("Decompressed data = Input data:", decoded_data == input_data)
+
+    compression_rate = sys.getsizeof(input_data) / sys.getsizeof(compressed_data)
+    print(f"Compression rate: {compression_rate:.2f}")
+
+
+# Executes all testcases and names them for the output.
+for pipeline in pipelines:
+    n = 0
+    for data in input_options:
+        print()
+        print(f'{pipeline} data_{n}')
+        n += 1
+        encode_and_decode(data, stage_names=pipeline)
+
+# Shows the recorded stages of a pipeline.
+print()
+print("Stages recorded in front of the compressed data:")
+print(PipelineCompression(stages=stages).read_header(PipelineCompression(stages=stages).encode(data_3, "lzss+huf")))
@@ -0,0 +1,82 @@
+"""Tests the run-length encoding with different input options.
+
+The methods are addressed directly without the use of data handler.
+For simplicity only the main methods (encode and decode) of the algorithm are tested here.
+The goal is to try testdata with different amount of runs, alone and in front of other algorithms.
+"""
+import sys
+
+from core.compression import LZWCompression, HuffmanCompression, RLECompression, PipelineCompression
+
+data_0 = b""
+data_1 = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+data_2 = b"AAAAAAAAAAAAAAAAAAAAAAAAAA"
+data_3 = b"AAA BBB AB  CDDDD CCAA CCAAAAAAAXRRPPLLL  OO"
+data_4 = b"AAA BBB AB  CDDDD CCAA CCAAAAAAAXRRPPLLL  OO" * 100
+data_5 = b"Python is a programming language that lets you work quickly and integrate systems more effectively."
+# Binary data with bytes outside of the ASCII range.
+data_6 = bytes(range(256)) * 4 + bytes(range(255, -1, -3)) * 8
+
+input_options = [data_0, data_1, data_2, data_3, data_4, data_5, data_6]
+
+# Sparse data like a zero-padded disk image.
+data_7 = b"".join(bytes(4096 - i % 512) + data_5 for i in range(1000))
+
+
+def encode_and_decode(input_data: bytes, minimum_run_length=4):
+    """Tests encoding and decoding and creates printout of essential data.
+
+    Args:
+        input_data (bytes): Data to be encoded.
+        minimum_run_length (int): Shortest run replaced by its length and byte.
+    """
+
+    print("Input data size: ", sys.getsizeof(input_data), "bytes")
+    print("Input data type: ", type(input_data))
+
+    rle_compression = RLECompression(minimum_run_length=minimum_run_length)
+    compressed_data = rle_compression.encode(uncompressed_data=input_data)
+
+    print("Compressed data size: ", sys.getsizeof(compressed_data), "bytes")
+    print("Compressed data type: ", type(compressed_data))
+
+    decoded_data = rle_compression.decode(compressed_data=compressed_data)
+
+    print("Decompressed data size: ", sys.getsizeof(decoded_data), "bytes")
+    print("Decompressed data type: ", type(decoded_data))
+
+    print("Decompressed data = Input data:", decoded_data == input_data)
+
+    compression_rate = sys.getsizeof(input_data) / sys.getsizeof(compressed_data)
+    print(f"Compression rate: {compression_rate:.2f}")
+
+
+# Executes all testcases and names them for the output.
+n = 0
+for data in input_options:
+    print()
+    print(f'data_{n}')
+    n += 1
+    encode_and_decode(data)
+
+# Shows the difference between short and long minimum runs.
+print()
+print("Minimum run length 2 in comparison with 8 on data_4.")
+print()
+print("Minimum run length 2:")
+encode_and_decode(data_4, minimum_run_length=2)
+print()
+print("Minimum run length 8:")
+encode_and_decode(data_4, minimum_run_length=8)
+
+# Shows run-length encoding in front of Huffman and LZW on sparse data.
+stages = {"rle": RLECompression(),
+          "huf": HuffmanCompression(),
+          "lzw": LZWCompression(variable_width=True, reset_codebook=True, maximum_code_width=16)}
+pipeline_compression = PipelineCompression(stages=stages)
+print()
+print("Sparse data with and without run-length encoding in front.")
+for stage_names in ["huf", "rle+huf", "lzw", "rle+lzw"]:
+    compressed_data = pipeline_compression.encode(uncompressed_data=data_7, stage_names=stage_names)
+    print(f"Compressed data size with {stage_names}: ", sys.getsizeof(compressed_data), "bytes")
+    print("Decompressed data = Input data:", pipeline_compression.decode(compressed_data) == data_7)
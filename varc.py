@@ -3,13 +3,16 @@
 Use this file as entry point to the program.
 With the following commands you have access to the core functionalities.
 
-command   complete path or file name   algorithm   optional new name for the output file
---encode  filename.extension           lzw/huf     new_filename
---decode  filename.extension                       new_filename
+command   complete path or file name   algorithm                           optional new name for the output file
+--encode  filename.extension           lzw/huf/ans/lzss/bwt/Z/auto/store   new_filename
+--decode  filename.extension                                               new_filename
+
+Algorithms can be chained with "+", e.g. lzss+huf, also behind the run-length stage rle, e.g. rle+huf.
 
 Examples:
 -e text.txt lzw encoded_text
 --encode text.txt lzw encoded_text
+-e text.txt lzss+huf encoded_text
 -d encoded_text.lzw decoded_text
 --decode encoded_text.lzw decoded_text
 """